@@ -0,0 +1,79 @@
+"""
+Runs the benchmark suite and saves the results as JSON.
+
+Run with ``python -m benchmarks`` from the repository root. See ``--help`` for the options.
+The benchmarks don't need network access or a TIDAL account, TIDAL is replaced with a fake session.
+The regression checks with a budget are tests, see ``tests/``.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+from importlib import import_module
+from pathlib import Path
+
+from benchmarks.runner import Measurement, Options, Report
+
+SUITES = ('queue', 'shuffle', 'provider', 'models', 'render', 'startup')
+
+
+def _parse_args() -> argparse.Namespace:
+    defaults = Options()
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run the benchmark suite.')
+    parser.add_argument(
+        'suites', nargs='*', metavar='suite', help=f'the suites to run ({", ".join(SUITES)}), all by default'
+    )
+    parser.add_argument('-o', '--output', type=Path, help='save the results to this JSON file')
+    parser.add_argument('-c', '--compare', type=Path, help='compare the results with a previously saved JSON file')
+    parser.add_argument('-r', '--rounds', type=int, default=defaults.rounds, help='the number of measured rounds')
+    parser.add_argument(
+        '-l', '--latency', type=float, default=defaults.latency, help='the simulated TIDAL latency in seconds'
+    )
+    parser.add_argument(
+        '-s', '--sizes', type=int, nargs='+', default=defaults.sizes, help='the container sizes to measure'
+    )
+    args = parser.parse_args()
+
+    if unknown := set(args.suites) - set(SUITES):
+        parser.error(f'unknown suite(s): {", ".join(sorted(unknown))}')
+
+    args.suites = args.suites or list(SUITES)
+    return args
+
+
+def _compare(measurements: list[Measurement], baseline: Report) -> None:
+    previous = {measurement.key: measurement for measurement in baseline.measurements}
+
+    print(f'\nCompared with {baseline.commit or "unknown commit"} from {baseline.created:%Y-%m-%d %H:%M}:')  # noqa: T201
+    for measurement in measurements:
+        if (old := previous.get(measurement.key)) is not None:
+            ratio = measurement.median / old.median if old.median else float('inf')
+            print(f'{measurement.key:<60} {ratio:>11.2f}x')  # noqa: T201
+
+
+async def main() -> None:
+    """Run the benchmarks."""
+    args = _parse_args()
+    options = Options(rounds=args.rounds, latency=args.latency, sizes=args.sizes)
+
+    measurements: list[Measurement] = []
+    for suite in args.suites:
+        module = import_module(f'benchmarks.bench_{suite}')
+        measurements.extend(await module.run(options))
+
+    report = Report.create(options, measurements)
+
+    if args.output is not None:
+        args.output.write_text(report.model_dump_json(indent=2), encoding='utf-8')
+        print(f'\nSaved the results to "{args.output}"')  # noqa: T201
+
+    if args.compare is not None:
+        _compare(measurements, Report.model_validate_json(args.compare.read_text(encoding='utf-8')))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as config_dir:
+        # Plugins store their config in the config directory, which must not be the user's
+        os.environ['XDG_CONFIG_HOME'] = config_dir
+        asyncio.run(main())
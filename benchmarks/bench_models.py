@@ -0,0 +1,77 @@
+"""
+Benchmarks of building the models of large listings.
+
+Compares validating the values with the trusted fast path, and measures the time and memory
+``TidalProvider`` needs to build the result of a long playlist.
+"""
+
+from typing import Any
+
+from benchmarks.fake_tidal import FakeSession
+from benchmarks.runner import Measurement, Options, measure, retained_memory
+from music_player.core.music import Track
+from music_player.core.plugin_manager import PluginContext
+from music_player.core.utils import construct_trusted
+from music_player.plugin.coreplugin.providers.tidal import TidalProvider
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def _values(i: int) -> dict[str, Any]:
+    return {
+        'provider_id': 'bench',
+        'id': str(i),
+        'title': f'Track {i}',
+        'artist': 'Artist',
+        'artist_id': '0',
+        'album': 'Album',
+        'album_id': '0',
+        'cover_uri': f'https://resources.tidal.com/images/{i}/1280x1280.jpg',
+        'duration': 180,
+    }
+
+
+def _validated(size: int) -> list[Track]:
+    return [Track(**_values(i)) for i in range(size)]
+
+
+def _trusted(size: int) -> list[Track]:
+    return [construct_trusted(Track, _values(i)) for i in range(size)]
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    results = []
+
+    for size in SIZES:
+        for name, build in (('models.track.validated', _validated), ('models.track.trusted', _trusted)):
+            results.append(
+                await measure(
+                    name,
+                    lambda build=build, size=size: build(size),  # type: ignore[misc]
+                    rounds=options.rounds,
+                    memory=retained_memory(lambda build=build, size=size: build(size)),  # type: ignore[misc]
+                    size=size,
+                )
+            )
+
+        session = FakeSession(0, size)
+        provider = TidalProvider(PluginContext('bench.tidal'))
+        provider._tidal = session  # noqa: SLF001
+        tracks = session.tracks
+
+        def build_result(provider: TidalProvider = provider, tracks: list[Any] = tracks) -> object:
+            return provider._build_search_result(tracks=tracks)  # noqa: SLF001
+
+        results.append(
+            await measure(
+                'provider._build_search_result (tracks)',
+                build_result,
+                rounds=options.rounds,
+                memory=retained_memory(build_result),
+                size=size,
+            )
+        )
+        provider.close()
+
+    return results
@@ -0,0 +1,121 @@
+"""Benchmarks of ``TidalProvider`` against a fake TIDAL session."""
+
+from benchmarks.fake_tidal import FakeSession
+from benchmarks.runner import Measurement, Options, measure
+from music_player.core.music import Album, Artist, PlayableContainer, Playlist
+from music_player.core.plugin_manager import PluginContext
+from music_player.plugin.coreplugin.providers.tidal import TidalProvider
+
+# Search results are capped by TIDAL, so larger sizes only matter for containers
+_SEARCH_SIZE = 50
+
+
+def _provider(session: FakeSession) -> TidalProvider:
+    provider = TidalProvider(PluginContext('bench.tidal'))
+    provider._tidal = session  # noqa: SLF001
+
+    # Create the fake objects before measuring
+    _ = session.tracks, session.playlists
+    return provider
+
+
+async def _consume(provider: TidalProvider, container: PlayableContainer, batches: int | None) -> None:
+    """Consume the first ``batches`` batches of a streamed listing, or all if ``None``."""
+    iterator = provider.list_iter(container)
+    consumed = 0
+
+    try:
+        async for _ in iterator:
+            consumed += 1
+            if consumed == batches:
+                break
+    finally:
+        await iterator.aclose()  # type: ignore[attr-defined]
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    results = []
+
+    provider = _provider(FakeSession(options.latency, _SEARCH_SIZE))
+    results.append(
+        await measure(
+            'provider.search',
+            lambda: provider.search('query'),
+            setup=provider.invalidate_cache,
+            rounds=options.rounds,
+            latency=options.latency,
+            size=_SEARCH_SIZE,
+        )
+    )
+    results.append(
+        await measure(
+            'provider.search (cached)',
+            lambda: provider.search('query'),
+            rounds=options.rounds,
+            latency=options.latency,
+            size=_SEARCH_SIZE,
+        )
+    )
+    provider.close()
+
+    for size in options.sizes:
+        provider = _provider(FakeSession(options.latency, size))
+        containers = {
+            'artist': Artist(provider_id='tidal', id='0', name='Artist 0', cover_uri=None),
+            'album': Album(
+                provider_id='tidal',
+                id='0',
+                name='Album 0',
+                artist='Artist 0',
+                artist_id='0',
+                cover_uri=None,
+                year=2000,
+                duration=0,
+                number_of_tracks=size,
+            ),
+            'playlist': Playlist(
+                provider_id='tidal', id='0', name='Playlist 0', cover_uri=None, duration=0, number_of_tracks=size
+            ),
+        }
+
+        for kind, container in containers.items():
+            results.append(
+                await measure(
+                    f'provider.list ({kind})',
+                    lambda provider=provider, container=container: provider.list(container),  # type: ignore[misc]
+                    setup=provider.invalidate_cache,
+                    rounds=options.rounds,
+                    latency=options.latency,
+                    size=size,
+                )
+            )
+
+        for name, batches in (('first batch', 1), ('all batches', None)):
+            results.append(
+                await measure(
+                    f'provider.list_iter (playlist, {name})',
+                    lambda provider=provider, playlist=containers['playlist'], batches=batches: _consume(  # type: ignore[misc]
+                        provider, playlist, batches
+                    ),
+                    setup=provider.invalidate_cache,
+                    rounds=options.rounds,
+                    latency=options.latency,
+                    size=size,
+                )
+            )
+
+        session = FakeSession(0, size)
+        results.append(
+            await measure(
+                'provider._to_search_result',
+                lambda provider=provider, session=session: provider._to_search_result(  # type: ignore[misc] # noqa: SLF001
+                    artists=session.artists, albums=session.albums, playlists=session.playlists, tracks=session.tracks
+                ),
+                rounds=options.rounds,
+                size=size,
+            )
+        )
+        provider.close()
+
+    return results
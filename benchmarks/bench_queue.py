@@ -0,0 +1,140 @@
+"""
+Benchmarks of the queue operations of the in-memory player.
+
+Compares ``MemoryPlayer`` with a naive ``list[Playable]`` queue.
+"""
+
+import random
+from collections.abc import Callable
+
+from benchmarks.runner import Measurement, Options, measure
+from music_player.core.music import Playable, Track
+from music_player.core.plugin_manager import PluginContext
+from music_player.plugin.coreplugin.players.memory import MemoryPlayer
+
+QUEUE_SIZE = 100_000
+OPERATIONS = 1_000
+# Finding an item in a list is a linear scan, so the naive queue gets fewer operations to keep the run short
+NAIVE_OPERATIONS = 100
+
+
+def _track(i: int) -> Track:
+    return Track.model_construct(
+        provider_id='bench',
+        id=str(i),
+        title=f'Track {i}',
+        artist='Artist',
+        artist_id='0',
+        album=None,
+        album_id=None,
+        cover_uri=None,
+        duration=180,
+    )
+
+
+def _naive_index(queue: list[Playable], playable: Playable) -> int:
+    # Comparing by identity, as comparing pydantic models by value is far slower
+    return next(i for i, x in enumerate(queue) if x is playable)
+
+
+class _Queues:
+    """Fresh queues for every round, as some operations can't be repeated on the same queue."""
+
+    tracks: list[Playable]
+    player: MemoryPlayer
+    naive: list[Playable]
+
+    def __init__(self, tracks: list[Playable]) -> None:
+        self.tracks = tracks
+        self.player = MemoryPlayer(PluginContext('bench.memory'))
+        self.naive = []
+
+    def reset(self) -> None:
+        self.player.close()
+        self.player = MemoryPlayer(PluginContext('bench.memory'))
+        self.player.add(self.tracks)
+        self.naive = list(self.tracks)
+
+
+type _Benchmark = tuple[str, Callable[[], None], int]
+
+
+def _player_benchmarks(
+    queues: _Queues, targets: list[Playable], positions: list[int], new_tracks: list[Playable]
+) -> list[_Benchmark]:
+    def add() -> None:
+        queues.player.clear()
+        queues.player.add(queues.tracks)
+
+    def move() -> None:
+        for track, position in zip(targets, positions, strict=True):
+            queues.player.move(track, position)
+
+    def index() -> None:
+        for position in positions:
+            queues.player.index = position
+            _ = queues.player.index
+
+    def add_after_current() -> None:
+        for track in new_tracks:
+            queues.player.add_after_current(track)
+
+    def remove() -> None:
+        for track in targets:
+            queues.player.remove(track)
+
+    return [
+        ('queue.memory.add (bulk)', add, QUEUE_SIZE),
+        ('queue.memory.move', move, OPERATIONS),
+        ('queue.memory.index', index, OPERATIONS),
+        ('queue.memory.add_after_current', add_after_current, OPERATIONS),
+        ('queue.memory.remove', remove, OPERATIONS),
+    ]
+
+
+def _naive_benchmarks(
+    queues: _Queues, targets: list[Playable], positions: list[int], new_tracks: list[Playable]
+) -> list[_Benchmark]:
+    targets = targets[:NAIVE_OPERATIONS]
+
+    def move() -> None:
+        for track, position in zip(targets, positions, strict=False):
+            del queues.naive[_naive_index(queues.naive, track)]
+            queues.naive.insert(position, track)
+
+    def insert() -> None:
+        for track, position in zip(new_tracks, positions, strict=True):
+            queues.naive.insert(position + 1, track)
+
+    def remove() -> None:
+        for track in targets:
+            del queues.naive[_naive_index(queues.naive, track)]
+
+    return [
+        ('queue.list.move', move, NAIVE_OPERATIONS),
+        ('queue.list.insert', insert, OPERATIONS),
+        ('queue.list.remove', remove, NAIVE_OPERATIONS),
+    ]
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    rng = random.Random(0)  # noqa: S311
+    tracks: list[Playable] = [_track(i) for i in range(QUEUE_SIZE)]
+    targets = [tracks[i] for i in rng.sample(range(QUEUE_SIZE), OPERATIONS)]
+    positions = [rng.randrange(QUEUE_SIZE - OPERATIONS) for _ in range(OPERATIONS)]
+    new_tracks: list[Playable] = [_track(QUEUE_SIZE + i) for i in range(OPERATIONS)]
+
+    queues = _Queues(tracks)
+    benchmarks = [
+        *_player_benchmarks(queues, targets, positions, new_tracks),
+        *_naive_benchmarks(queues, targets, positions, new_tracks),
+    ]
+
+    results = [
+        await measure(name, func, setup=queues.reset, rounds=options.rounds, size=QUEUE_SIZE, operations=operations)
+        for name, func, operations in benchmarks
+    ]
+
+    queues.player.close()
+    return results
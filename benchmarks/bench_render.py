@@ -0,0 +1,84 @@
+"""Benchmarks of rendering search results in the REPL."""
+
+import contextlib
+import io
+import logging
+
+from benchmarks.runner import Measurement, Options, measure
+from music_player.core.music import Album, Artist, Playlist, SearchResult, Track
+
+SECTIONS = ('artists', 'albums', 'playlists', 'tracks')
+
+
+def _search_result(size: int) -> SearchResult:
+    # Without cover URIs, no covers are downloaded, so only the rendering is measured
+    return SearchResult(
+        artists=[Artist(provider_id='bench', id=str(i), name=f'Artist {i}', cover_uri=None) for i in range(size)],
+        albums=[
+            Album(
+                provider_id='bench',
+                id=str(i),
+                name=f'Album {i}',
+                artist=f'Artist {i}',
+                artist_id=str(i),
+                cover_uri=None,
+                year=2000,
+                duration=3600,
+                number_of_tracks=20,
+            )
+            for i in range(size)
+        ],
+        playlists=[
+            Playlist(
+                provider_id='bench',
+                id=str(i),
+                name=f'Playlist {i}',
+                cover_uri=None,
+                duration=3600,
+                number_of_tracks=20,
+            )
+            for i in range(size)
+        ],
+        tracks=[
+            Track(
+                provider_id='bench',
+                id=str(i),
+                title=f'Track {i}',
+                artist=f'Artist {i}',
+                artist_id=str(i),
+                album=f'Album {i}',
+                album_id=str(i),
+                cover_uri=None,
+                duration=180,
+            )
+            for i in range(size)
+        ],
+    )
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    from music_player.core.main import _render_rows, _Repl, _ResultView  # noqa: PLC0415
+
+    # The main module logs to stdout, which would be measured with the rendering
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    repl = _Repl()
+
+    for size in options.sizes:
+        search_result = _search_result(size)
+
+        async def render_view(search_result: SearchResult = search_result) -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                await _ResultView(repl).add(search_result)
+
+        async def render_all(search_result: SearchResult = search_result, size: int = size) -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                await _render_rows(repl, search_result, {section: range(size) for section in SECTIONS})
+
+        results.append(await measure('main._ResultView.add', render_view, rounds=options.rounds, size=size))
+        results.append(await measure('main._render_rows (all rows)', render_all, rounds=options.rounds, size=size))
+
+    repl.close()
+    return results
@@ -0,0 +1,92 @@
+"""
+Benchmarks of shuffling the queue of the in-memory player.
+
+Compares the lazily generated order of ``MemoryPlayer`` with shuffling a copy of a ``list[Playable]`` queue.
+"""
+
+import random
+
+from benchmarks.runner import Measurement, Options, measure
+from music_player.core.music import Playable, RepeatMode, ShuffleMode, Track
+from music_player.core.plugin_manager import PluginContext
+from music_player.plugin.coreplugin.players.memory import MemoryPlayer
+
+QUEUE_SIZE = 1_000_000
+TOGGLES = 1_000
+NEXTS = 10_000
+# Shuffling a copy of the queue takes a while, so the naive queue is toggled fewer times
+NAIVE_TOGGLES = 3
+# The smart mode avoids the same artist twice in a row, so the tracks are spread over some artists
+ARTISTS = 10_000
+
+
+def _track(i: int) -> Track:
+    return Track.model_construct(
+        provider_id='bench',
+        id=str(i),
+        title=f'Track {i}',
+        artist=f'Artist {i % ARTISTS}',
+        artist_id=str(i % ARTISTS),
+        album=None,
+        album_id=None,
+        cover_uri=None,
+        duration=180,
+    )
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    tracks: list[Playable] = [_track(i) for i in range(QUEUE_SIZE)]
+    player = MemoryPlayer(PluginContext('bench.memory'))
+    player.add(tracks)
+    player.repeat = RepeatMode.ALL
+    player.index = QUEUE_SIZE // 2
+
+    def toggle() -> None:
+        for _ in range(TOGGLES):
+            player.shuffle = True
+            player.shuffle = False
+
+    def shuffled_next() -> None:
+        for _ in range(NEXTS):
+            player.next()
+
+    def enable_shuffle() -> None:
+        player.shuffle = False
+        player.shuffle = True
+
+    rng = random.Random(0)  # noqa: S311
+    current = tracks[QUEUE_SIZE // 2]
+
+    def naive_toggle() -> None:
+        for _ in range(NAIVE_TOGGLES):
+            shuffled = list(tracks)
+            rng.shuffle(shuffled)
+            # Turning shuffle off has to find the current item in the original order
+            _ = next(i for i, x in enumerate(tracks) if x is current)
+
+    results = [
+        await measure('shuffle.memory.toggle', toggle, rounds=options.rounds, size=QUEUE_SIZE, operations=TOGGLES)
+    ]
+
+    for mode in ShuffleMode:
+        player.shuffle_mode = mode
+        results.append(
+            await measure(
+                f'shuffle.memory.next ({mode})',
+                shuffled_next,
+                setup=enable_shuffle,
+                rounds=options.rounds,
+                size=QUEUE_SIZE,
+                operations=NEXTS,
+            )
+        )
+
+    results.append(
+        await measure(
+            'shuffle.list.toggle', naive_toggle, rounds=options.rounds, size=QUEUE_SIZE, operations=NAIVE_TOGGLES
+        )
+    )
+
+    player.close()
+    return results
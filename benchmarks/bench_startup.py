@@ -0,0 +1,57 @@
+"""
+Benchmarks of the application startup.
+
+Every round runs in a new interpreter, so all modules are imported from scratch.
+The budgets for the time to the first prompt and the lazily imported modules are checked by ``tests/test_startup.py``.
+"""
+
+import re
+import subprocess
+import sys
+from collections.abc import Mapping
+from time import perf_counter
+
+from benchmarks.runner import Measurement, Options, measure, summarize
+
+# Everything ``core.main`` does before showing the first prompt, the login runs in the background
+_TIME_TO_PROMPT = """
+import music_player.core.main
+from music_player.core.plugin_manager import plugin_manager
+plugin_manager.load_plugins()
+"""
+
+_IMPORT_TIME = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$', re.MULTILINE)
+
+
+def _run(code: str, *args: str, env: Mapping[str, str] | None = None) -> str:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args, '-c', code], check=True, capture_output=True, text=True, env=env
+    ).stderr
+
+
+def time_to_prompt(env: Mapping[str, str] | None = None) -> float:
+    """
+    Measure the time from starting the interpreter to the first prompt in seconds.
+
+    :param env: The environment of the interpreter, e.g., to use another config directory.
+    """
+    start = perf_counter()
+    _run(_TIME_TO_PROMPT, env=env)
+    return perf_counter() - start
+
+
+def import_times() -> dict[str, float]:
+    """Import ``core.main`` with ``-X importtime`` and get the cumulative import time of every module in seconds."""
+    report = _run('import music_player.core.main', '-X', 'importtime')
+    return {module: int(cumulative) / 1e6 for cumulative, module in _IMPORT_TIME.findall(report)}
+
+
+async def run(options: Options) -> list[Measurement]:
+    """Run the benchmarks."""
+    import_times()  # Warm up the file system cache
+
+    return [
+        await measure('startup.interpreter', lambda: _run('pass'), rounds=options.rounds),
+        await measure('startup.time_to_prompt', time_to_prompt, rounds=options.rounds),
+        summarize('startup.import_main', [import_times()['music_player.core.main'] for _ in range(options.rounds)]),
+    ]
@@ -0,0 +1,188 @@
+"""
+A deterministic stand-in for ``tidalapi.Session`` that works without a TIDAL account or network access.
+
+The fake objects subclass the ``tidalapi`` models, so ``TidalProvider`` treats them like real ones.
+Every request sleeps for a configurable latency to simulate the round trip to the TIDAL API.
+"""
+
+import time
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+import tidalapi
+
+_IMAGE_URL = 'https://resources.tidal.com/images/{id}/{size}x{size}.jpg'
+
+
+def _page[T](items: list[T], limit: int | None, offset: int) -> list[T]:
+    return items[offset : offset + limit if limit is not None else None]
+
+
+class FakeSession:
+    """
+    A fake ``tidalapi.Session``.
+
+    Containers (artists, albums and playlists) have ``size`` items each, search results have ``size`` items per section.
+    The fake objects are created once, so creating them is not part of the measured time.
+    """
+
+    latency: float
+    size: int
+    requests: int
+
+    def __init__(self, latency: float = 0.0, size: int = 50) -> None:
+        """
+        Initialize the session.
+
+        :param latency: The time in seconds every request takes.
+        :param size: The number of items in every container and search result section.
+        """
+        self.latency = latency
+        self.size = size
+        self.requests = 0
+
+    @cached_property
+    def artists(self) -> list['FakeArtist']:
+        """All artists in the fake library."""
+        return [FakeArtist(self, i) for i in range(self.size)]
+
+    @cached_property
+    def albums(self) -> list['FakeAlbum']:
+        """All albums in the fake library."""
+        return [FakeAlbum(self, i, artist) for i, artist in enumerate(self.artists)]
+
+    @cached_property
+    def playlists(self) -> list['FakePlaylist']:
+        """All playlists in the fake library."""
+        return [FakePlaylist(self, i) for i in range(self.size)]
+
+    @cached_property
+    def tracks(self) -> list['FakeTrack']:
+        """All tracks in the fake library."""
+        return [FakeTrack(self, i, album) for i, album in enumerate(self.albums)]
+
+    def request(self) -> None:
+        """Simulate a request to the TIDAL API."""
+        self.requests += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def load_oauth_session(self, *_: Any, **__: Any) -> bool:  # noqa: ANN401
+        """Pretend to restore a session."""
+        self.request()
+        return True
+
+    def check_login(self) -> bool:
+        """Pretend to check the session."""
+        self.request()
+        return True
+
+    def search(self, query: str, models: Any = None, limit: int = 50, offset: int = 0) -> dict[str, Any]:  # noqa: ANN401, ARG002
+        """Search the fake library."""
+        self.request()
+
+        return {
+            'artists': _page(self.artists, limit, offset),
+            'albums': _page(self.albums, limit, offset),
+            'playlists': _page(self.playlists, limit, offset),
+            'tracks': _page(self.tracks, limit, offset),
+            'videos': [],
+            'top_hit': None,
+        }
+
+    def artist(self, artist_id: str) -> 'FakeArtist':
+        """Get an artist."""
+        self.request()
+        return self.artists[int(artist_id)]
+
+    def album(self, album_id: str) -> 'FakeAlbum':
+        """Get an album."""
+        self.request()
+        return self.albums[int(album_id)]
+
+    def playlist(self, playlist_id: str) -> 'FakePlaylist':
+        """Get a playlist."""
+        self.request()
+        return self.playlists[int(playlist_id)]
+
+    def track(self, track_id: str) -> 'FakeTrack':
+        """Get a track."""
+        self.request()
+        return self.tracks[int(track_id)]
+
+
+class FakeArtist(tidalapi.Artist):
+    """A fake artist."""
+
+    def __init__(self, session: FakeSession, artist_id: int) -> None:  # noqa: D107
+        self._session = session
+        self.id = artist_id
+        self.name = f'Artist {artist_id}'
+
+    def image(self, dimensions: int = 320) -> str:  # noqa: D102
+        return _IMAGE_URL.format(id=f'artist-{self.id}', size=dimensions)
+
+    def get_albums(self, limit: int | None = None, offset: int = 0) -> list[tidalapi.Album]:  # noqa: D102
+        self._session.request()
+        return _page(self._session.albums, limit, offset)
+
+    def get_ep_singles(self, limit: int | None = None, offset: int = 0) -> list[tidalapi.Album]:  # noqa: D102
+        return self.get_albums(limit, offset)
+
+    def get_other(self, limit: int | None = None, offset: int = 0) -> list[tidalapi.Album]:  # noqa: D102
+        return self.get_albums(limit, offset)
+
+    def get_top_tracks(self, limit: int | None = None, offset: int = 0) -> list[tidalapi.Track]:  # noqa: D102
+        self._session.request()
+        return _page(self._session.tracks, limit, offset)
+
+
+class FakeAlbum(tidalapi.Album):
+    """A fake album."""
+
+    def __init__(self, session: FakeSession, album_id: int, artist: FakeArtist) -> None:  # noqa: D107
+        self._session = session
+        self.id = album_id
+        self.name = f'Album {album_id}'
+        self.artist = artist
+        self.release_date = datetime(2000 + album_id % 25, 1, 1)  # noqa: DTZ001
+        self.tidal_release_date = None
+        self.duration = session.size * 180
+        self.num_tracks = session.size
+
+    def image(self, dimensions: int | str = 320, default: str = '') -> str:  # noqa: ARG002, D102
+        return _IMAGE_URL.format(id=f'album-{self.id}', size=dimensions)
+
+    def tracks(self, limit: int | None = None, offset: int = 0, sparse_album: bool = False) -> list[tidalapi.Track]:  # noqa: ARG002, D102, FBT001, FBT002
+        self._session.request()
+        return _page(self._session.tracks, limit, offset)
+
+
+class FakePlaylist(tidalapi.Playlist):
+    """A fake playlist."""
+
+    def __init__(self, session: FakeSession, playlist_id: int) -> None:  # noqa: D107
+        self._session = session
+        self.id = str(playlist_id)
+        self.name = f'Playlist {playlist_id}'
+        self.duration = session.size * 180
+        self.num_tracks = session.size
+
+    def image(self, dimensions: int = 480, wide_fallback: bool = True) -> str:  # noqa: ARG002, D102, FBT001, FBT002
+        return _IMAGE_URL.format(id=f'playlist-{self.id}', size=dimensions)
+
+    def tracks(self, limit: int | None = None, offset: int = 0, *_: Any, **__: Any) -> list[tidalapi.Track]:  # noqa: ANN401, D102
+        self._session.request()
+        return _page(self._session.tracks, limit, offset)
+
+
+class FakeTrack(tidalapi.Track):
+    """A fake track."""
+
+    def __init__(self, session: FakeSession, track_id: int, album: FakeAlbum) -> None:  # noqa: ARG002, D107
+        self.id = track_id
+        self.name = f'Track {track_id}'
+        self.album = album
+        self.artist = album.artist
+        self.duration = 180
@@ -0,0 +1,196 @@
+"""Measurement helpers and the result format of the benchmark suite."""
+
+import gc
+import inspect
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+from pydantic import BaseModel
+
+type Param = int | float | str
+
+
+class Options(BaseModel):
+    """
+    Options shared by all benchmarks.
+
+    :var rounds: The number of measured rounds per benchmark.
+    :var latency: The simulated latency of a TIDAL API request in seconds.
+    :var sizes: The container sizes to measure.
+    """
+
+    rounds: int = 5
+    latency: float = 0.02
+    sizes: list[int] = [10, 100, 1_000, 10_000]
+
+
+class Measurement(BaseModel):
+    """
+    The timings of one benchmark.
+
+    :var name: The name of the benchmark.
+    :var params: The parameters the benchmark ran with.
+    :var rounds: The number of measured rounds.
+    :var min: The fastest round in seconds.
+    :var median: The median round in seconds.
+    :var mean: The mean round in seconds.
+    :var max: The slowest round in seconds.
+    :var memory: The memory in bytes that the result of one round keeps alive, if it was measured.
+    """
+
+    name: str
+    params: dict[str, Param]
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    max: float
+    memory: int | None = None
+
+    @property
+    def key(self) -> str:
+        """A name that identifies the benchmark and its parameters, to compare it between reports."""
+        params = ','.join(f'{k}={v}' for k, v in sorted(self.params.items()))
+        return f'{self.name}[{params}]' if params else self.name
+
+
+class Report(BaseModel):
+    """
+    The results of a benchmark run.
+
+    :var created: When the benchmarks were run.
+    :var commit: The git commit that was measured, if known.
+    :var python: The Python version.
+    :var platform: The platform the benchmarks ran on.
+    :var options: The options of the run.
+    :var measurements: The measurements.
+    """
+
+    created: datetime
+    commit: str | None
+    python: str
+    platform: str
+    options: Options
+    measurements: list[Measurement]
+
+    @classmethod
+    def create(cls, options: Options, measurements: list[Measurement]) -> 'Report':
+        """Create a report for the current environment."""
+        return cls(
+            created=datetime.now(UTC),
+            commit=_git_commit(),
+            python=platform.python_version(),
+            platform=platform.platform(),
+            options=options,
+            measurements=measurements,
+        )
+
+
+async def measure(  # noqa: PLR0913
+    name: str,
+    func: Callable[[], Awaitable[object] | object],
+    *,
+    rounds: int,
+    setup: Callable[[], object] | None = None,
+    warmup: int = 1,
+    memory: int | None = None,
+    **params: Param,
+) -> Measurement:
+    """
+    Measure a function or coroutine function.
+
+    :param name: The name of the benchmark.
+    :param func: The code to measure.
+    :param rounds: The number of measured rounds.
+    :param setup: Code to run before every round, which is not measured.
+    :param warmup: The number of rounds to run before measuring.
+    :param memory: The memory in bytes that the result of one round keeps alive, see :func:`retained_memory`.
+    :param params: The parameters the benchmark runs with.
+    """
+    timings: list[float] = []
+
+    for i in range(warmup + rounds):
+        if setup is not None:
+            setup()
+
+        start = perf_counter()
+        result = func()
+        if inspect.isawaitable(result):
+            await result
+        elapsed = perf_counter() - start
+
+        if i >= warmup:
+            timings.append(elapsed)
+
+    return summarize(name, timings, memory=memory, **params)
+
+
+def retained_memory(func: Callable[[], object]) -> int:
+    """
+    Measure the memory that the result of a function keeps alive.
+
+    The allocations are traced with ``tracemalloc``, which is exact for the Python objects the result consists of.
+    The process RSS is not used, as the allocator keeps freed memory and makes it unreliable for a single result.
+
+    :param func: The function to measure.
+    :return: The memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = func()
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return memory
+
+
+def summarize(name: str, timings: list[float], *, memory: int | None = None, **params: Param) -> Measurement:
+    """
+    Create a measurement from timings that were taken by the benchmark itself.
+
+    :param name: The name of the benchmark.
+    :param timings: The timings of the rounds in seconds.
+    :param memory: The memory in bytes that the result of one round keeps alive.
+    :param params: The parameters the benchmark ran with.
+    """
+    measurement = Measurement(
+        name=name,
+        params=params,
+        rounds=len(timings),
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        max=max(timings),
+        memory=memory,
+    )
+
+    status = f'{measurement.memory / 1e6:.1f} MB' if measurement.memory is not None else ''
+
+    print(f'{measurement.key:<60} {measurement.median * 1000:>12.3f} ms   {status}'.rstrip())  # noqa: T201
+    return measurement
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return result.stdout.strip()
@@ -1,30 +1,56 @@
 import asyncio
+import contextlib
+import functools
+import itertools
 import logging
+import os
+import queue
+import signal
 import sys
-import urllib.request
-from collections.abc import Callable, Coroutine
-from typing import Any
-
-from rich import print  # noqa: A004
-from rich.table import Table
-from textual_image.renderable import Image as CliImage
+import threading
+from collections.abc import Callable, Coroutine, Iterator
+from typing import TYPE_CHECKING, Any
 
 from music_player.core.constants import CONFIG_DIR
-from music_player.core.music import ProviderPlugin, SearchResult
+from music_player.core.music import (
+    Album,
+    CatalogIndex,
+    FederatedSearch,
+    LoginOrchestrator,
+    LoginStatus,
+    Playable,
+    PlayerPlugin,
+    Playlist,
+    Provider,
+    ProviderLogin,
+    ProviderPlugin,
+    SearchResult,
+    SessionStore,
+    Track,
+    UriPrefetcher,
+)
 from music_player.core.plugin_manager import plugin_manager
+from music_player.core.utils import CoverCache, ThumbnailCache
 
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.DEBUG)
+if TYPE_CHECKING:
+    from PIL.Image import Image
+    from rich.console import RenderableType
 
-handler = logging.StreamHandler(sys.stdout)
-formatter = logging.Formatter('[%(asctime)s: %(levelname)s | %(name)s] %(message)s', '%H:%M:%S')
-handler.setFormatter(formatter)
+# Rendering libraries are imported on first use, so they don't delay the first prompt.
+# Provider libraries are imported by the plugin manager when a plugin is first used.
 
-root_logger.addHandler(handler)
+LOG_LEVEL_ENV = 'MUSIC_PLAYER_LOG_LEVEL'
+TIDAL_PLUGIN_ID = 'ing.ranft.bennet.tidal'
+MEMORY_PLAYER_PLUGIN_ID = 'ing.ranft.bennet.memory'
+# The number of rows per section that are rendered at once
+VIEWPORT_ROWS = 10
+# The height of the cover thumbnails in terminal rows, and their size in pixels, which is enough for HiDPI terminals
+THUMBNAIL_ROWS = 4
+THUMBNAIL_SIZE = 160
 
 logger = logging.getLogger('music_player.core.main')
 
-type Command = Callable[[str | None], Coroutine[Any, Any, None]]
+type Command = Callable[[_Repl, str | None], Coroutine[Any, Any, None]]
 commands: dict[str, Command] = {}
 
 
@@ -34,137 +60,588 @@ def command(cmd_func: Command) -> Command:
     return cmd_func
 
 
-search_result: SearchResult | None = None
-
-
-def _render_search_result(_search_result: SearchResult) -> None:
-    table = Table('ID', 'Image', 'Name', title='Artists')
-    for i, artist in enumerate(_search_result.artists):
-        img = (
-            CliImage(urllib.request.urlretrieve(artist.cover_uri)[0], width='auto', height=4)
-            if artist.cover_uri
-            else None
-        )
-        table.add_row(str(i), img, artist.name)
-    print(table)
-
-    table = Table('ID', 'Image', 'Name', 'Year', 'Duration', 'Number of Tracks', title='Albums')
-    for i, album in enumerate(_search_result.albums):
-        img = (
-            CliImage(urllib.request.urlretrieve(album.cover_uri)[0], width='auto', height=4)
-            if album.cover_uri
-            else None
-        )
-        table.add_row(
-            str(i),
-            img,
-            album.name,
-            str(album.year),
-            f'{album.duration // 60}:{album.duration % 60:d}',
-            str(album.number_of_tracks),
-        )
-    print(table)
-
-    table = Table('ID', 'Image', 'Name', 'Duration', 'Number of Tracks', title='Playlists')
-    for i, playlist in enumerate(_search_result.playlists):
-        img = (
-            CliImage(urllib.request.urlretrieve(playlist.cover_uri)[0], width='auto', height=4)
-            if playlist.cover_uri
-            else None
-        )
-        table.add_row(
-            str(i),
-            img,
-            playlist.name,
-            f'{playlist.duration // 60}:{playlist.duration % 60:d}',
-            str(playlist.number_of_tracks),
-        )
-    print(table)
-
-    table = Table('ID', 'Image', 'Name', title='Tracks')
-    for i, track in enumerate(_search_result.tracks):
-        img = (
-            CliImage(urllib.request.urlretrieve(track.cover_uri)[0], width='auto', height=4)
-            if track.cover_uri
-            else None
-        )
-        table.add_row(str(i), img, track.title)
-    print(table)
+# Serializes the output of commands and log records, so tables from concurrent jobs don't interleave
+_output_lock = threading.RLock()
+
+
+def print(*objects: Any) -> None:  # noqa: A001, ANN401
+    """Print with ``rich``."""
+    from rich import print as rich_print  # noqa: PLC0415
+
+    with _output_lock:
+        rich_print(*objects)
+
+
+def _setup_logging() -> None:
+    """Log to stdout at the level from the ``MUSIC_PLAYER_LOG_LEVEL`` environment variable, ``INFO`` by default."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('[%(asctime)s: %(levelname)s | %(name)s] %(message)s', '%H:%M:%S'))
+    # Share the lock with ``print``, so log records from worker threads are not written in the middle of a table
+    handler.lock = _output_lock
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(os.environ.get(LOG_LEVEL_ENV, 'INFO').upper())
+    root_logger.addHandler(handler)
+
+
+class _Repl:
+    """
+    The state of the REPL, which is passed to every command.
+
+    The caches are created when a command first uses them, so closing the REPL only closes the ones that were used.
+    """
+
+    search_result: SearchResult | None
+    result_view: '_ResultView | None'
+    login_orchestrator: LoginOrchestrator | None
+    uri_prefetcher: UriPrefetcher | None
+    # The providers that are logged in, by their ID, filled as the logins finish
+    logged_in_providers: dict[str, Provider]
+    command_task: asyncio.Task[None] | None
+    running_jobs: dict[int, asyncio.Task[None]]
+    job_ids: Iterator[int]
+    _catalog: CatalogIndex | None
+    _covers: CoverCache | None
+    _thumbnails: ThumbnailCache | None
+
+    def __init__(self) -> None:
+        self.search_result = None
+        self.result_view = None
+        self.login_orchestrator = None
+        self.uri_prefetcher = None
+        self.logged_in_providers = {}
+        self.command_task = None
+        self.running_jobs = {}
+        self.job_ids = itertools.count(1)
+        self._catalog = None
+        self._covers = None
+        self._thumbnails = None
+
+    @property
+    def catalog(self) -> CatalogIndex:
+        """The local catalog of everything that was searched or listed."""
+        if self._catalog is None:
+            self._catalog = CatalogIndex(CONFIG_DIR / 'cache' / 'catalog.db')
+        return self._catalog
+
+    @property
+    def covers(self) -> CoverCache:
+        """The cache of the downloaded cover images."""
+        if self._covers is None:
+            self._covers = CoverCache(CONFIG_DIR / 'cache' / 'covers')
+        return self._covers
+
+    @property
+    def thumbnails(self) -> ThumbnailCache:
+        """The thumbnails of the cover images."""
+        if self._thumbnails is None:
+            self._thumbnails = ThumbnailCache(self.covers)
+        return self._thumbnails
+
+    def close(self) -> None:
+        """Stop the logins and the prefetching, and close the caches that were created."""
+        if self.login_orchestrator is not None:
+            self.login_orchestrator.cancel()
+        if self.uri_prefetcher is not None:
+            self.uri_prefetcher.close()
+        if self._catalog is not None:
+            self._catalog.close()
+        if self._thumbnails is not None:
+            self._thumbnails.close()
+
+
+def _cover(thumbnails: dict[str, 'Image | None'], cover_uri: str | None) -> 'RenderableType | None':
+    from textual_image.renderable import Image as CliImage  # noqa: PLC0415
+
+    thumbnail = thumbnails.get(cover_uri) if cover_uri else None
+    return CliImage(thumbnail, width='auto', height=THUMBNAIL_ROWS) if thumbnail else None
+
+
+async def _providers(repl: _Repl) -> dict[str, Provider]:
+    """Get the usable providers by their ID, waiting for logins that don't need the user."""
+    providers = {}
+    login_orchestrator = repl.login_orchestrator
+
+    for plugin in plugin_manager.get_all(ProviderPlugin):
+        if login_orchestrator is not None and not await login_orchestrator.wait(plugin.id, for_user=False):
+            login = login_orchestrator.get(plugin.id)
+            if login is not None and login.status is LoginStatus.WAITING_FOR_USER:
+                print(f'[yellow]Skipping {plugin.name}, the login is waiting for you:[/yellow]')
+                for strategy in login.strategies:
+                    print(f'[yellow]  {strategy}[/yellow]')
+            continue
+
+        provider = plugin.instance()
+        providers[provider.id] = provider
+
+    return providers
+
+
+def _log_login(login: ProviderLogin) -> None:
+    match login.status:
+        case LoginStatus.PENDING:
+            logger.info('Logging in to %s...', login.name)
+        case LoginStatus.WAITING_FOR_USER:
+            for strategy in login.strategies:
+                logger.info('%s: %s', login.name, strategy)
+        case LoginStatus.LOGGED_IN:
+            logger.info('Successfully logged in to %s', login.name)
+        case LoginStatus.FAILED:
+            logger.error('Failed to log in to %s: %s', login.name, login.error)
+
+
+def _add_logged_in_provider(repl: _Repl, login: ProviderLogin) -> None:
+    """Let the URI prefetcher use a provider once it is logged in."""
+    if login.status is not LoginStatus.LOGGED_IN:
+        return
+
+    provider = plugin_manager.get(ProviderPlugin, login.plugin_id).instance()
+    repl.logged_in_providers[provider.id] = provider
+
+    # Queued items of the provider could not be prefetched before
+    if repl.uri_prefetcher is not None:
+        repl.uri_prefetcher.refresh()
+
+
+def _duration(seconds: int) -> str:
+    return f'{seconds // 60}:{seconds % 60:02d}'
+
+
+_SECTIONS: dict[str, tuple[str, ...]] = {
+    'artists': ('Name',),
+    'albums': ('Name', 'Year', 'Duration', 'Number of Tracks'),
+    'playlists': ('Name', 'Duration', 'Number of Tracks'),
+    'tracks': ('Name',),
+}
+
+
+def _cells(item: Any) -> tuple[str, ...]:  # noqa: ANN401
+    match item:
+        case Album():
+            return item.name, str(item.year), _duration(item.duration), str(item.number_of_tracks)
+        case Playlist():
+            return item.name, _duration(item.duration), str(item.number_of_tracks)
+        case Track():
+            return (item.title,)
+        case _:
+            return (item.name,)
+
+
+def _thumbnail_uri(provider: Provider | None, item: Any) -> str | None:  # noqa: ANN401
+    return provider.cover_uri_for(item, THUMBNAIL_SIZE) if provider is not None else item.cover_uri
+
+
+async def _render_rows(repl: _Repl, _search_result: SearchResult, windows: dict[str, range]) -> None:
+    """
+    Render rows of the sections of a search result as tables.
+
+    Only the rows in the windows are rendered and only their covers are loaded,
+    so the cost depends on the size of the windows, not on the size of the result.
+
+    :param repl: The REPL, whose caches load the covers.
+    :param _search_result: The result to render.
+    :param windows: The indices of the rows to render by section, e.g., ``{'tracks': range(10, 20)}``.
+    """
+    from rich.table import Table  # noqa: PLC0415
+
+    rows = {
+        section: getattr(_search_result, section)[window.start : window.stop] for section, window in windows.items()
+    }
+
+    # Request the smallest cover variants that are large enough for the thumbnails
+    instances = (plugin.instance() for plugin in plugin_manager.get_all(ProviderPlugin))
+    providers = {provider.id: provider for provider in instances}
+    cover_uris = {
+        section: [_thumbnail_uri(providers.get(item.provider_id), item) for item in items]
+        for section, items in rows.items()
+    }
+    thumbnails = await repl.thumbnails.get_many(
+        (uri for uris in cover_uris.values() for uri in uris if uri), THUMBNAIL_SIZE
+    )
+    logger.debug('Cover cache: %d hit(s), %d miss(es)', repl.covers.hits, repl.covers.misses)
+
+    for section, items in rows.items():
+        if not items:
+            continue
+
+        table = Table('ID', 'Image', *_SECTIONS[section], title=section.capitalize())
+        for i, (item, cover_uri) in enumerate(zip(items, cover_uris[section], strict=True), windows[section].start):
+            table.add_row(str(i), _cover(thumbnails, cover_uri), *_cells(item))
+        print(table)
+
+
+class _ResultView:
+    """
+    A search result that is shown in the REPL one window of rows at a time.
+
+    Every section shows up to ``VIEWPORT_ROWS`` rows at first, the ``more`` command shows the next ones.
+    """
+
+    result: SearchResult
+    shown: dict[str, int]
+    _repl: _Repl
+
+    def __init__(self, repl: _Repl) -> None:
+        self.result = SearchResult()
+        self.shown = dict.fromkeys(_SECTIONS, 0)
+        self._repl = repl
+
+    async def add(self, partial: SearchResult) -> None:
+        """Add a partial result and render its rows that fit into the first window."""
+        self.result.extend(partial)
+        await self._render(lambda shown: max(VIEWPORT_ROWS - shown, 0))
+
+        for section, error in partial.errors.items():
+            print(f'[red]Failed to load {section}: {error}[/red]')
+
+    async def more(self) -> None:
+        """Render the next window of rows."""
+        await self._render(lambda _: VIEWPORT_ROWS)
+
+    def print_hidden(self) -> None:
+        """Print how many rows are not shown yet."""
+        hidden = {section: len(getattr(self.result, section)) - shown for section, shown in self.shown.items()}
+
+        if any(hidden.values()):
+            counts = ', '.join(f'{count} {section}' for section, count in hidden.items() if count)
+            print(f'[dim]{counts} more, type "more" to show them[/dim]')
+        elif not any(self.shown.values()):
+            print('Nothing found')
+
+    async def _render(self, rows: Callable[[int], int]) -> None:
+        windows = {}
+
+        for section, shown in self.shown.items():
+            end = min(shown + rows(shown), len(getattr(self.result, section)))
+            windows[section] = range(shown, end)
+            self.shown[section] = end
+
+        await _render_rows(self._repl, self.result, windows)
 
 
 @command
-async def search(query: str | None) -> None:
-    """<query>   Search for music in TIDAL."""
+async def search(repl: _Repl, query: str | None) -> None:
+    """<query>   Search for music in all providers."""
     if not query:
         print('No query provided')
         return
 
-    tidal = plugin_manager.get(ProviderPlugin, 'ing.ranft.bennet.tidal').instance()
-    global search_result
-    search_result = await tidal.search(query)
-    _render_search_result(search_result)
+    # Other jobs may replace the published view meanwhile, so this search keeps adding to its own
+    view = _ResultView(repl)
+    repl.result_view = view
+    repl.search_result = view.result
+
+    async for partial in FederatedSearch((await _providers(repl)).values(), catalog=repl.catalog).stream(query):
+        await view.add(partial)
+
+    view.print_hidden()
 
 
 @command
-async def ls(inputs: str | None) -> None:
+async def ls(repl: _Repl, inputs: str | None) -> None:
     """<type> <id>   List content in the music library."""
     if not inputs:
         print('No inputs provided')
         return
 
-    if not search_result:
+    if not repl.search_result:
         print('You have to search first')
         return
 
     _type, _id = inputs.split(' ', 1)
-    obj = search_result.__getattribute__(f'{_type}s')[int(_id)]
+    obj = repl.search_result.__getattribute__(f'{_type}s')[int(_id)]
+
+    provider = (await _providers(repl)).get(obj.provider_id)
+    if provider is None:
+        print(f'The provider "{obj.provider_id}" is not available')
+        return
 
-    tidal = plugin_manager.get(ProviderPlugin, 'ing.ranft.bennet.tidal').instance()
-    res = await tidal.list(obj)
-    _render_search_result(res)
+    view = _ResultView(repl)
+    repl.result_view = view
 
+    if isinstance(obj, Album | Playlist):
+        # Albums and playlists can be huge, so the first tracks are shown while the rest is still loading
+        async for batch in provider.list_iter(obj):
+            page = SearchResult(tracks=batch)
+            repl.catalog.add(page)
+            await view.add(page)
+    else:
+        res = await provider.list(obj)
+        repl.catalog.add(res)
+        await view.add(res)
 
-async def main() -> None:
-    """Main entry point of the application."""
-    logger.info('Starting music player...')
-    logger.info('Config directory: "%s"', CONFIG_DIR)
+    view.print_hidden()
 
-    with plugin_manager:
-        plugin_manager.load_plugins()
 
-        tidal = plugin_manager.get(ProviderPlugin, 'ing.ranft.bennet.tidal').instance()
-        login_result = await tidal.login()
+@command
+async def more(repl: _Repl, _: str | None) -> None:
+    """Show the next rows of the last search or listing."""
+    view = repl.result_view
+    if view is None:
+        print('You have to search first')
+        return
+
+    await view.more()
+    view.print_hidden()
+
+
+@command
+async def enqueue(repl: _Repl, inputs: str | None) -> None:
+    """<type> <id>   Add a track, album or playlist to the queue."""
+    if not inputs:
+        print('No inputs provided')
+        return
+
+    if not repl.search_result:
+        print('You have to search first')
+        return
+
+    _type, _id = inputs.split(' ', 1)
+    obj = repl.search_result.__getattribute__(f'{_type}s')[int(_id)]
+    player = plugin_manager.get(PlayerPlugin, MEMORY_PLAYER_PLUGIN_ID).instance()
+
+    if isinstance(obj, Track):
+        player.add(obj)
+        print(f'Added "{obj.title}" to the queue')
+        return
+
+    provider = (await _providers(repl)).get(obj.provider_id)
+    if provider is None:
+        print(f'The provider "{obj.provider_id}" is not available')
+        return
+
+    # The first tracks are queued while the rest of the container is still loading
+    added = 0
+    async for batch in provider.list_iter(obj):
+        player.add(list[Playable](batch))
+        added += len(batch)
+    print(f'Added {added} track(s) to the queue')
+
+
+@command
+async def cache(_repl: _Repl, inputs: str | None) -> None:
+    """[clear]   Show the result cache statistics or clear the cache."""
+    tidal = plugin_manager.get(ProviderPlugin, TIDAL_PLUGIN_ID).instance()
+
+    if inputs == 'clear':
+        tidal.invalidate_cache()
+        print('Cleared the result cache')
+        return
+
+    stats = tidal.cache_stats
+    print(
+        f'{stats.size} cached result(s), {stats.hits} hit(s), {stats.misses} miss(es), '
+        f'{stats.coalesced} coalesced, {stats.evictions} eviction(s)'
+    )
+
+
+@command
+async def catalog(repl: _Repl, inputs: str | None) -> None:
+    """[compact]   Show the local catalog statistics or compact the catalog."""
+    index = repl.catalog
+
+    if inputs == 'compact':
+        before = index.stats().size
+        index.compact()
+        print(f'Compacted the catalog from {before / 1e6:.1f} MB to {index.stats().size / 1e6:.1f} MB')
+        return
+
+    stats = index.stats()
+    items = ', '.join(f'{count} {type_name.lower()}(s)' for type_name, count in sorted(stats.items.items())) or 'empty'
+    print(f'{items}, {stats.size / 1e6:.1f} MB, {stats.free / 1e6:.1f} MB reclaimable by compacting')
+
+
+@command
+async def jobs(repl: _Repl, _: str | None) -> None:
+    """Show the running jobs."""
+    current = asyncio.current_task()
+    others = {job_id: task for job_id, task in repl.running_jobs.items() if task is not current}
+
+    if not others:
+        print('No running jobs')
+        return
+
+    for job_id, task in others.items():
+        print(f'{job_id}: {task.get_name()}')
+
+
+@command
+async def cancel(repl: _Repl, inputs: str | None) -> None:
+    """<id>   Cancel a running job."""
+    if not inputs or not inputs.isdigit():
+        print('No job ID provided')
+        return
+
+    task = repl.running_jobs.get(int(inputs))
+    if task is None or task is asyncio.current_task():
+        print(f'There is no running job {inputs}')
+        return
+
+    task.cancel()
+
+
+class _StdinReader:
+    """
+    Reads lines from stdin on a dedicated thread and hands them to the event loop.
+
+    While the user is typing, the event loop keeps running, e.g., for logins, prefetching and events.
+    The thread only reads when a line is requested, so the prompt is not shown while a command is running.
+    It is a daemon thread, so a pending read does not keep the application alive.
+    """
 
-        if login_result.result is True:
-            logger.info('Successfully logged in')
-        elif login_result.result is False:
-            logger.error('Failed to log in')
-        else:
-            for strategy in login_result.strategies:
-                logger.info('%s', strategy)
+    _loop: asyncio.AbstractEventLoop
+    _prompts: queue.SimpleQueue[str]
+    _lines: asyncio.Queue[str | None]
+    _thread: threading.Thread | None
 
-            result = await login_result.result
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._prompts = queue.SimpleQueue()
+        self._lines = asyncio.Queue()
+        self._thread = None
 
-            if result:
-                logger.info('Successfully logged in')
-            else:
-                logger.error('Failed to log in')
+    async def readline(self, prompt: str) -> str | None:
+        """
+        Read a line.
 
+        :param prompt: The prompt to show.
+        :return: The line or ``None`` if stdin was closed, e.g., with Ctrl+D.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._read, name='stdin', daemon=True)
+            self._thread.start()
+
+        self._prompts.put(prompt)
+        return await self._lines.get()
+
+    def _read(self) -> None:
         while True:
-            cmd = input('> ').split(' ', 1)
+            prompt = self._prompts.get()
+
+            try:
+                line: str | None = input(prompt)
+            except EOFError:
+                line = None
+
+            self._loop.call_soon_threadsafe(self._lines.put_nowait, line)
+
+            if line is None:
+                return
+
+
+async def _run_command(repl: _Repl, name: str, args: str | None, *, background: bool = False) -> None:
+    """
+    Run a command as a job.
 
-            if cmd[0] in ('exit', 'quit', 'e', 'q'):
-                break
+    A foreground job is awaited and Ctrl+C cancels it. A background job runs while the REPL reads the next command,
+    its result is reported when it finishes. A failing command is logged and does not end the REPL.
+    """
+    job_id = next(repl.job_ids)
+    task = asyncio.create_task(commands[name](repl, args), name=name if args is None else f'{name} {args}')
+    repl.running_jobs[job_id] = task
+    task.add_done_callback(lambda _: repl.running_jobs.pop(job_id, None))
 
-            if cmd[0] in ('help', 'h') or cmd[0] not in commands:
-                print('Available commands:')
-                for cmd_name, cmd_func in commands.items():
-                    print(f'  {cmd_name}: {cmd_func.__doc__}')
-                print('help | h: Show this help message')
-                print('exit | quit | e | q: Exit the application')
-                continue
+    if background:
+        task.add_done_callback(functools.partial(_report_job, job_id))
+        print(f'Started job {job_id}: {task.get_name()}')
+        return
+
+    repl.command_task = task
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        # Only swallow the cancellation of the command, not of the REPL itself
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
+        print('[yellow]Cancelled[/yellow]')
+    except Exception:
+        logger.exception('Command failed: %s', task.get_name())
+    finally:
+        repl.command_task = None
+
+
+def _report_job(job_id: int, task: asyncio.Task[None]) -> None:
+    if task.cancelled():
+        print(f'[yellow]Job {job_id} cancelled: {task.get_name()}[/yellow]')
+    elif (e := task.exception()) is not None:
+        logger.error('Job %d failed: %s', job_id, task.get_name(), exc_info=e)
+    else:
+        print(f'Job {job_id} done: {task.get_name()}')
+
+
+def _interrupt(repl: _Repl) -> None:
+    """Cancel the running command on Ctrl+C, or explain how to quit if there is none."""
+    if repl.command_task is not None and not repl.command_task.done():
+        repl.command_task.cancel()
+        return
+
+    sys.stdout.write('\nType "exit" to quit\n> ')
+    sys.stdout.flush()
+
+
+async def main() -> None:
+    """Main entry point of the application."""
+    _setup_logging()
+    logger.info('Starting music player...')
+    logger.info('Config directory: "%s"', CONFIG_DIR)
+
+    with plugin_manager:
+        plugin_manager.load_plugins()
 
-            await commands[cmd[0]](cmd[1] if len(cmd) > 1 else None)
+        # Restore the queue of the last session
+        player = plugin_manager.get(PlayerPlugin, MEMORY_PLAYER_PLUGIN_ID).instance()
+        session_store = SessionStore(CONFIG_DIR / 'session')
+        session_store.attach(player)
+        repl = _Repl()
+
+        # Resolve the URIs of the upcoming items in the background, with the providers that are logged in
+        repl.uri_prefetcher = UriPrefetcher(player, repl.logged_in_providers)
+
+        # Log in to all providers in the background, so the prompt appears right away.
+        # Commands wait for the login of the provider they need.
+        login_orchestrator = LoginOrchestrator(plugin_manager.get_all(ProviderPlugin))
+        login_orchestrator.login_change_event.listen(_log_login)
+        login_orchestrator.login_change_event.listen(functools.partial(_add_logged_in_provider, repl))
+        login_orchestrator.start()
+        repl.login_orchestrator = login_orchestrator
+        loop = asyncio.get_running_loop()
+        reader = _StdinReader(loop)
+
+        with contextlib.suppress(NotImplementedError):  # Signal handlers are not supported on Windows
+            loop.add_signal_handler(signal.SIGINT, _interrupt, repl)
+
+        # The caches and the session are closed even if the REPL fails, so no pending writes are lost
+        try:
+            while True:
+                line = await reader.readline('> ')
+                if line is None:
+                    break
+
+                # A trailing "&" runs the command in the background
+                background = line.rstrip().endswith('&')
+                cmd = line.rstrip().removesuffix('&').strip().split(' ', 1)
+
+                if cmd[0] in ('exit', 'quit', 'e', 'q'):
+                    break
+
+                if cmd[0] in ('help', 'h') or cmd[0] not in commands:
+                    print('Available commands:')
+                    for cmd_name, cmd_func in commands.items():
+                        print(f'  {cmd_name}: {cmd_func.__doc__}')
+                    print('help | h: Show this help message')
+                    print('Append "&" to a command to run it in the background, Ctrl+C cancels a foreground command')
+                    print('exit | quit | e | q: Exit the application')
+                    continue
+
+                await _run_command(repl, cmd[0], cmd[1] if len(cmd) > 1 else None, background=background)
+        finally:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(signal.SIGINT)
+
+            repl.close()
+            session_store.close()
 
 
 if __name__ == '__main__':
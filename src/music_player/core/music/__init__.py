@@ -2,26 +2,43 @@ __all__ = [
     'Album',
     'AlreadyPlayingError',
     'Artist',
+    'CatalogIndex',
+    'CatalogStats',
+    'FederatedSearch',
+    'LoginOrchestrator',
+    'LoginStatus',
     'NotPlayingError',
     'Playable',
     'Playable',
     'PlayableContainer',
     'PlaybackStatus',
     'Player',
+    'PlayerPlugin',
     'Playlist',
     'PositionOutOfBoundsError',
     'Provider',
+    'ProviderItem',
+    'ProviderLogin',
     'ProviderPlugin',
+    'QueueChange',
+    'QueueChangeKind',
     'QueueOutOfBoundsError',
     'Radio',
     'RepeatMode',
     'SearchResult',
+    'SessionStore',
+    'ShuffleEngine',
+    'ShuffleMode',
     'Track',
+    'UriPrefetcher',
     'VolumeOutOfBoundsError',
+    'cached',
+    'cached_pages',
 ]
 
-from .abstractions import Player, Provider
-from .enums import PlaybackStatus, RepeatMode
+from .abstractions import Player, Provider, cached, cached_pages
+from .catalog import CatalogIndex, CatalogStats
+from .enums import LoginStatus, PlaybackStatus, QueueChangeKind, RepeatMode, ShuffleMode
 from .exceptions import (
     AlreadyPlayingError,
     NotPlayingError,
@@ -29,5 +46,20 @@ from .exceptions import (
     QueueOutOfBoundsError,
     VolumeOutOfBoundsError,
 )
-from .models import Album, Artist, Playable, PlayableContainer, Playlist, Radio, SearchResult, Track
-from .plugin_definitions import ProviderPlugin
+from .login import LoginOrchestrator
+from .models import (
+    Album,
+    Artist,
+    Playable,
+    PlayableContainer,
+    Playlist,
+    ProviderItem,
+    ProviderLogin,
+    QueueChange,
+    Radio,
+    SearchResult,
+    Track,
+)
+from .plugin_definitions import PlayerPlugin, ProviderPlugin
+from .queue import SessionStore, ShuffleEngine, UriPrefetcher
+from .search import FederatedSearch
@@ -1,4 +1,4 @@
-__all__ = ['Player', 'Provider']
+__all__ = ['Player', 'Provider', 'cached', 'cached_pages']
 
 from .player import Player
-from .provider import Provider
+from .provider import Provider, cached, cached_pages
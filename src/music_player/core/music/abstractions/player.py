@@ -3,10 +3,13 @@ __all__ = ['Player']
 from abc import ABC, abstractmethod
 
 from music_player.core.music.enums import PlaybackStatus, RepeatMode
-from music_player.core.music.models import Playable, Track
+from music_player.core.music.models import Playable, QueueChange, Track
 from music_player.core.plugin_manager import BasePlugin, PluginContext
 from music_player.core.utils import EventManager
 
+# The minimum time in seconds between two position change events
+_POSITION_EVENT_INTERVAL = 0.25
+
 
 class Player(BasePlugin, ABC):
     """
@@ -23,19 +26,33 @@ class Player(BasePlugin, ABC):
     _track_change_event: EventManager[Track]
     _position_change_event: EventManager[float]
     _volume_change_event: EventManager[float]
+    _queue_change_event: EventManager[QueueChange]
 
     def __init__(self, context: PluginContext) -> None:
         """Initialize the player."""
         super().__init__(context)
 
-        self._playback_status_change_event = EventManager()
+        # Errors in listeners are reported as playback errors, so a failing listener cannot break playback control
         self._playback_error_event = EventManager()
-        self._track_change_event = EventManager()
-        self._position_change_event = EventManager()
-        self._volume_change_event = EventManager()
+        errors = self._playback_error_event
+
+        self._playback_status_change_event = EventManager(error_sink=errors)
+        self._track_change_event = EventManager(error_sink=errors)
+        self._position_change_event = EventManager(throttle=_POSITION_EVENT_INTERVAL, error_sink=errors)
+        self._volume_change_event = EventManager(error_sink=errors)
+        self._queue_change_event = EventManager(error_sink=errors)
 
     def close(self) -> None:
         """Clean up resources."""
+        for event in (
+            self._playback_status_change_event,
+            self._playback_error_event,
+            self._track_change_event,
+            self._position_change_event,
+            self._volume_change_event,
+            self._queue_change_event,
+        ):
+            event.close()
 
     # region Playback Control
     @abstractmethod
@@ -183,6 +200,23 @@ class Player(BasePlugin, ABC):
     def clear(self) -> None:
         """Remove all items from the queue."""
 
+    def upcoming(self, count: int) -> list[Playable]:
+        """
+        Get the items that will be played after the current item, in order.
+
+        The default implementation follows the queue order and wraps around if ``repeat`` is ``ALL``.
+        Players that shuffle the queue should override it to return their shuffled order.
+
+        :param count: The maximum number of items to return.
+        :return: The upcoming items.
+        """
+        items = self.items
+
+        if self.repeat is RepeatMode.ALL:
+            return [items[(self.index + 1 + i) % len(items)] for i in range(min(count, len(items)))]
+
+        return items[self.index + 1 : self.index + 1 + count]
+
     @property
     @abstractmethod
     def shuffle(self) -> bool:
@@ -280,7 +314,7 @@ class Player(BasePlugin, ABC):
 
     @property
     def position_change_event(self) -> EventManager[float]:
-        """Invoked when the playback position changes."""
+        """Invoked when the playback position changes, at most every 250 ms with the latest position."""
         return self._position_change_event
 
     @property
@@ -288,4 +322,9 @@ class Player(BasePlugin, ABC):
         """Invoked when the volume changes."""
         return self._volume_change_event
 
+    @property
+    def queue_change_event(self) -> EventManager[QueueChange]:
+        """Invoked when the items in the queue, the current item or the playback order change."""
+        return self._queue_change_event
+
     # endregion
@@ -1,10 +1,28 @@
-__all__ = ['Provider']
+__all__ = ['Provider', 'cached', 'cached_pages']
 
+import asyncio
+import builtins
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Coroutine, Hashable, Sequence
+from functools import wraps
+from typing import Any, Concatenate
 
 from music_player.core.authentication import AuthenticationResult
-from music_player.core.music.models import Playable, PlayableContainer, Radio, SearchResult, Track
+from music_player.core.music.models import (
+    Album,
+    Artist,
+    Playable,
+    PlayableContainer,
+    Playlist,
+    ProviderItem,
+    Radio,
+    SearchResult,
+    Track,
+)
 from music_player.core.plugin_manager import BasePlugin, PluginContext
+from music_player.core.utils import AsyncCache, CacheStats
+
+type _CacheKey = tuple[str, str, Hashable]
 
 
 class Provider(BasePlugin, ABC):
@@ -17,12 +35,23 @@ class Provider(BasePlugin, ABC):
     - Searching for and listing content
     - Resolving a playable object to a playable URI
     - Getting metadata for a track
+
+    Results of methods decorated with :func:`cached` or :func:`cached_pages` are kept in a per-provider cache.
     """
 
-    def __init__(self, context: PluginContext) -> None:
-        """Initialize the provider."""
+    _result_cache: AsyncCache[_CacheKey, Any]
+
+    def __init__(self, context: PluginContext, *, cache_ttl: float = 300.0, cache_max_entries: int = 128) -> None:
+        """
+        Initialize the provider.
+
+        :param cache_ttl: The time in seconds after which cached results expire.
+        :param cache_max_entries: The maximum number of cached results.
+        """
         super().__init__(context)
 
+        self._result_cache = AsyncCache(cache_ttl, cache_max_entries)
+
     def close(self) -> None:
         """Clean up resources."""
 
@@ -31,6 +60,19 @@ class Provider(BasePlugin, ABC):
     def id(self) -> str:
         """A unique ID of the music provider instance."""
 
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Get the statistics of the result cache."""
+        return self._result_cache.stats
+
+    def invalidate_cache(self, method: str | None = None) -> None:
+        """
+        Remove cached results.
+
+        :param method: The name of the method whose results should be removed. If ``None``, all results are removed.
+        """
+        self._result_cache.invalidate(None if method is None else lambda key: key[1] == method)
+
     async def login(self) -> AuthenticationResult:
         """
         Log in to the service.
@@ -43,13 +85,73 @@ class Provider(BasePlugin, ABC):
     async def search(self, query: str) -> SearchResult:
         """Search the provider's library."""
 
+    async def search_pages(self, query: str, page_size: int = 50) -> AsyncIterator[SearchResult]:
+        """
+        Search the provider's library page by page.
+
+        Every page contains up to ``page_size`` items per section.
+        The default implementation splits the result of :meth:`search`,
+        providers with a paginated API should override it to fetch the pages lazily.
+        """
+        result = await self.search(query)
+        size = max(len(result.artists), len(result.albums), len(result.playlists), len(result.tracks))
+
+        for offset in range(0, max(size, 1), page_size):
+            yield SearchResult(
+                artists=result.artists[offset : offset + page_size],
+                albums=result.albums[offset : offset + page_size],
+                playlists=result.playlists[offset : offset + page_size],
+                tracks=result.tracks[offset : offset + page_size],
+                errors=result.errors if offset == 0 else {},
+            )
+
     @abstractmethod
     async def list(self, arg: PlayableContainer) -> SearchResult:
         """List the content in the provider's library."""
 
+    async def list_iter(self, arg: PlayableContainer, batch_size: int = 100) -> AsyncIterator[builtins.list[Track]]:
+        """
+        List the tracks of a container batch by batch.
+
+        Every batch contains up to ``batch_size`` tracks, so consumers can start with the first tracks
+        before the whole container is loaded. The default implementation splits the result of :meth:`list`,
+        providers with a paginated API should override it to fetch the batches lazily.
+        """
+        result = await self.list(arg)
+
+        for offset in range(0, len(result.tracks), batch_size):
+            yield result.tracks[offset : offset + batch_size]
+
     @abstractmethod
     async def resolve_uri(self, playable: Playable) -> str:
-        """Resolve a playable object to a URI."""
+        """
+        Resolve a playable object to a URI.
+
+        The URIs of upcoming queue items are resolved ahead of time and again whenever the queue changes,
+        so providers should cache the URIs until they expire.
+        """
+
+    async def resolve_many(self, playables: Sequence[Playable]) -> builtins.list[str]:
+        """
+        Resolve multiple playable objects to URIs concurrently.
+
+        :param playables: The objects to resolve.
+        :return: The URIs in the same order as the objects.
+        """
+        return list(await asyncio.gather(*(self.resolve_uri(playable) for playable in playables)))
+
+    def cover_uri_for(self, item: Artist | Album | Playlist | Track | Radio, size: int) -> str | None:  # noqa: ARG002
+        """
+        Get the URI of the smallest variant of an item's cover that is at least ``size`` pixels wide and high.
+
+        The ``cover_uri`` of the models is the largest variant, which is far too big for thumbnails.
+        The default implementation returns it, providers that offer several sizes should override this.
+
+        :param item: The item.
+        :param size: The minimum width and height in pixels.
+        :return: The URI or ``None`` if the item has no cover.
+        """
+        return item.cover_uri
 
     async def get_currently_playing_track(self, radio: Radio) -> Track:
         """
@@ -58,3 +160,69 @@ class Provider(BasePlugin, ABC):
         If the provider does not have radios, this method does not need to be implemented.
         """
         raise NotImplementedError
+
+
+def _identity(arg: object) -> Hashable:
+    if isinstance(arg, ProviderItem):
+        return arg.identity
+
+    if not isinstance(arg, Hashable):
+        msg = f'Cannot use an argument of type {type(arg).__name__} as a cache key'
+        raise TypeError(msg)
+
+    return arg
+
+
+def cached[TProvider: Provider, TArg, TResult](
+    method: Callable[[TProvider, TArg], Coroutine[Any, Any, TResult]],
+) -> Callable[[TProvider, TArg], Coroutine[Any, Any, TResult]]:
+    """
+    Cache the results of a provider method.
+
+    Results are keyed by the provider ID, the method name and the identity of the argument.
+    Models are identified by their type, provider ID and ID.
+    Concurrent calls with the same argument share one request.
+
+    The cached results are shared between callers and must not be modified.
+    """
+
+    @wraps(method)
+    async def wrapper(self: TProvider, arg: TArg) -> TResult:
+        key = (self.id, method.__name__, _identity(arg))
+        result: TResult = await self._result_cache.get_or_load(key, lambda: method(self, arg))
+        return result
+
+    return wrapper
+
+
+def cached_pages[TProvider: Provider, TArg, **P, TPage](
+    method: Callable[Concatenate[TProvider, TArg, P], AsyncIterator[TPage]],
+) -> Callable[Concatenate[TProvider, TArg, P], AsyncIterator[TPage]]:
+    """
+    Cache the pages of a provider method that yields its result page by page, e.g., :meth:`Provider.search_pages`.
+
+    The pages are keyed like the results of :func:`cached`, together with the other arguments, e.g., the page size.
+    They are cached once the method was consumed completely, later calls replay them without requests.
+    Listings that are stopped early or fail are not cached.
+
+    The cached pages are shared between callers and must not be modified.
+    """
+
+    @wraps(method)
+    async def wrapper(self: TProvider, arg: TArg, /, *args: P.args, **kwargs: P.kwargs) -> AsyncIterator[TPage]:
+        key = (self.id, method.__name__, (_identity(arg), *args, *sorted(kwargs.items())))
+        cached_pages: list[TPage] | None = self._result_cache.get(key)
+
+        if cached_pages is not None:
+            for page in cached_pages:
+                yield page
+            return
+
+        pages = []
+        async for page in method(self, arg, *args, **kwargs):
+            pages.append(page)
+            yield page
+
+        self._result_cache.set(key, pages)
+
+    return wrapper
@@ -0,0 +1,4 @@
+__all__ = ['CatalogIndex', 'CatalogStats']
+
+from .catalog_index import CatalogIndex
+from .catalog_stats import CatalogStats
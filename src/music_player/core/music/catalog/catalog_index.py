@@ -0,0 +1,227 @@
+__all__ = ['CatalogIndex']
+
+import re
+import sqlite3
+from collections.abc import Iterable
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter, time
+
+from music_player.core.music.models import Album, Artist, Playlist, SearchResult, Track
+from music_player.core.utils import WriteBehind
+
+from .catalog_stats import CatalogStats
+
+logger = getLogger(__name__)
+
+type _CatalogItem = Artist | Album | Playlist | Track
+type _Row = tuple[str, str, str, str, str | None, str | None, float]
+
+_TOKEN = re.compile(r'\w+')
+
+_MODELS: dict[str, type[_CatalogItem]] = {model.__name__: model for model in (Artist, Album, Playlist, Track)}
+_SECTIONS = {Artist: 'artists', Album: 'albums', Playlist: 'playlists', Track: 'tracks'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    name TEXT NOT NULL,
+    artist TEXT,
+    album TEXT,
+    seen REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    name, artist, album,
+    content='items', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, name, artist, album) VALUES (new.id, new.name, new.artist, new.album);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, name, artist, album)
+    VALUES ('delete', old.id, old.name, old.artist, old.album);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, name, artist, album)
+    VALUES ('delete', old.id, old.name, old.artist, old.album);
+    INSERT INTO items_fts(rowid, name, artist, album) VALUES (new.id, new.name, new.artist, new.album);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO items (key, type, data, name, artist, album, seen) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    data = excluded.data, name = excluded.name, artist = excluded.artist, album = excluded.album, seen = excluded.seen
+"""
+
+_SEARCH = """
+SELECT items.type, items.data FROM items_fts JOIN items ON items.id = items_fts.rowid
+WHERE items_fts MATCH ? ORDER BY bm25(items_fts, 10.0, 5.0, 1.0), items.seen DESC LIMIT ?
+"""
+
+
+def _row(item: _CatalogItem, seen: float) -> _Row:
+    key = f'{type(item).__name__}:{item.provider_id}:{item.id}'
+    data = item.model_dump_json()
+
+    match item:
+        case Artist():
+            return key, 'Artist', data, item.name, None, None, seen
+        case Album():
+            return key, 'Album', data, item.name, item.artist, None, seen
+        case Playlist():
+            return key, 'Playlist', data, item.name, None, None, seen
+        case Track():
+            return key, 'Track', data, item.title, item.artist, item.album, seen
+
+
+def _match_expression(query: str) -> str | None:
+    """Build an FTS expression that matches items containing all words of the query as prefixes."""
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+
+    # Quoting the tokens keeps FTS operators in the query, e.g. "AND" or "NEAR", from being interpreted
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+class CatalogIndex:
+    """
+    A local full-text index of the artists, albums, playlists and tracks that providers returned.
+
+    It answers searches in milliseconds and without network access, so it can show results before the providers do.
+    Searches ignore case and accents, and every word of a query matches as a prefix,
+    e.g., "beyo ha" finds "Beyoncé - Halo".
+
+    New items are buffered and written in one transaction, either when the batch is full
+    or shortly after the last item was added, so indexing does not slow down rendering a result.
+    """
+
+    _path: Path
+    _batch_size: int
+    _connection: sqlite3.Connection | None
+    _pending: dict[str, _Row]
+    _write_behind: WriteBehind
+
+    def __init__(self, path: Path, *, batch_size: int = 500) -> None:
+        """
+        Initialize the index.
+
+        :param path: The path of the database file. It is created if it does not exist.
+        :param batch_size: The number of buffered items that are written at once.
+        """
+        self._path = path
+        self._batch_size = batch_size
+        self._connection = None
+        self._pending = {}
+        self._write_behind = WriteBehind(self.flush, f'the catalog index "{path}"', errors=(sqlite3.Error,))
+
+    def add(self, result: SearchResult | Iterable[_CatalogItem]) -> None:
+        """
+        Add items to the index.
+
+        :param result: The items or a search result whose artists, albums, playlists and tracks are added.
+        """
+        items: Iterable[_CatalogItem] = (
+            (*result.artists, *result.albums, *result.playlists, *result.tracks)
+            if isinstance(result, SearchResult)
+            else result
+        )
+        seen = time()
+
+        for item in items:
+            row = _row(item, seen)
+            self._pending[row[0]] = row
+
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+        elif self._pending:
+            self._write_behind.schedule()
+
+    def search(self, query: str, limit: int = 20) -> SearchResult:
+        """
+        Search the index.
+
+        :param query: The search query.
+        :param limit: The maximum number of items.
+        :return: The matching items, ordered by relevance within each section.
+        """
+        expression = _match_expression(query)
+        result = SearchResult()
+
+        if expression is None:
+            return result
+
+        self.flush()
+        start = perf_counter()
+
+        for type_name, data in self._connect().execute(_SEARCH, (expression, limit)):
+            model = _MODELS[type_name]
+            getattr(result, _SECTIONS[model]).append(model.model_validate_json(data))
+
+        logger.debug('Searched the catalog for "%s" in %.1f ms', query, (perf_counter() - start) * 1000)
+        return result
+
+    def stats(self) -> CatalogStats:
+        """Get the statistics of the index."""
+        connection = self._connect()
+        items = dict(connection.execute('SELECT type, COUNT(*) FROM items GROUP BY type').fetchall())
+        (page_size,) = connection.execute('PRAGMA page_size').fetchone()
+        (page_count,) = connection.execute('PRAGMA page_count').fetchone()
+        (free_pages,) = connection.execute('PRAGMA freelist_count').fetchone()
+
+        return CatalogStats(
+            items=items, size=page_size * page_count, free=page_size * free_pages, pending=len(self._pending)
+        )
+
+    def compact(self, max_age: float | None = None) -> None:
+        """
+        Merge the index segments and reclaim unused space.
+
+        :param max_age: If given, items that were not seen for this many seconds are removed first.
+        """
+        self.flush()
+        connection = self._connect()
+
+        with connection:
+            if max_age is not None:
+                connection.execute('DELETE FROM items WHERE seen < ?', (time() - max_age,))
+            connection.execute("INSERT INTO items_fts(items_fts) VALUES ('optimize')")
+
+        connection.execute('VACUUM')
+
+    def flush(self) -> None:
+        """Write the buffered items to the database."""
+        self._write_behind.cancel()
+
+        if not self._pending:
+            return
+
+        rows, self._pending = list(self._pending.values()), {}
+        start = perf_counter()
+
+        connection = self._connect()
+        with connection:
+            connection.executemany(_UPSERT, rows)
+
+        logger.debug('Indexed %d catalog item(s) in %.1f ms', len(rows), (perf_counter() - start) * 1000)
+
+    def close(self) -> None:
+        """Write the buffered items and close the database."""
+        self.flush()
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self._path)
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.executescript(_SCHEMA)
+
+        return self._connection
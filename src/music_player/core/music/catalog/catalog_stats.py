@@ -0,0 +1,19 @@
+__all__ = ['CatalogStats']
+
+from pydantic import BaseModel
+
+
+class CatalogStats(BaseModel):
+    """
+    Statistics of a :class:`CatalogIndex`.
+
+    :var items: The number of indexed items by type, e.g., ``{'Track': 1200}``.
+    :var size: The size of the database file in bytes.
+    :var free: The number of bytes that are unused and can be reclaimed by compacting the index.
+    :var pending: The number of items that are not written to the database yet.
+    """
+
+    items: dict[str, int]
+    size: int
+    free: int
+    pending: int
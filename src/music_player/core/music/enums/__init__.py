@@ -1,4 +1,7 @@
-__all__ = ['PlaybackStatus', 'RepeatMode']
+__all__ = ['LoginStatus', 'PlaybackStatus', 'QueueChangeKind', 'RepeatMode', 'ShuffleMode']
 
+from .login_status import LoginStatus
 from .playback_status import PlaybackStatus
+from .queue_change_kind import QueueChangeKind
 from .repeat_mode import RepeatMode
+from .shuffle_mode import ShuffleMode
@@ -0,0 +1,12 @@
+__all__ = ['LoginStatus']
+
+from enum import StrEnum
+
+
+class LoginStatus(StrEnum):
+    """Login status of a provider."""
+
+    PENDING = 'pending'
+    WAITING_FOR_USER = 'waiting_for_user'
+    LOGGED_IN = 'logged_in'
+    FAILED = 'failed'
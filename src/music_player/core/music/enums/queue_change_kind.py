@@ -0,0 +1,15 @@
+__all__ = ['QueueChangeKind']
+
+from enum import StrEnum
+
+
+class QueueChangeKind(StrEnum):
+    """The kind of change to a player's queue."""
+
+    ADD = 'add'
+    REMOVE = 'remove'
+    MOVE = 'move'
+    CLEAR = 'clear'
+    INDEX = 'index'
+    SHUFFLE = 'shuffle'
+    REPEAT = 'repeat'
@@ -0,0 +1,10 @@
+__all__ = ['ShuffleMode']
+
+from enum import StrEnum
+
+
+class ShuffleMode(StrEnum):
+    """How the items of a shuffled queue are picked."""
+
+    RANDOM = 'random'
+    SMART = 'smart'
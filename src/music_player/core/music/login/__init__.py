@@ -0,0 +1,3 @@
+__all__ = ['LoginOrchestrator']
+
+from .login_orchestrator import LoginOrchestrator
@@ -0,0 +1,141 @@
+__all__ = ['LoginOrchestrator']
+
+import asyncio
+from collections.abc import Iterable
+from logging import getLogger
+
+from music_player.core.music.enums import LoginStatus
+from music_player.core.music.models import ProviderLogin
+from music_player.core.music.plugin_definitions import ProviderPlugin
+from music_player.core.utils import EventManager
+
+logger = getLogger(__name__)
+
+
+class LoginOrchestrator:
+    """
+    Logs in to all providers that need a login concurrently.
+
+    Every login reports its state through ``login_change_event`` as soon as it changes,
+    so the application can start while interactive logins are still waiting for the user.
+    Only the non-interactive part of a login is subject to the timeout,
+    the user may take as long as the provider allows.
+    """
+
+    _plugins: list[ProviderPlugin]
+    _timeout: float
+    _logins: dict[str, ProviderLogin]
+    _tasks: dict[str, asyncio.Task[bool]]
+    _waiting_for_user: dict[str, asyncio.Event]
+    _login_change_event: EventManager[ProviderLogin]
+
+    def __init__(self, plugins: Iterable[ProviderPlugin], timeout: float = 30.0) -> None:
+        """
+        Initialize the orchestrator.
+
+        :param plugins: The provider plugins. Plugins that don't need a login are ignored.
+        :param timeout: The time in seconds a provider may take to start its login.
+        """
+        self._plugins = [plugin for plugin in plugins if plugin.needs_login]
+        self._timeout = timeout
+        self._logins = {}
+        self._tasks = {}
+        self._waiting_for_user = {}
+        self._login_change_event = EventManager()
+
+    @property
+    def login_change_event(self) -> EventManager[ProviderLogin]:
+        """Invoked when the login state of a provider changes."""
+        return self._login_change_event
+
+    @property
+    def logins(self) -> list[ProviderLogin]:
+        """Get the login state of all providers."""
+        return list(self._logins.values())
+
+    def get(self, plugin_id: str) -> ProviderLogin | None:
+        """
+        Get the login state of a provider.
+
+        :param plugin_id: The ID of the provider plugin.
+        :return: The login state or ``None`` if the provider doesn't need a login or the logins were not started.
+        """
+        return self._logins.get(plugin_id)
+
+    def start(self) -> None:
+        """Start the logins in the background."""
+        for plugin in self._plugins:
+            if plugin.id not in self._tasks:
+                self._waiting_for_user[plugin.id] = asyncio.Event()
+                self._update(ProviderLogin(plugin_id=plugin.id, name=plugin.name, status=LoginStatus.PENDING))
+                self._tasks[plugin.id] = asyncio.create_task(self._login(plugin), name=f'login:{plugin.id}')
+
+    async def wait(self, plugin_id: str, *, for_user: bool = True) -> bool:
+        """
+        Wait until the login of a provider has finished.
+
+        :param plugin_id: The ID of the provider plugin.
+        :param for_user: Whether to wait for the user if the login needs them. If ``False``, the wait ends
+                         as soon as the login is waiting for the user, e.g., to enter a code in the browser.
+        :return: Whether the login was successful. Providers that don't need a login count as logged in.
+                 A login that is waiting for the user counts as unsuccessful if ``for_user`` is ``False``.
+        """
+        task = self._tasks.get(plugin_id)
+        if task is None:
+            return True
+
+        if for_user:
+            return await asyncio.shield(task)
+
+        waiting_for_user = asyncio.ensure_future(self._waiting_for_user[plugin_id].wait())
+        try:
+            # Unlike awaiting the task, ``asyncio.wait`` doesn't cancel the login if the caller is cancelled
+            await asyncio.wait((task, waiting_for_user), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiting_for_user.cancel()
+
+        return task.done() and task.result()
+
+    def cancel(self) -> None:
+        """Cancel the logins that are still pending."""
+        for task in self._tasks.values():
+            task.cancel()
+
+    async def _login(self, plugin: ProviderPlugin) -> bool:
+        try:
+            result = await asyncio.wait_for(plugin.instance().login(), self._timeout)
+
+            if not isinstance(result.result, bool):
+                self._update(
+                    ProviderLogin(
+                        plugin_id=plugin.id,
+                        name=plugin.name,
+                        status=LoginStatus.WAITING_FOR_USER,
+                        strategies=result.strategies,
+                    )
+                )
+                success = await result.result
+            else:
+                success = result.result
+        except TimeoutError:
+            return self._fail(plugin, f'Timed out after {self._timeout:g} s')
+        except Exception as e:
+            logger.exception('Failed to log in to "%s"', plugin.id)
+            return self._fail(plugin, str(e) or type(e).__name__)
+
+        if not success:
+            return self._fail(plugin, 'Login was not successful')
+
+        self._update(ProviderLogin(plugin_id=plugin.id, name=plugin.name, status=LoginStatus.LOGGED_IN))
+        return True
+
+    def _fail(self, plugin: ProviderPlugin, error: str) -> bool:
+        self._update(ProviderLogin(plugin_id=plugin.id, name=plugin.name, status=LoginStatus.FAILED, error=error))
+        return False
+
+    def _update(self, login: ProviderLogin) -> None:
+        self._logins[login.plugin_id] = login
+
+        if login.status is LoginStatus.WAITING_FOR_USER:
+            self._waiting_for_user[login.plugin_id].set()
+        self._login_change_event.invoke(login)
@@ -1,10 +1,26 @@
-__all__ = ['Album', 'Artist', 'Playable', 'Playable', 'PlayableContainer', 'Playlist', 'Radio', 'SearchResult', 'Track']
+__all__ = [
+    'Album',
+    'Artist',
+    'Playable',
+    'Playable',
+    'PlayableContainer',
+    'Playlist',
+    'ProviderItem',
+    'ProviderLogin',
+    'QueueChange',
+    'Radio',
+    'SearchResult',
+    'Track',
+]
 
 from .album import Album
 from .artist import Artist
 from .playable import Playable
 from .playable_container import PlayableContainer
 from .playlist import Playlist
+from .provider_item import ProviderItem
+from .provider_login import ProviderLogin
+from .queue_change import QueueChange
 from .radio import Radio
 from .search_result import SearchResult
 from .track import Track
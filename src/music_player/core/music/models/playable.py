@@ -2,16 +2,13 @@ __all__ = ['Playable']
 
 from abc import ABC
 
-from pydantic import BaseModel
+from .provider_item import ProviderItem
 
 
-class Playable(BaseModel, ABC):
+class Playable(ProviderItem, ABC):
     """
     A playable item, e.g., a track or radio station.
 
     :var provider_id: The ID of the provider where this playable comes from.
     :var id: A provider-dependent identifier for this playable.
     """
-
-    provider_id: str
-    id: str
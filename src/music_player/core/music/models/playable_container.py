@@ -2,16 +2,13 @@ __all__ = ['PlayableContainer']
 
 from abc import ABC
 
-from pydantic import BaseModel
+from .provider_item import ProviderItem
 
 
-class PlayableContainer(BaseModel, ABC):
+class PlayableContainer(ProviderItem, ABC):
     """
     Something that contains playable objects, e.g., a playlist or album.
 
     :var provider_id: The ID of the provider where this playable container comes from.
     :var id: A provider-dependent identifier for this playable container.
     """
-
-    provider_id: str
-    id: str
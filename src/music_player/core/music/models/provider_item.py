@@ -0,0 +1,26 @@
+__all__ = ['ProviderItem']
+
+from abc import ABC
+
+from pydantic import BaseModel
+
+
+class ProviderItem(BaseModel, ABC):
+    """
+    An item from a provider's library, e.g., a track or an album.
+
+    :var provider_id: The ID of the provider where this item comes from.
+    :var id: A provider-dependent identifier for this item.
+    """
+
+    provider_id: str
+    id: str
+
+    @property
+    def identity(self) -> tuple[str, str, str]:
+        """
+        Get a key that identifies the item by its type, provider ID and ID, e.g., to index or cache it.
+
+        The same item returned by two requests has the same identity, although the instances are different.
+        """
+        return type(self).__name__, self.provider_id, self.id
@@ -0,0 +1,24 @@
+__all__ = ['ProviderLogin']
+
+from pydantic import BaseModel, Field
+
+from music_player.core.authentication import AuthenticationStrategy
+from music_player.core.music.enums import LoginStatus
+
+
+class ProviderLogin(BaseModel):
+    """
+    The login state of a provider.
+
+    :var plugin_id: The ID of the provider plugin.
+    :var name: The display name of the provider plugin.
+    :var status: The login status.
+    :var strategies: The authentication strategies the user can use if ``status`` is ``WAITING_FOR_USER``.
+    :var error: The reason if ``status`` is ``FAILED``.
+    """
+
+    plugin_id: str
+    name: str
+    status: LoginStatus
+    strategies: list[AuthenticationStrategy] = Field(default_factory=list)
+    error: str | None = None
@@ -0,0 +1,31 @@
+__all__ = ['QueueChange']
+
+from pydantic import BaseModel, Field
+
+from music_player.core.music.enums import QueueChangeKind, RepeatMode
+
+from .playable import Playable
+
+
+class QueueChange(BaseModel):
+    """
+    A change to a player's queue.
+
+    Applying the changes in order to a copy of the queue gives the same queue, current index and modes.
+
+    :var kind: The kind of the change.
+    :var index: The index the items were added at (``ADD``), the index of the removed item (``REMOVE``),
+                the old index of the moved item (``MOVE``) or the new index of the current item (``INDEX``),
+                which is ``-1`` if there is none.
+    :var to: The new index of the moved item (``MOVE``).
+    :var items: The added items (``ADD``).
+    :var shuffle: Whether the queue is shuffled now (``SHUFFLE``).
+    :var repeat: The new repeat mode (``REPEAT``).
+    """
+
+    kind: QueueChangeKind
+    index: int | None = None
+    to: int | None = None
+    items: list[Playable] = Field(default_factory=list)
+    shuffle: bool | None = None
+    repeat: RepeatMode | None = None
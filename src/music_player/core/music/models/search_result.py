@@ -10,7 +10,12 @@ from .track import Track
 
 
 class SearchResult(BaseModel):
-    """Search results."""
+    """
+    Search results.
+
+    :var errors: Sections that could not be loaded, mapped to the reason.
+                 If this is not empty, the result is partial.
+    """
 
     artists: list[Artist] = Field(default_factory=list)
     albums: list[Album] = Field(default_factory=list)
@@ -18,3 +23,14 @@ class SearchResult(BaseModel):
     tracks: list[Track] = Field(default_factory=list)
     podcasts: list[Track] = Field(default_factory=list)
     radios: list[Radio] = Field(default_factory=list)
+    errors: dict[str, str] = Field(default_factory=dict)
+
+    def extend(self, other: 'SearchResult') -> None:
+        """Append the items and errors of another result to this one."""
+        self.artists.extend(other.artists)
+        self.albums.extend(other.albums)
+        self.playlists.extend(other.playlists)
+        self.tracks.extend(other.tracks)
+        self.podcasts.extend(other.podcasts)
+        self.radios.extend(other.radios)
+        self.errors.update(other.errors)
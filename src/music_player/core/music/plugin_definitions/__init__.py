@@ -1,3 +1,4 @@
-__all__ = ['ProviderPlugin']
+__all__ = ['PlayerPlugin', 'ProviderPlugin']
 
+from .player import PlayerPlugin
 from .provider import ProviderPlugin
@@ -0,0 +1,6 @@
+from music_player.core.music.abstractions import Player
+from music_player.core.plugin_manager import PluginDefinition
+
+
+class PlayerPlugin(PluginDefinition[Player]):
+    """Plugin definition for a player."""
@@ -0,0 +1,5 @@
+__all__ = ['SessionStore', 'ShuffleEngine', 'UriPrefetcher']
+
+from .session_store import SessionStore
+from .shuffle_engine import ShuffleEngine
+from .uri_prefetcher import UriPrefetcher
@@ -0,0 +1,294 @@
+__all__ = ['SessionStore']
+
+import json
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+from typing import Any, TextIO
+
+from music_player.core.music.abstractions import Player
+from music_player.core.music.enums import QueueChangeKind, RepeatMode
+from music_player.core.music.models import Playable, QueueChange, Radio, Track
+from music_player.core.utils import WriteBehind, atomic_write, construct_trusted
+
+logger = getLogger(__name__)
+
+_MODELS: dict[str, type[Playable]] = {model.__name__: model for model in (Track, Radio)}
+
+
+def _dump_item(playable: Playable) -> dict[str, Any]:
+    return {'type': type(playable).__name__, 'data': playable.model_dump(mode='json')}
+
+
+def _load_item(item: dict[str, Any]) -> Playable:
+    model, data = _MODELS[item['type']], item['data']
+
+    # The files are written by the store itself, so the items only need to be validated
+    # if they were written by a version with other fields
+    if data.keys() == model.model_fields.keys():
+        return construct_trusted(model, data)
+    return model.model_validate(data)
+
+
+def _dump_change(change: QueueChange) -> dict[str, Any]:
+    entry: dict[str, Any] = {'kind': change.kind.value}
+
+    match change.kind:
+        case QueueChangeKind.ADD:
+            entry['index'] = change.index
+            entry['items'] = [_dump_item(playable) for playable in change.items]
+        case QueueChangeKind.MOVE:
+            entry['index'] = change.index
+            entry['to'] = change.to
+        case QueueChangeKind.REMOVE | QueueChangeKind.INDEX:
+            entry['index'] = change.index
+        case QueueChangeKind.SHUFFLE:
+            entry['shuffle'] = change.shuffle
+        case QueueChangeKind.REPEAT:
+            entry['repeat'] = change.repeat
+
+    return entry
+
+
+class _State:
+    """The queue state that is rebuilt from the snapshot and the journal."""
+
+    items: list[Playable]
+    index: int
+    shuffle: bool
+    repeat: RepeatMode
+
+    def __init__(self) -> None:
+        self.items = []
+        self.index = -1
+        self.shuffle = False
+        self.repeat = RepeatMode.OFF
+
+    def apply(self, entry: dict[str, Any]) -> None:  # noqa: C901
+        """Apply a journal entry, keeping the current index on the same item like the player does."""
+        index = entry.get('index', -1)
+
+        match QueueChangeKind(entry['kind']):
+            case QueueChangeKind.ADD:
+                items = [_load_item(item) for item in entry['items']]
+                self.items[index:index] = items
+                if self.index >= index:
+                    self.index += len(items)
+            case QueueChangeKind.REMOVE:
+                del self.items[index]
+                if index < self.index:
+                    self.index -= 1
+            case QueueChangeKind.MOVE:
+                to = entry['to']
+                self.items.insert(to, self.items.pop(index))
+                if index == self.index:
+                    self.index = to
+                elif index < self.index <= to:
+                    self.index -= 1
+                elif to <= self.index < index:
+                    self.index += 1
+            case QueueChangeKind.CLEAR:
+                self.items.clear()
+                self.index = -1
+            case QueueChangeKind.INDEX:
+                self.index = index
+            case QueueChangeKind.SHUFFLE:
+                self.shuffle = entry['shuffle']
+            case QueueChangeKind.REPEAT:
+                self.repeat = RepeatMode(entry['repeat'])
+
+
+class SessionStore:
+    """
+    Persists the queue of a player, so it can be restored after a restart.
+
+    Every change to the queue is appended to a journal, which is cheap even for long queues,
+    as only the change is written, not the whole queue. When the journal has ``compact_after`` entries,
+    the queue is written to a snapshot and the journal starts over.
+    Restoring reads the snapshot and replays the journal, so it takes time proportional to the queue
+    and the changes since the last snapshot, not to the whole history of the queue.
+
+    The snapshot and the journal carry a generation number. A journal from another generation than the snapshot
+    is left over from an interrupted compaction, its changes are already in the snapshot and it is ignored.
+    A journal that ends in a partially written line or can't be replayed is compacted right after restoring,
+    so new entries are never appended to a damaged journal.
+    """
+
+    _directory: Path
+    _compact_after: int
+    _player: Player | None
+    _generation: int
+    _entries: int
+    _pending: list[str]
+    _journal: TextIO | None
+    _write_behind: WriteBehind
+
+    def __init__(self, directory: Path, *, compact_after: int = 1000) -> None:
+        """
+        Initialize the session store.
+
+        :param directory: The directory where the snapshot and the journal are stored.
+        :param compact_after: The number of journal entries after which a new snapshot is written.
+        """
+        self._directory = directory
+        self._compact_after = compact_after
+        self._player = None
+        self._generation = 0
+        self._entries = 0
+        self._pending = []
+        self._journal = None
+        self._write_behind = WriteBehind(self.flush, f'the session journal "{self._journal_path}"')
+
+    @property
+    def _snapshot_path(self) -> Path:
+        return self._directory / 'snapshot.json'
+
+    @property
+    def _journal_path(self) -> Path:
+        return self._directory / 'journal.jsonl'
+
+    def attach(self, player: Player) -> None:
+        """
+        Restore the saved queue into a player and record its changes from now on.
+
+        :param player: The player. Its queue should be empty.
+        """
+        start = perf_counter()
+        state, intact = self._load()
+
+        if state.items:
+            player.add(state.items)
+        if state.index != -1:
+            player.index = state.index
+        player.shuffle = state.shuffle
+        player.repeat = state.repeat
+
+        self._player = player
+        player.queue_change_event.listen(self._on_queue_change)
+        logger.info(
+            'Restored %d queued item(s) and %d journal entries in %.1f ms',
+            len(state.items),
+            self._entries,
+            (perf_counter() - start) * 1000,
+        )
+
+        if not intact:
+            self.compact()
+
+    def flush(self) -> None:
+        """Write the pending journal entries."""
+        self._write_behind.cancel()
+
+        if not self._pending:
+            return
+
+        if self._journal is None:
+            if not self._journal_path.exists():
+                self._directory.mkdir(parents=True, exist_ok=True)
+                self._reset_journal()
+            self._journal = self._journal_path.open('a', encoding='utf-8')
+
+        self._journal.writelines(self._pending)
+        self._journal.flush()
+        self._pending.clear()
+
+        if self._entries >= self._compact_after:
+            self.compact()
+
+    def compact(self) -> None:
+        """Write the queue to a new snapshot and start a new journal."""
+        if self._player is None:
+            return
+
+        self._pending.clear()
+        self._generation += 1
+        snapshot = {
+            'generation': self._generation,
+            'index': self._player.index,
+            'shuffle': self._player.shuffle,
+            'repeat': self._player.repeat.value,
+            'items': [_dump_item(playable) for playable in self._player.items],
+        }
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self._snapshot_path) as f:
+            f.write(json.dumps(snapshot).encode())
+
+        self._reset_journal()
+        self._entries = 0
+
+    def close(self) -> None:
+        """Stop recording changes and compact the journal, so the next start is fast."""
+        if self._player is not None:
+            self._player.queue_change_event.unlisten(self._on_queue_change)
+
+        self.flush()
+        if self._entries:
+            self.compact()
+
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+        self._player = None
+
+    def _on_queue_change(self, change: QueueChange) -> None:
+        self._pending.append(json.dumps(_dump_change(change)) + '\n')
+        self._entries += 1
+        self._write_behind.schedule()
+
+    def _load(self) -> tuple[_State, bool]:
+        """Read the snapshot and replay the journal, and tell whether the journal can be appended to."""
+        state = self._load_snapshot()
+
+        try:
+            with self._journal_path.open(encoding='utf-8') as journal:
+                header = journal.readline()
+                if not header.endswith('\n') or json.loads(header).get('generation') != self._generation:
+                    # New entries must not be appended to a journal that is ignored
+                    journal.close()
+                    self._reset_journal()
+                    return state, True
+
+                for line in journal:
+                    # A partially written last line is lost, the entries before it are still valid
+                    if not line.endswith('\n'):
+                        logger.warning('Ignoring the partially written last entry of "%s"', self._journal_path)
+                        return state, False
+                    state.apply(json.loads(line))
+                    self._entries += 1
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, IndexError):
+            logger.exception('Failed to replay the session journal "%s", ignoring the rest', self._journal_path)
+            return state, False
+
+        return state, True
+
+    def _load_snapshot(self) -> _State:
+        state = _State()
+
+        try:
+            snapshot = json.loads(self._snapshot_path.read_text(encoding='utf-8'))
+            state.items = [_load_item(item) for item in snapshot['items']]
+            state.index = snapshot['index']
+            state.shuffle = snapshot['shuffle']
+            state.repeat = RepeatMode(snapshot['repeat'])
+            self._generation = snapshot['generation']
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError):
+            logger.exception(
+                'Failed to read the session snapshot "%s", starting with an empty queue', self._snapshot_path
+            )
+            return _State()
+
+        return state
+
+    def _reset_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+        with atomic_write(self._journal_path) as f:
+            f.write(json.dumps({'generation': self._generation}).encode() + b'\n')
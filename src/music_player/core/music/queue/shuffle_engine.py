@@ -0,0 +1,275 @@
+__all__ = ['ShuffleEngine']
+
+import random
+from collections.abc import Callable, Iterable
+
+from music_player.core.music.enums import ShuffleMode
+from music_player.core.music.models import Playable, Track
+from music_player.core.utils import IndexedListHandle
+
+type _Handle = IndexedListHandle[Playable]
+
+# The number of candidates that are drawn before one that is not acceptable is taken anyway
+_MAX_ATTEMPTS = 8
+
+
+def _artist(playable: Playable) -> tuple[str, str] | None:
+    return (playable.provider_id, playable.artist_id) if isinstance(playable, Track) else None
+
+
+class ShuffleEngine:
+    """
+    The shuffled play order of a queue, for player implementations that keep their queue in an :class:`IndexedList`.
+
+    The order is a random permutation that is generated lazily with the Fisher-Yates algorithm.
+    The permutation is stored sparsely (only the positions that were swapped), so enabling shuffle is O(1)
+    and every pick is O(1), even for very long queues. Every item is played once per cycle,
+    a new cycle starts when all items were played and the queue is repeated.
+
+    The items are referenced by their handles, so the queue can be changed while it is shuffled:
+    added items can be picked in the current cycle, removed items are skipped.
+    The picked items are kept as history, so going back and forth replays the same order.
+
+    In ``SMART`` mode, an item by the same artist as the previous one is only picked if no other item
+    was found in a few attempts. An optional weight between 0 and 1 makes items with a lower weight
+    less likely to be picked early, e.g., to play recently played items later.
+    """
+
+    mode: ShuffleMode
+
+    _rng: random.Random
+    _weight: Callable[[Playable], float] | None
+    _history: int
+
+    _slots: list[_Handle]
+    _swaps: dict[int, int]
+    _drawn: int
+    _dead: int
+    _skip: set[_Handle]
+
+    _order: list[_Handle]
+    _cursor: int
+
+    def __init__(
+        self,
+        *,
+        seed: int | None = None,
+        mode: ShuffleMode = ShuffleMode.RANDOM,
+        weight: Callable[[Playable], float] | None = None,
+        history: int = 1000,
+    ) -> None:
+        """
+        Initialize the shuffle engine.
+
+        :param seed: The seed of the random order. The same seed and the same changes give the same order.
+        :param mode: How the items are picked.
+        :param weight: A function that returns the probability that an item is accepted when it is drawn.
+        :param history: The number of played items that are kept for going back.
+        """
+        self.mode = mode
+
+        self._rng = random.Random(seed)  # noqa: S311
+        self._weight = weight
+        self._history = history
+
+        self._slots = []
+        self._swaps = {}
+        self._drawn = 0
+        self._dead = 0
+        self._skip = set()
+
+        self._order = []
+        self._cursor = -1
+
+    def add(self, handles: Iterable[_Handle]) -> None:
+        """
+        Add items to the engine. Items that are added while shuffled can be picked in the current cycle.
+
+        :param handles: The handles of the added items.
+        """
+        self._slots.extend(handles)
+
+    def remove(self, handle: _Handle) -> None:
+        """
+        Tell the engine that an item was removed from the queue.
+
+        :param handle: The handle of the removed item.
+        """
+        self._skip.discard(handle)
+        self._dead += 1
+
+        if self._dead * 2 > len(self._slots):
+            self._compact()
+
+    def clear(self) -> None:
+        """Remove all items and the history."""
+        self._slots = []
+        self._new_cycle()
+        self._dead = 0
+        self._order = []
+        self._cursor = -1
+
+    def reset(self, current: _Handle | None) -> None:
+        """
+        Start a new shuffled order, e.g., when shuffle is enabled. This is O(1).
+
+        :param current: The playing item, which is not picked again in the new cycle.
+        """
+        self._new_cycle()
+        self._order = [current] if current is not None else []
+        self._cursor = len(self._order) - 1
+
+        if current is not None:
+            self._skip.add(current)
+
+    def jump(self, handle: _Handle) -> None:
+        """
+        Play an item out of order. It becomes the current item and is not picked again in this cycle.
+
+        :param handle: The handle of the item.
+        """
+        self._cursor += 1
+        self._order.insert(self._cursor, handle)
+        self._skip.add(handle)
+
+    def next(self, *, repeat: bool) -> _Handle | None:
+        """
+        Advance to the next item.
+
+        :param repeat: Whether a new cycle starts when all items were played.
+        :return: The next item or ``None`` if all items were played and the queue is not repeated.
+        """
+        for i in range(self._cursor + 1, len(self._order)):
+            if self._order[i].alive:
+                self._cursor = i
+                return self._order[i]
+
+        handle = self._draw(repeat=repeat)
+        if handle is None:
+            return None
+
+        self._order.append(handle)
+        self._cursor = len(self._order) - 1
+
+        if self._cursor > 2 * self._history:
+            del self._order[: self._cursor - self._history]
+            self._cursor = self._history
+
+        return handle
+
+    def previous(self) -> _Handle | None:
+        """
+        Go back to the previously played item.
+
+        :return: The previous item or ``None`` if there is none.
+        """
+        for i in range(self._cursor - 1, -1, -1):
+            if self._order[i].alive:
+                self._cursor = i
+                return self._order[i]
+
+        return None
+
+    @property
+    def has_previous(self) -> bool:
+        """Check if there is a previously played item."""
+        return any(self._order[i].alive for i in range(self._cursor - 1, -1, -1))
+
+    def has_next(self, *, repeat: bool) -> bool:
+        """
+        Check if there is a next item.
+
+        :param repeat: Whether a new cycle starts when all items were played.
+        """
+        return bool(self.upcoming(1, repeat=repeat))
+
+    def upcoming(self, count: int, *, repeat: bool) -> list[_Handle]:
+        """
+        Get the items that :meth:`next` will advance to, in order. They are picked ahead of time if needed.
+
+        :param count: The maximum number of items. At most one item per queued item is returned.
+        :param repeat: Whether a new cycle starts when all items were played.
+        :return: The upcoming items.
+        """
+        count = min(count, len(self._slots) - self._dead)
+        result: list[_Handle] = []
+        i = self._cursor + 1
+
+        while len(result) < count:
+            if i == len(self._order):
+                handle = self._draw(repeat=repeat)
+                if handle is None:
+                    break
+                self._order.append(handle)
+
+            if self._order[i].alive:
+                result.append(self._order[i])
+            i += 1
+
+        return result
+
+    def _new_cycle(self) -> None:
+        self._swaps = {}
+        self._drawn = 0
+        self._skip = set()
+
+    def _draw(self, *, repeat: bool) -> _Handle | None:
+        """Pick the next item of the permutation, skipping removed items and items that were played out of order."""
+        previous = self._order[-1] if self._order else None
+
+        while True:
+            if self._drawn == len(self._slots):
+                if not repeat or self._dead == len(self._slots):
+                    return None
+                if self._dead:
+                    self._compact()
+                self._new_cycle()
+
+            handle = self._take(self._pick(previous))
+
+            if handle.alive and handle not in self._skip:
+                return handle
+
+    def _pick(self, previous: _Handle | None) -> int:
+        """Choose a position in the undrawn part of the permutation."""
+        artist = _artist(previous.value) if previous is not None and self.mode is ShuffleMode.SMART else None
+        first = -1
+
+        for _ in range(_MAX_ATTEMPTS):
+            position = self._rng.randrange(self._drawn, len(self._slots))
+            handle = self._slots[self._swaps.get(position, position)]
+
+            if not handle.alive or (
+                handle is not previous
+                and (artist is None or _artist(handle.value) != artist)
+                and (self._weight is None or self._rng.random() < self._weight(handle.value))
+            ):
+                return position
+
+            if first == -1:
+                first = position
+
+        return first
+
+    def _take(self, position: int) -> _Handle:
+        """Swap the slot at a position with the first undrawn one and mark it as drawn."""
+        drawn = self._drawn
+        slot = self._swaps.pop(position, position)
+
+        if position != drawn:
+            # The drawn position is never read again, so only the swapped one is stored
+            self._swaps[position] = self._swaps.pop(drawn, drawn)
+
+        self._drawn += 1
+        return self._slots[slot]
+
+    def _compact(self) -> None:
+        """Drop the removed items from the slots, keeping the split into drawn and undrawn items."""
+        undrawn = [self._slots[self._swaps.get(i, i)] for i in range(self._drawn, len(self._slots))]
+        undrawn_set = set(undrawn)
+        drawn = [handle for handle in self._slots if handle.alive and handle not in undrawn_set]
+
+        self._slots = drawn + [handle for handle in undrawn if handle.alive]
+        self._swaps = {}
+        self._drawn = len(drawn)
+        self._dead = 0
@@ -0,0 +1,134 @@
+__all__ = ['UriPrefetcher']
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from functools import partial
+
+from music_player.core.music.abstractions import Player, Provider
+from music_player.core.music.enums import QueueChangeKind
+from music_player.core.music.models import Playable, QueueChange, Track
+
+type _Key = tuple[str, str, str]
+
+logger = logging.getLogger(__name__)
+
+
+class UriPrefetcher:
+    """
+    Resolves the URIs of the current and upcoming queue items in the background.
+
+    The prefetcher follows the queue of a player and resolves the current item and the next ``depth`` items
+    (as returned by :meth:`Player.upcoming`, so repeat and shuffle are respected) whenever the queue changes.
+    When the queue changes, prefetches for items that are no longer upcoming are cancelled.
+
+    The resolved URIs are not kept here but in the providers' caches, which know when a URI expires,
+    e.g., the signature of a TIDAL stream URL. A prefetch of an item whose URI is still cached is a cache hit.
+    Items of providers that are not in ``providers`` (yet) are skipped, so the mapping may be filled later.
+    """
+
+    _player: Player
+    _providers: Mapping[str, Provider]
+    _depth: int
+    _semaphore: asyncio.Semaphore
+    _loop: asyncio.AbstractEventLoop
+
+    _tasks: dict[_Key, asyncio.Task[str]]
+
+    def __init__(
+        self,
+        player: Player,
+        providers: Mapping[str, Provider],
+        *,
+        depth: int = 3,
+        concurrency: int = 2,
+    ) -> None:
+        """
+        Initialize the prefetcher and start following the player's queue.
+
+        :param player: The player whose queue should be prefetched.
+        :param providers: The providers to resolve the URIs with, by their ID.
+        :param depth: The number of upcoming items to prefetch.
+        :param concurrency: The maximum number of URIs that are resolved at the same time.
+        """
+        self._player = player
+        self._providers = providers
+        self._depth = depth
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._loop = asyncio.get_running_loop()
+
+        self._tasks = {}
+
+        player.queue_change_event.listen(self._on_queue_change)
+        player.track_change_event.listen(self._on_track_change)
+        self.refresh()
+
+    def close(self) -> None:
+        """Stop following the player's queue and cancel all prefetches."""
+        self._player.queue_change_event.unlisten(self._on_queue_change)
+        self._player.track_change_event.unlisten(self._on_track_change)
+
+        for task in self._tasks.values():
+            task.cancel()
+
+        self._tasks.clear()
+
+    async def resolve(self, playable: Playable) -> str:
+        """
+        Get the URI of an item, waiting for its prefetch or resolving it if necessary.
+
+        :param playable: The item.
+        :return: The URI.
+        :raises KeyError: If there is no provider for the item.
+        """
+        key = playable.identity
+        task = self._tasks.get(key)
+
+        if task is None:
+            task = self._start(key, playable)
+
+        # Cancelling the caller must not cancel the prefetch
+        return await asyncio.shield(task)
+
+    def refresh(self) -> None:
+        """Prefetch the current and upcoming items and cancel the prefetches that are no longer needed."""
+        current = self._player.current
+        wanted: list[Playable] = [current] if current is not None else []
+        wanted.extend(self._player.upcoming(self._depth))
+        wanted_keys = {playable.identity for playable in wanted}
+
+        for key in [key for key in self._tasks if key not in wanted_keys]:
+            self._tasks.pop(key).cancel()
+
+        for playable in wanted:
+            key = playable.identity
+
+            if key not in self._tasks and playable.provider_id in self._providers:
+                self._start(key, playable)
+
+    def _start(self, key: _Key, playable: Playable) -> asyncio.Task[str]:
+        provider = self._providers[playable.provider_id]
+
+        task = self._loop.create_task(self._resolve(provider, playable))
+        self._tasks[key] = task
+        task.add_done_callback(partial(self._discard_task, key))
+        return task
+
+    async def _resolve(self, provider: Provider, playable: Playable) -> str:
+        async with self._semaphore:
+            return await provider.resolve_uri(playable)
+
+    def _discard_task(self, key: _Key, task: asyncio.Task[str]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning('Failed to prefetch the URI of %s', key, exc_info=task.exception())
+
+    def _on_queue_change(self, change: QueueChange) -> None:
+        # A new current track is handled by the track change
+        if change.kind is not QueueChangeKind.INDEX:
+            self.refresh()
+
+    def _on_track_change(self, _: Track) -> None:
+        self.refresh()
@@ -0,0 +1,3 @@
+__all__ = ['FederatedSearch']
+
+from .federated_search import FederatedSearch
@@ -0,0 +1,221 @@
+__all__ = ['FederatedSearch']
+
+import asyncio
+import re
+import unicodedata
+from collections.abc import AsyncIterator, Hashable, Iterable
+from logging import getLogger
+
+from music_player.core.music.abstractions import Provider
+from music_player.core.music.catalog import CatalogIndex
+from music_player.core.music.models import (
+    Album,
+    Artist,
+    Playable,
+    PlayableContainer,
+    Playlist,
+    Radio,
+    SearchResult,
+    Track,
+)
+
+logger = getLogger(__name__)
+
+_NON_ALPHANUMERIC = re.compile(r'[\W_]+')
+
+# Providers round durations differently, so tracks that differ by up to this many seconds are considered the same
+_DURATION_TOLERANCE = 1
+
+
+def _normalize(text: str | None) -> str:
+    """Fold case, accents and punctuation, so e.g. "Beyoncé - Halo" and "beyonce halo" are equal."""
+    if not text:
+        return ''
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALPHANUMERIC.sub(' ', stripped.casefold()).strip()
+
+
+class _Deduplicator:
+    """
+    Indexes the items of a merged result by their identity and normalized keys.
+
+    Looking up an item is a dictionary lookup, so merging ``n`` items costs O(n) instead of O(n²) comparisons.
+    Items of the same provider are only collapsed if they have the same ID,
+    as the provider knows best whether they are different.
+    """
+
+    _identities: set[Hashable]
+    _seen: dict[Hashable, str]
+
+    def __init__(self) -> None:
+        self._identities = set()
+        self._seen = {}
+
+    def add(self, item: Playable | PlayableContainer, keys: Iterable[Hashable]) -> bool:
+        """
+        Add an item by its keys.
+
+        :return: Whether the item is new, i.e., it was not added before
+                 and no other provider returned an item with one of the keys.
+        """
+        identity = item.identity
+        keys = list(keys)
+
+        if identity in self._identities or any(
+            self._seen.get(key, item.provider_id) != item.provider_id for key in keys
+        ):
+            return False
+
+        self._identities.add(identity)
+        self._seen.setdefault(keys[0], item.provider_id)
+        return True
+
+    def filter(self, result: SearchResult, source: str) -> SearchResult:
+        """
+        Get the items of a result that are not duplicates of already merged items.
+
+        :param result: The result.
+        :param source: The name of the source of the result, it is added to the errors.
+        """
+        return SearchResult(
+            artists=[x for x in result.artists if self.add(x, [_artist_key(x)])],
+            albums=[x for x in result.albums if self.add(x, [_album_key(x)])],
+            playlists=[x for x in result.playlists if self.add(x, [_playlist_key(x)])],
+            tracks=[x for x in result.tracks if self.add(x, _track_keys(x))],
+            podcasts=[x for x in result.podcasts if self.add(x, _track_keys(x))],
+            radios=[x for x in result.radios if self.add(x, [_radio_key(x)])],
+            errors={f'{section} ({source})': error for section, error in result.errors.items()},
+        )
+
+
+def _artist_key(artist: Artist) -> Hashable:
+    return 'artist', _normalize(artist.name)
+
+
+def _album_key(album: Album) -> Hashable:
+    return 'album', _normalize(album.name), _normalize(album.artist), album.number_of_tracks
+
+
+def _playlist_key(playlist: Playlist) -> Hashable:
+    # Playlists are personal, so they are only collapsed with themselves
+    return playlist.identity
+
+
+def _track_keys(track: Track) -> list[Hashable]:
+    title, artist = _normalize(track.title), _normalize(track.artist)
+
+    if track.duration is None:
+        return [('track', title, artist, None)]
+
+    # The exact duration comes first, it is the one that is stored
+    offsets = sorted(range(-_DURATION_TOLERANCE, _DURATION_TOLERANCE + 1), key=abs)
+    return [('track', title, artist, track.duration + offset) for offset in offsets]
+
+
+def _radio_key(radio: Radio) -> Hashable:
+    return 'radio', _normalize(radio.title)
+
+
+class FederatedSearch:
+    """
+    Searches multiple providers concurrently and merges their results.
+
+    The providers are searched page by page (see :meth:`Provider.search_pages`), so the first rows
+    can be shown as soon as the first page of any provider arrives.
+    Every provider has to deliver its pages before the deadline, so a search takes at most as long as the deadline,
+    no matter how slow a single provider is. Providers that miss it are reported in the ``errors`` of the result,
+    the pages they delivered before are kept.
+
+    Items that several providers return are collapsed into the first one that arrived.
+    Items are compared by their normalized names and metadata,
+    e.g., tracks by their title, artist and duration. Playlists are never collapsed, as they are personal.
+
+    If there is a local catalog, it is searched first, so its results are yielded before any provider answers.
+    """
+
+    _providers: list[Provider]
+    _deadline: float
+    _catalog: CatalogIndex | None
+
+    def __init__(
+        self, providers: Iterable[Provider], *, deadline: float = 5.0, catalog: CatalogIndex | None = None
+    ) -> None:
+        """
+        Initialize the search.
+
+        :param providers: The providers to search.
+        :param deadline: The time in seconds every provider has to deliver all its pages.
+        :param catalog: The local catalog to search before the providers. The provider results are added to it.
+        """
+        self._providers = list(providers)
+        self._deadline = deadline
+        self._catalog = catalog
+
+    async def search(self, query: str) -> SearchResult:
+        """
+        Search all providers.
+
+        :param query: The search query.
+        :return: The merged result.
+        """
+        result = SearchResult()
+
+        async for partial in self.stream(query):
+            result.extend(partial)
+
+        return result
+
+    async def stream(self, query: str) -> AsyncIterator[SearchResult]:
+        """
+        Search all providers and yield their result pages in the order they arrive.
+
+        Every partial result contains only the items that are not duplicates of previously yielded items,
+        so extending a result with all partial results gives the merged result.
+
+        :param query: The search query.
+        """
+        deduplicator = _Deduplicator()
+        pages: asyncio.Queue[tuple[Provider, SearchResult | None]] = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(self._search(provider, query, pages), name=f'search:{provider.id}')
+            for provider in self._providers
+        ]
+
+        try:
+            if self._catalog is not None:
+                yield deduplicator.filter(self._catalog.search(query), 'catalog')
+
+            remaining = len(tasks)
+            while remaining:
+                provider, page = await pages.get()
+
+                if page is None:
+                    remaining -= 1
+                    continue
+
+                if self._catalog is not None:
+                    self._catalog.add(page)
+
+                yield deduplicator.filter(page, provider.id)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _search(
+        self, provider: Provider, query: str, pages: asyncio.Queue[tuple[Provider, SearchResult | None]]
+    ) -> None:
+        """Put the result pages of a provider into the queue, followed by ``None`` when it is done."""
+        try:
+            async with asyncio.timeout(self._deadline):
+                async for page in provider.search_pages(query):
+                    pages.put_nowait((provider, page))
+        except TimeoutError:
+            logger.warning('Search in "%s" missed the deadline of %g s', provider.id, self._deadline)
+            pages.put_nowait((provider, SearchResult(errors={'all': f'Timed out after {self._deadline:g} s'})))
+        except Exception as e:
+            logger.exception('Search in "%s" failed', provider.id)
+            pages.put_nowait((provider, SearchResult(errors={'all': str(e) or type(e).__name__})))
+
+        pages.put_nowait((provider, None))
@@ -10,4 +10,4 @@ class UnknownPluginTypeError(TypeError):
 
     def __init__(self, plugin: PluginDefinition[Any]) -> None:
         """Initialize the error."""
-        super().__init__(f'The plugin with the ID "{plugin.id}" is of an unknown type: {plugin.cls.__name__}.')
+        super().__init__(f'The plugin with the ID "{plugin.id}" is of an unknown type: {type(plugin).__name__}.')
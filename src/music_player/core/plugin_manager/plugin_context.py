@@ -1,55 +1,166 @@
 __all__ = ['PluginContext']
 
 from asyncio import AbstractEventLoop, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from time import monotonic
 
 from pydantic import BaseModel
 
 from music_player.core.constants import CONFIG_DIR
+from music_player.core.utils import Scheduler, WriteBehind, atomic_write
+
+# How often a cached file is checked for changes by other processes, in seconds
+_REVALIDATE_INTERVAL = 2.0
+
+
+class _ModelFile:
+    """
+    A JSON file that holds a pydantic model, cached in memory.
+
+    Parsed models are cached by their type. The file is checked for external changes by its modification time,
+    at most every ``_REVALIDATE_INTERVAL`` seconds, so repeated reads don't touch the disk.
+    Writes are delayed and coalesced, and replace the file atomically, so readers never see a half-written file.
+    """
+
+    _path: Path
+    _models: dict[type[BaseModel], BaseModel]
+    _text: str | None
+    _mtime: int | None
+    _checked: float
+    _pending: BaseModel | None
+    _write_behind: WriteBehind
+
+    def __init__(self, path: Path, loop: AbstractEventLoop) -> None:
+        self._path = path
+        self._models = {}
+        self._text = None
+        self._mtime = None
+        self._checked = float('-inf')
+        self._pending = None
+        self._write_behind = WriteBehind(self.flush, f'"{path}"', loop=loop)
+
+    def get[TModel: BaseModel](self, model_type: type[TModel]) -> TModel | None:
+        self._revalidate()
+
+        model = self._models.get(model_type)
+        if model is not None:
+            return model  # type: ignore[return-value]
+
+        if self._text is None:
+            if self._mtime is None:
+                return None
+
+            try:
+                self._text = self._path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                return None
+
+        parsed = model_type.model_validate_json(self._text)
+        self._models[model_type] = parsed
+        return parsed
+
+    def set(self, model: BaseModel) -> None:
+        self._models = {type(model): model}
+        self._pending = model
+        self._write_behind.schedule()
+
+    def flush(self) -> None:
+        self._write_behind.cancel()
+
+        if self._pending is None:
+            return
+
+        text = self._pending.model_dump_json()
+        self._pending = None
+
+        # Skip writing the same content again, e.g., unchanged credentials after every login
+        if text == self._text:
+            return
+
+        with atomic_write(self._path) as f:
+            f.write(text.encode())
+
+        self._text = text
+        self._mtime = self._path.stat().st_mtime_ns
+        self._checked = monotonic()
+
+    def _revalidate(self) -> None:
+        # Unwritten changes are newer than the file
+        if self._pending is not None or monotonic() - self._checked < _REVALIDATE_INTERVAL:
+            return
+
+        self._checked = monotonic()
+
+        try:
+            mtime = self._path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime != self._mtime:
+            self._models.clear()
+            self._text = None
+            self._mtime = mtime
 
 
 class PluginContext:
-    """A plugin context contains all information a plugin needs at runtime, such as the plugin config."""
+    """
+    A plugin context contains all information a plugin needs at runtime, such as the plugin config.
+
+    The scheduler runs background jobs of the plugin, e.g., refreshing a token before it expires.
+    Its jobs are cancelled when the context is closed.
+
+    The config and credentials are cached in memory and written in the background.
+    Models returned by the getters are shared and must not be modified.
+    """
 
     plugin_id: str
     loop: AbstractEventLoop
+    scheduler: Scheduler
 
     _config_dir: Path
-    _config_file: Path
-    _credentials_file: Path
+    _config_file: _ModelFile
+    _credentials_file: _ModelFile
 
     def __init__(self, plugin_id: str) -> None:
         """Initialize a new plugin context."""
         self.plugin_id = plugin_id
         self.loop = get_running_loop()
+        self.scheduler = Scheduler(self.loop)
 
         self._config_dir = CONFIG_DIR / 'plugins' / plugin_id
         self._config_dir.mkdir(parents=True, exist_ok=True)
-        self._config_file = self._config_dir / 'config.json'
-        self._credentials_file = self._config_dir / 'credentials.json'
+        self._config_file = _ModelFile(self._config_dir / 'config.json', self.loop)
+        self._credentials_file = _ModelFile(self._config_dir / 'credentials.json', self.loop)
+
+    def close(self) -> None:
+        """Cancel the scheduled jobs and write pending changes to the config and credentials."""
+        self.scheduler.close()
+        self._config_file.flush()
+        self._credentials_file.flush()
+
+    def create_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """
+        Create a bounded thread pool for running blocking calls off the event loop.
+
+        The executor is owned by the plugin, which has to shut it down in its ``close()`` method.
+
+        :param max_workers: The maximum number of worker threads.
+        """
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.plugin_id)
 
     def get_config[TConfig: BaseModel](self, config_type: type[TConfig]) -> TConfig | None:
         """Get the config for the plugin."""
-        if not self._config_file.exists():
-            return None
-
-        with self._config_file.open('r', encoding='utf-8') as f:
-            return config_type.model_validate_json(f.read())
+        return self._config_file.get(config_type)
 
     def set_config[TConfig: BaseModel](self, config: TConfig) -> None:
         """Set the config for the plugin."""
-        with self._config_file.open('w', encoding='utf-8') as f:
-            f.write(config.model_dump_json())
+        self._config_file.set(config)
 
     def get_credentials[TCredentials: BaseModel](self, credentials_type: type[TCredentials]) -> TCredentials | None:
         """Get the credentials for the plugin."""
-        if not self._credentials_file.exists():
-            return None
-
-        with self._credentials_file.open('r', encoding='utf-8') as f:
-            return credentials_type.model_validate_json(f.read())
+        return self._credentials_file.get(credentials_type)
 
     def set_credentials[TCredentials: BaseModel](self, credentials: TCredentials) -> None:
         """Set the credentials for the plugin."""
-        with self._credentials_file.open('w', encoding='utf-8') as f:
-            f.write(credentials.model_dump_json())
+        self._credentials_file.set(credentials)
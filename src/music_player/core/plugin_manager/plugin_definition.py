@@ -1,10 +1,16 @@
 from abc import ABC
+from importlib import import_module
+from logging import getLogger
+from time import perf_counter
+from typing import cast
 
 from pydantic import BaseModel, PrivateAttr
 
 from .base_plugin import BasePlugin
 from .plugin_context import PluginContext
 
+logger = getLogger(__name__)
+
 
 class PluginDefinition[TPlugin: BasePlugin](BaseModel, ABC):
     """
@@ -14,15 +20,29 @@ class PluginDefinition[TPlugin: BasePlugin](BaseModel, ABC):
              To avoid conflicts, use the reverse domain format (e.g., ``com.example.plugin``).
     :var name: The display name of the plugin.
     :var icon: The icon URI of the plugin.
-    :var cls: The plugin class.
+    :var cls: The plugin class or its import path in the ``module:Class`` format.
+              An import path defers importing the plugin's implementation and its dependencies until it is first used,
+              and allows the plugin manager to cache the definition.
     """
 
     id: str
     name: str
     icon: str
-    cls: type[TPlugin]
+    cls: type[TPlugin] | str
 
     _instance: TPlugin | None = PrivateAttr(default=None)
+    _context: PluginContext | None = PrivateAttr(default=None)
+
+    @property
+    def plugin_cls(self) -> type[TPlugin]:
+        """Get the plugin class, importing it if necessary."""
+        if isinstance(self.cls, str):
+            start = perf_counter()
+            module, _, name = self.cls.partition(':')
+            self.cls = cast('type[TPlugin]', getattr(import_module(module), name))
+            logger.info('Imported plugin "%s" in %.1f ms', self.id, (perf_counter() - start) * 1000)
+
+        return self.cls
 
     def close(self) -> None:
         """Clean up resources."""
@@ -30,10 +50,15 @@ class PluginDefinition[TPlugin: BasePlugin](BaseModel, ABC):
             self._instance.close()
             self._instance = None
 
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+
     def instance(self) -> TPlugin:
         """Get the plugin instance."""
         if self._instance is None:
-            context = PluginContext(self.id)
-            self._instance = self.cls(context)
+            plugin_cls = self.plugin_cls
+            self._context = PluginContext(self.id)
+            self._instance = plugin_cls(self._context)
 
         return self._instance
@@ -4,13 +4,17 @@ from collections.abc import Iterator
 from contextlib import AbstractContextManager
 from importlib import import_module
 from logging import getLogger
+from pathlib import Path
 from pkgutil import ModuleInfo, iter_modules
+from time import perf_counter
 from typing import Any, cast
 
 import music_player.plugin
+from music_player.core.constants import CONFIG_DIR
 
 from .exceptions import PluginAlreadyRegisteredError, UnknownPluginTypeError
 from .plugin_definition import PluginDefinition
+from .plugin_manifest import PluginManifest
 
 logger = getLogger(__name__)
 
@@ -19,23 +23,33 @@ def _iter_namespace(namespace_pkg: Any) -> Iterator[ModuleInfo]:  # noqa: ANN401
     return iter_modules(namespace_pkg.__path__, namespace_pkg.__name__ + '.')
 
 
+def _package_dir(finder: object, name: str) -> Path | None:
+    path = getattr(finder, 'path', None)
+    return Path(path) / name.rpartition('.')[2] if isinstance(path, str) else None
+
+
 class PluginManager(AbstractContextManager['PluginManager']):
     """
     The plugin manager is responsible for loading and managing plugins.
 
     Each plugin package must be in the ``music_player.plugin`` namespace and have a ``__init__.py`` file.
-    The ``__init__.py`` file must register all plugins in the plugin manager.
+    The ``__init__.py`` file must list all plugin definitions of the package in a module-level ``PLUGINS`` list,
+    which the plugin manager registers when it loads the package.
 
     Every plugin is initialized with a plugin context, which gives it access to configuration and shared resources.
+
+    The plugin definitions are cached in a manifest. If a package hasn't changed since it was cached,
+    its definitions are registered from the manifest without importing the package.
+    Plugins whose class is given as an import path are only imported when they are first used.
     """
 
     _plugins_by_id: dict[str, PluginDefinition[Any]]
-    _plugins_by_cls: dict[type[Any], list[PluginDefinition[Any]]]
+    _plugins_by_type: dict[type[Any], list[PluginDefinition[Any]]]
 
     def __init__(self) -> None:
         """Initialize the plugin manager."""
         self._plugins_by_id = {}
-        self._plugins_by_cls = {}
+        self._plugins_by_type = {}
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         self.close()
@@ -47,14 +61,46 @@ class PluginManager(AbstractContextManager['PluginManager']):
 
         logger.info('Cleaned up plugins')
 
-    @staticmethod
-    def load_plugins() -> None:
-        """Load all plugin packages in the ``music_player.plugin`` namespace."""
-        plugin_pkgs: list[str] = [name for _, name, _ in _iter_namespace(music_player.plugin)]
-        logger.info('Found %d plugin package(s): %s', len(plugin_pkgs), plugin_pkgs)
+    def load_plugins(self) -> None:
+        """
+        Load all plugin packages in the ``music_player.plugin`` namespace.
+
+        Logs how long loading each package took and whether it was loaded from the manifest.
+        """
+        plugin_pkgs = [(name, _package_dir(finder, name)) for finder, name, _ in _iter_namespace(music_player.plugin)]
+        logger.info('Found %d plugin package(s): %s', len(plugin_pkgs), [name for name, _ in plugin_pkgs])
+
+        manifest = PluginManifest(CONFIG_DIR / 'cache' / 'plugin_manifest.json')
+        report = []
+
+        for pkg, path in plugin_pkgs:
+            start = perf_counter()
+            # Packages that aren't plain directories, e.g., in a zip file, are always imported
+            key = manifest.package_key(pkg, path) if path is not None else None
+            definitions = manifest.get(pkg, key) if key is not None else None
 
-        for pkg in plugin_pkgs:
-            import_module(pkg)
+            if definitions is not None:
+                source = 'manifest'
+            else:
+                # The definitions are read from the package, not collected while importing it,
+                # so they are complete even if the package was imported before
+                definitions = getattr(import_module(pkg), 'PLUGINS', None)
+                if definitions is None:
+                    logger.warning('Skipping the plugin package "%s", it has no PLUGINS list', pkg)
+                    continue
+                if key is not None:
+                    manifest.set(pkg, key, definitions)
+                source = 'import'
+
+            for definition in definitions:
+                self.register(definition)
+
+            report.append((pkg, source, (perf_counter() - start) * 1000))
+
+        manifest.save()
+
+        for pkg, source, elapsed in report:
+            logger.info('Loaded plugin package "%s" from %s in %.1f ms', pkg, source, elapsed)
 
     def register(self, plugin: PluginDefinition[Any]) -> None:
         """
@@ -70,9 +116,22 @@ class PluginManager(AbstractContextManager['PluginManager']):
             raise UnknownPluginTypeError(plugin)
 
         self._plugins_by_id[plugin.id] = plugin
-        self._plugins_by_cls.setdefault(plugin.cls, []).append(plugin)
+        self._plugins_by_type.setdefault(type(plugin), []).append(plugin)
         logger.info('Registered plugin "%s"', plugin.id)
 
+    def get_all[TPlugin: PluginDefinition[Any]](self, t: type[TPlugin]) -> list[TPlugin]:
+        """
+        Get all plugins of the given type.
+
+        :var t: The type of the plugins, e.g., ``ProviderPlugin``.
+        """
+        return [
+            cast('TPlugin', plugin)
+            for plugin_type, plugins in self._plugins_by_type.items()
+            if issubclass(plugin_type, t)
+            for plugin in plugins
+        ]
+
     def get[TPlugin: PluginDefinition[Any]](self, t: type[TPlugin], plugin_id: str) -> TPlugin:  # noqa: ARG002
         """
         Get the plugin with the given ID.
@@ -88,7 +147,7 @@ plugin_manager = PluginManager()
 The plugin manager is responsible for loading and managing plugins.
 
 Each plugin package must be in the ``music_player.plugin`` namespace and have a ``__init__.py`` file.
-The ``__init__.py`` file must register all plugins in the plugin manager.
+The ``__init__.py`` file must list all plugin definitions of the package in a module-level ``PLUGINS`` list.
 
 Every plugin is initialized with a plugin context, which gives it access to configuration and shared resources.
 """
@@ -0,0 +1,144 @@
+__all__ = ['PluginManifest']
+
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
+from logging import getLogger
+from pathlib import Path
+from typing import Any, cast
+
+from pydantic import BaseModel, ValidationError
+
+from music_player.core.utils import atomic_write
+
+from .plugin_definition import PluginDefinition
+
+logger = getLogger(__name__)
+
+
+class _PluginEntry(BaseModel):
+    definition: str
+    data: dict[str, Any]
+
+
+class _PackageEntry(BaseModel):
+    key: str
+    plugins: list[_PluginEntry]
+
+
+class _Manifest(BaseModel):
+    packages: dict[str, _PackageEntry] = {}
+
+
+def _app_version() -> str:
+    try:
+        return version('music-player')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+class PluginManifest:
+    """
+    A cache of the plugin definitions of every plugin package.
+
+    A package's entry is keyed by the modification times of its files and the application version,
+    so it is invalidated when the package changes.
+    Only definitions whose ``cls`` is an import path can be cached, as the class itself is not serializable.
+    """
+
+    _path: Path
+    _manifest: _Manifest
+    _dirty: bool
+
+    def __init__(self, path: Path) -> None:
+        """
+        Load the manifest.
+
+        :param path: The path of the manifest file.
+        """
+        self._path = path
+        self._dirty = False
+
+        try:
+            self._manifest = _Manifest.model_validate_json(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            self._manifest = _Manifest()
+        except (OSError, ValidationError):
+            logger.warning('Ignoring the invalid plugin manifest "%s"', path, exc_info=True)
+            self._manifest = _Manifest()
+
+    @staticmethod
+    def package_key(package: str, path: Path) -> str:
+        """
+        Get the key of a package's entry.
+
+        :param package: The name of the package.
+        :param path: The directory of the package.
+        """
+        files = sorted(path.rglob('*.py'))
+        mtimes = ','.join(str(file.stat().st_mtime_ns) for file in files)
+        return f'{_app_version()}:{package}:{len(files)}:{mtimes}'
+
+    def get(self, package: str, key: str) -> list[PluginDefinition[Any]] | None:
+        """
+        Get the cached plugin definitions of a package.
+
+        :param package: The name of the package.
+        :param key: The current key of the package.
+        :return: The definitions or ``None`` if the package is not cached, has changed or its entry is stale.
+        """
+        entry = self._manifest.packages.get(package)
+        if entry is None or entry.key != key:
+            return None
+
+        definitions = []
+        try:
+            for plugin in entry.plugins:
+                module, _, name = plugin.definition.partition(':')
+                definition_type = cast('type[PluginDefinition[Any]]', getattr(import_module(module), name))
+                definitions.append(definition_type.model_validate(plugin.data))
+        except (ImportError, AttributeError, ValidationError):
+            # The key only covers the plugin package, so a changed definition class in the core invalidates it too
+            logger.warning('Ignoring the stale manifest entry of the plugin package "%s"', package, exc_info=True)
+            self._manifest.packages.pop(package)
+            self._dirty = True
+            return None
+
+        return definitions
+
+    def set(self, package: str, key: str, definitions: list[PluginDefinition[Any]]) -> None:
+        """
+        Cache the plugin definitions of a package.
+
+        If a definition can't be cached, the package is removed from the manifest.
+
+        :param package: The name of the package.
+        :param key: The current key of the package.
+        :param definitions: The definitions of the package.
+        """
+        self._dirty = True
+
+        if not all(isinstance(definition.cls, str) for definition in definitions):
+            self._manifest.packages.pop(package, None)
+            return
+
+        self._manifest.packages[package] = _PackageEntry(
+            key=key,
+            plugins=[
+                _PluginEntry(
+                    definition=f'{type(definition).__module__}:{type(definition).__qualname__}',
+                    data=definition.model_dump(mode='json'),
+                )
+                for definition in definitions
+            ],
+        )
+
+    def save(self) -> None:
+        """Write the manifest if it has changed."""
+        if not self._dirty:
+            return
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self._path) as f:
+            f.write(self._manifest.model_dump_json().encode())
+
+        self._dirty = False
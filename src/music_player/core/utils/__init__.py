@@ -1,3 +1,25 @@
-__all__ = ['EventManager']
+__all__ = [
+    'AsyncCache',
+    'CacheStats',
+    'CoverCache',
+    'EventManager',
+    'IndexedList',
+    'IndexedListHandle',
+    'Scheduler',
+    'ThumbnailCache',
+    'WriteBehind',
+    'as_utc',
+    'atomic_write',
+    'construct_trusted',
+]
 
+from music_player.core.utils.async_cache import AsyncCache, CacheStats
+from music_player.core.utils.atomic_write import atomic_write
+from music_player.core.utils.cover_cache import CoverCache
 from music_player.core.utils.event_manager import EventManager
+from music_player.core.utils.indexed_list import IndexedList, IndexedListHandle
+from music_player.core.utils.scheduler import Scheduler
+from music_player.core.utils.thumbnail_cache import ThumbnailCache
+from music_player.core.utils.trusted_model import construct_trusted
+from music_player.core.utils.utc import as_utc
+from music_player.core.utils.write_behind import WriteBehind
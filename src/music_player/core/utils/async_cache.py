@@ -0,0 +1,182 @@
+__all__ = ['AsyncCache', 'CacheStats']
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from time import monotonic
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """
+    Statistics of an :class:`AsyncCache`.
+
+    :var hits: The number of lookups that were served from the cache.
+    :var misses: The number of lookups that started a new load.
+    :var coalesced: The number of lookups that joined a load that was already in flight.
+    :var evictions: The number of entries that were removed because the cache was full.
+    :var size: The number of entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    size: int
+
+
+class AsyncCache[TKey: Hashable, TValue]:
+    """
+    An in-memory cache for the results of coroutines with TTL expiry and LRU eviction.
+
+    Concurrent lookups of the same missing key share one in-flight load.
+    Failed loads are not cached.
+    """
+
+    _ttl: float | Callable[[TValue], float]
+    _max_entries: int
+    _entries: OrderedDict[TKey, tuple[float, TValue]]
+    _pending: dict[TKey, asyncio.Task[TValue]]
+    _generation: int
+
+    _hits: int
+    _misses: int
+    _coalesced: int
+    _evictions: int
+
+    def __init__(self, ttl: float | Callable[[TValue], float], max_entries: int) -> None:
+        """
+        Initialize the cache.
+
+        :param ttl: The time in seconds after which an entry expires,
+                    or a function that returns it for a loaded value (e.g., for values that carry their own expiry).
+        :param max_entries: The maximum number of entries before the least recently used ones are evicted.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the cache statistics."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    async def get_or_load(self, key: TKey, loader: Callable[[], Awaitable[TValue]]) -> TValue:
+        """
+        Get a cached value or load it.
+
+        :param key: The cache key.
+        :param loader: A function that loads the value if it is not cached.
+        :return: The cached or loaded value.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._hits += 1
+            return entry[1]
+
+        task = self._pending.get(key)
+
+        if task is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            task = asyncio.ensure_future(self._load(key, loader, self._generation))
+            self._pending[key] = task
+            task.add_done_callback(partial(self._discard_pending, key))
+
+        # Cancelling one caller must not cancel the load the other callers are waiting for.
+        return await asyncio.shield(task)
+
+    def get(self, key: TKey) -> TValue | None:
+        """
+        Get a cached value without loading it, for values that are not loaded by one coroutine.
+
+        :param key: The cache key.
+        :return: The cached value or ``None`` if it is not cached or expired.
+        """
+        entry = self._lookup(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry[1]
+
+    def set(self, key: TKey, value: TValue) -> None:
+        """
+        Store a value that was loaded without :meth:`get_or_load`.
+
+        :param key: The cache key.
+        :param value: The value.
+        """
+        self._store(key, value)
+
+    def invalidate(self, predicate: Callable[[TKey], bool] | None = None) -> None:
+        """
+        Remove entries from the cache.
+
+        Loads that are in flight while invalidating are not stored.
+
+        :param predicate: A function that selects the keys to remove. If ``None``, all entries are removed.
+        """
+        if predicate is None:
+            self._entries.clear()
+            self._pending.clear()
+        else:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+            for key in [key for key in self._pending if predicate(key)]:
+                del self._pending[key]
+
+        self._generation += 1
+
+    def _lookup(self, key: TKey) -> tuple[float, TValue] | None:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            if entry[0] > monotonic():
+                self._entries.move_to_end(key)
+                return entry
+
+            del self._entries[key]
+
+        return None
+
+    async def _load(self, key: TKey, loader: Callable[[], Awaitable[TValue]], generation: int) -> TValue:
+        value = await loader()
+
+        if generation == self._generation:
+            self._store(key, value)
+
+        return value
+
+    def _store(self, key: TKey, value: TValue) -> None:
+        ttl = self._ttl(value) if callable(self._ttl) else self._ttl
+
+        if ttl > 0:
+            self._entries[key] = (monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _discard_pending(self, key: TKey, task: asyncio.Task[TValue]) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
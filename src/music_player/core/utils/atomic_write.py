@@ -0,0 +1,31 @@
+__all__ = ['atomic_write']
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import mkstemp
+from typing import BinaryIO
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """
+    Write a file atomically, so readers never see a half-written file.
+
+    The content is written to a temporary file in the same directory, which replaces the file when the block exits.
+    If the block raises, the file is left unchanged and the temporary file is removed.
+    The temporary file is named ``.<name>.<random>.tmp``.
+
+    :param path: The path of the file. Its directory must exist.
+    :return: The temporary file, opened for writing bytes.
+    """
+    fd, tmp = mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        Path(tmp).replace(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
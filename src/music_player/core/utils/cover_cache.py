@@ -0,0 +1,144 @@
+__all__ = ['CoverCache']
+
+import asyncio
+import hashlib
+import os
+import shutil
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import partial
+from logging import getLogger
+from pathlib import Path
+
+from music_player.core.utils.async_cache import AsyncCache
+from music_player.core.utils.atomic_write import atomic_write
+
+logger = getLogger(__name__)
+
+
+class CoverCache:
+    """
+    A content-addressed on-disk cache for cover images.
+
+    Images are stored under the SHA-256 hash of their URI.
+    When the total size exceeds ``max_size``, the least recently used images are evicted.
+    The access order survives restarts because it is persisted in the file modification times.
+    Concurrent fetches of the same image share one download.
+
+    :var hits: The number of lookups that were served from the cache.
+    :var misses: The number of lookups that required a download.
+    """
+
+    hits: int
+    misses: int
+
+    _directory: Path
+    _max_size: int
+    _timeout: float
+    _downloads: asyncio.Semaphore
+    _in_flight: AsyncCache[str, Path | None]
+    _entries: OrderedDict[str, int]
+    _size: int
+
+    def __init__(
+        self, directory: Path, max_size: int = 100 * 1024 * 1024, concurrency: int = 8, timeout: float = 10.0
+    ) -> None:
+        """
+        Initialize the cover cache.
+
+        :param directory: The directory where the images are stored.
+        :param max_size: The maximum total size of the cached images in bytes.
+        :param concurrency: The maximum number of concurrent downloads, shared by all callers.
+        :param timeout: The time in seconds a download may stall before it fails.
+        """
+        self.hits = 0
+        self.misses = 0
+
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._timeout = timeout
+        self._downloads = asyncio.Semaphore(concurrency)
+        # Only joins concurrent downloads of the same image, the downloaded files are the cache
+        self._in_flight = AsyncCache(0, 1)
+
+        files = [(f.stat(), f.name) for f in self._directory.iterdir() if f.is_file() and f.suffix != '.tmp']
+        files.sort(key=lambda x: x[0].st_mtime)
+        self._entries = OrderedDict((name, stat.st_size) for stat, name in files)
+        self._size = sum(self._entries.values())
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached images in bytes."""
+        return self._size
+
+    async def fetch(self, uri: str) -> Path | None:
+        """
+        Get the local path of an image, downloading it if it is not cached.
+
+        Downloads wait while ``concurrency`` other downloads are running.
+
+        :param uri: The URI of the image.
+        :return: The path of the cached image or ``None`` if the download failed or timed out.
+        """
+        key = hashlib.sha256(uri.encode()).hexdigest()
+        path = self._directory / key
+
+        if key in self._entries:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                self._size -= self._entries.pop(key)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return path
+
+        self.misses += 1
+        return await self._in_flight.get_or_load(key, partial(self._fetch_missing, uri, key, path))
+
+    async def fetch_many(self, uris: Iterable[str]) -> dict[str, Path | None]:
+        """
+        Get the local paths of multiple images, downloading missing ones concurrently.
+
+        :param uris: The URIs of the images.
+        :return: The paths of the cached images by URI.
+        """
+        unique = list(dict.fromkeys(uris))
+        return dict(zip(unique, await asyncio.gather(*(self.fetch(uri) for uri in unique)), strict=True))
+
+    def clear(self) -> None:
+        """Remove all cached images."""
+        for key in self._entries:
+            (self._directory / key).unlink(missing_ok=True)
+
+        self._entries.clear()
+        self._size = 0
+
+    async def _fetch_missing(self, uri: str, key: str, path: Path) -> Path | None:
+        try:
+            async with self._downloads:
+                size = await asyncio.to_thread(self._download, uri, path)
+        except (OSError, ValueError) as e:
+            # Timeouts are ``OSError`` as well
+            logger.warning('Failed to download cover "%s": %s', uri, e)
+            return None
+
+        self._size += size - self._entries.pop(key, 0)
+        self._entries[key] = size
+        self._evict()
+        return path
+
+    def _download(self, uri: str, path: Path) -> int:
+        import urllib.request  # noqa: PLC0415 # Only needed for downloads, importing it is slow
+
+        with atomic_write(path) as f, urllib.request.urlopen(uri, timeout=self._timeout) as response:  # noqa: S310
+            shutil.copyfileobj(response, f)
+
+        return path.stat().st_size
+
+    def _evict(self) -> None:
+        while self._size > self._max_size and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            (self._directory / key).unlink(missing_ok=True)
+            self._size -= size
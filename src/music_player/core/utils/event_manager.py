@@ -1,29 +1,133 @@
 __all__ = ['EventManager']
 
-from collections.abc import Callable
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_NO_PAYLOAD: Any = object()
 
 
 class EventManager[TPayload]:
-    """Class for managing event listeners."""
+    """
+    Class for managing event listeners.
+
+    Listeners may be functions or coroutine functions. Coroutines are scheduled as tasks on the running event loop.
+    An exception raised by a listener does not stop the other listeners from being called.
+    It is passed to the error sink or logged if there is none.
+
+    If the event is throttled, listeners are called at most once per interval with the latest payload.
+    """
+
+    type TListener = Callable[[TPayload], Awaitable[None] | None]  # type: ignore[valid-type]
+    _listeners: dict[TListener, None]
+    _snapshot: tuple[TListener, ...]
+
+    _throttle: float | None
+    _error_sink: 'EventManager[Exception] | None'
+    _last_dispatch: float
+    _pending: TPayload
+    _timer: asyncio.TimerHandle | None
+    _tasks: set[asyncio.Task[None]]
 
-    type TListener = Callable[[TPayload], None]  # type: ignore[valid-type]
-    _listeners: list[TListener]
+    def __init__(self, *, throttle: float | None = None, error_sink: 'EventManager[Exception] | None' = None) -> None:
+        """
+        Initialize the event manager.
 
-    def __init__(self) -> None:
-        """Initialize the event manager."""
-        self._listeners = []
+        :param throttle: The minimum time in seconds between two dispatches. Payloads in between are coalesced,
+                         so only the latest one is delivered. Throttling needs a running event loop,
+                         without one every payload is delivered immediately.
+        :param error_sink: The event that exceptions raised by listeners are passed to.
+        """
+        self._listeners = {}
+        self._snapshot = ()
+
+        self._throttle = throttle
+        self._error_sink = error_sink
+        self._last_dispatch = float('-inf')
+        self._pending = _NO_PAYLOAD
+        self._timer = None
+        self._tasks = set()
 
     def listen(self, listener: TListener) -> None:
         """Add a listener to the event manager."""
         if listener not in self._listeners:
-            self._listeners.append(listener)
+            self._listeners[listener] = None
+            self._snapshot = (*self._snapshot, listener)
 
     def unlisten(self, listener: TListener) -> None:
         """Remove a listener from the event manager."""
         if listener in self._listeners:
-            self._listeners.remove(listener)
+            del self._listeners[listener]
+            self._snapshot = tuple(self._listeners)
 
     def invoke(self, payload: TPayload) -> None:
         """Invoke all listeners with the given payload."""
-        for listener in self._listeners:
-            listener(payload)
+        if self._throttle is None:
+            self._dispatch(payload)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._dispatch(payload)
+            return
+
+        remaining = self._last_dispatch + self._throttle - monotonic()
+
+        if remaining <= 0 and self._timer is None:
+            self._dispatch(payload)
+            return
+
+        self._pending = payload
+        if self._timer is None:
+            self._timer = loop.call_later(max(remaining, 0), self._flush)
+
+    def close(self) -> None:
+        """Drop a throttled payload that was not delivered yet and cancel running coroutine listeners."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._pending = _NO_PAYLOAD
+
+        for task in self._tasks:
+            task.cancel()
+
+    def _flush(self) -> None:
+        payload, self._pending = self._pending, _NO_PAYLOAD
+        self._timer = None
+
+        if payload is not _NO_PAYLOAD:
+            self._dispatch(payload)
+
+    def _dispatch(self, payload: TPayload) -> None:
+        self._last_dispatch = monotonic()
+
+        for listener in self._snapshot:
+            try:
+                result = listener(payload)
+            except Exception as e:  # noqa: BLE001
+                self._report(e)
+                continue
+
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+
+        if not task.cancelled() and (e := task.exception()) is not None and isinstance(e, Exception):
+            self._report(e)
+
+    def _report(self, e: Exception) -> None:
+        if self._error_sink is not None and self._error_sink is not self:
+            self._error_sink.invoke(e)
+        else:
+            logger.error('Event listener failed', exc_info=e)
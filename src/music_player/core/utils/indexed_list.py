@@ -0,0 +1,321 @@
+__all__ = ['IndexedList', 'IndexedListHandle']
+
+import random
+from collections.abc import Iterable, Iterator
+
+
+class IndexedListHandle[T]:
+    """
+    A stable reference to an item in an :class:`IndexedList`.
+
+    The handle stays valid while the item is moved or other items are inserted or removed.
+
+    :var value: The item.
+    :var alive: Whether the item is still in the list.
+    """
+
+    __slots__ = ('alive', 'left', 'parent', 'priority', 'right', 'size', 'value')
+
+    value: T
+    alive: bool
+
+    # Tree node fields, only to be used by ``IndexedList``
+    priority: float
+    size: int
+    left: 'IndexedListHandle[T] | None'
+    right: 'IndexedListHandle[T] | None'
+    parent: 'IndexedListHandle[T] | None'
+
+    def __init__(self, value: T) -> None:
+        """Initialize a detached handle."""
+        self.value = value
+        self.alive = False
+        self.priority = random.random()  # noqa: S311
+        self.detach()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the handle."""
+        return f'IndexedListHandle({self.value!r})'
+
+    def detach(self) -> None:
+        """Reset the tree node fields."""
+        self.size = 1
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+type _Node[T] = IndexedListHandle[T] | None
+
+
+def _size[T](node: _Node[T]) -> int:
+    return node.size if node is not None else 0
+
+
+def _update[T](node: IndexedListHandle[T]) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split[T](node: _Node[T], count: int) -> tuple[_Node[T], _Node[T]]:
+    """Split a tree into one with the first ``count`` items and one with the rest."""
+    if node is None:
+        return None, None
+
+    if _size(node.left) >= count:
+        left, right = _split(node.left, count)
+        node.left = right
+        if right is not None:
+            right.parent = node
+        if left is not None:
+            left.parent = None
+        _update(node)
+        return left, node
+
+    left, right = _split(node.right, count - _size(node.left) - 1)
+    node.right = left
+    if left is not None:
+        left.parent = node
+    if right is not None:
+        right.parent = None
+    _update(node)
+    return node, right
+
+
+def _merge[T](left: _Node[T], right: _Node[T]) -> _Node[T]:
+    """Concatenate two trees."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        child = _merge(left.right, right)
+        left.right = child
+        if child is not None:
+            child.parent = left
+        _update(left)
+        return left
+
+    child = _merge(left, right.left)
+    right.left = child
+    if child is not None:
+        child.parent = right
+    _update(right)
+    return right
+
+
+def _build[T](nodes: list[IndexedListHandle[T]]) -> _Node[T]:
+    """Build a tree from nodes in list order in linear time."""
+    stack: list[IndexedListHandle[T]] = []
+
+    # A node's subtree is complete once it is popped from the stack, so its size can be updated then.
+    for node in nodes:
+        last = None
+        while stack and stack[-1].priority < node.priority:
+            last = stack.pop()
+            _update(last)
+
+        node.left = last
+        if last is not None:
+            last.parent = node
+        if stack:
+            stack[-1].right = node
+            node.parent = stack[-1]
+        stack.append(node)
+
+    root = None
+    while stack:
+        root = stack.pop()
+        _update(root)
+
+    return root
+
+
+class IndexedList[T]:
+    """
+    A list with O(log n) positional access, insertion, removal and moves.
+
+    The list is an implicit treap ordered by position.
+    Inserting returns a handle for the item that can be used to find, remove or move it without a linear search.
+    """
+
+    _root: _Node[T]
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        """Initialize the list."""
+        self._root = None
+        self.extend(values)
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items in order."""
+        for handle in self.handles():
+            yield handle.value
+
+    def __getitem__(self, index: int) -> T:
+        """Get the item at the given index."""
+        return self.handle_at(index).value
+
+    def handles(self) -> Iterator[IndexedListHandle[T]]:
+        """Iterate over the handles in order."""
+        stack: list[IndexedListHandle[T]] = []
+        node = self._root
+
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def handle_at(self, index: int) -> IndexedListHandle[T]:
+        """
+        Get the handle of the item at the given index.
+
+        :raises IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = 'list index out of range'
+            raise IndexError(msg)
+
+        node = self._root
+        while node is not None:
+            left_size = _size(node.left)
+
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+        raise AssertionError  # pragma: no cover
+
+    def index(self, handle: IndexedListHandle[T]) -> int:
+        """
+        Get the current index of an item.
+
+        :raises ValueError: If the handle is not in the list.
+        """
+        self._check(handle)
+
+        index = _size(handle.left)
+        node = handle
+        while node.parent is not None:
+            if node is node.parent.right:
+                index += _size(node.parent.left) + 1
+            node = node.parent
+
+        return index
+
+    def insert(self, index: int, value: T) -> IndexedListHandle[T]:
+        """
+        Insert an item before the given index.
+
+        :return: The handle of the inserted item.
+        """
+        return self.insert_many(index, (value,))[0]
+
+    def insert_many(self, index: int, values: Iterable[T]) -> list[IndexedListHandle[T]]:
+        """
+        Insert multiple items before the given index.
+
+        The items are linked in linear time, so this is faster than inserting them one by one.
+
+        :return: The handles of the inserted items.
+        """
+        handles = [IndexedListHandle(value) for value in values]
+        for handle in handles:
+            handle.alive = True
+
+        index = max(0, min(index, len(self)))
+        left, right = _split(self._root, index)
+        self._root = _merge(_merge(left, _build(handles)), right)
+        return handles
+
+    def append(self, value: T) -> IndexedListHandle[T]:
+        """
+        Add an item to the end of the list.
+
+        :return: The handle of the added item.
+        """
+        return self.insert(len(self), value)
+
+    def extend(self, values: Iterable[T]) -> list[IndexedListHandle[T]]:
+        """
+        Add multiple items to the end of the list.
+
+        :return: The handles of the added items.
+        """
+        return self.insert_many(len(self), values)
+
+    def remove(self, handle: IndexedListHandle[T]) -> T:
+        """
+        Remove an item.
+
+        :return: The removed item.
+        :raises ValueError: If the handle is not in the list.
+        """
+        self._check(handle)
+
+        parent = handle.parent
+        left, right = handle.left, handle.right
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+
+        child = _merge(left, right)
+        if child is not None:
+            child.parent = parent
+
+        if parent is None:
+            self._root = child
+        elif parent.left is handle:
+            parent.left = child
+        else:
+            parent.right = child
+
+        while parent is not None:
+            parent.size -= 1
+            parent = parent.parent
+
+        handle.detach()
+        handle.alive = False
+        return handle.value
+
+    def move(self, handle: IndexedListHandle[T], index: int) -> None:
+        """
+        Move an item to a new index.
+
+        The handle stays valid.
+
+        :raises ValueError: If the handle is not in the list.
+        """
+        self.remove(handle)
+
+        index = max(0, min(index, len(self)))
+        left, right = _split(self._root, index)
+        handle.alive = True
+        self._root = _merge(_merge(left, handle), right)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        for handle in list(self.handles()):
+            handle.detach()
+            handle.alive = False
+
+        self._root = None
+
+    def _check(self, handle: IndexedListHandle[T]) -> None:
+        if not handle.alive:
+            msg = f'{handle!r} is not in the list'
+            raise ValueError(msg)
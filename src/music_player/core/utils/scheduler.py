@@ -0,0 +1,99 @@
+__all__ = ['Scheduler']
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from logging import getLogger
+
+from music_player.core.utils.utc import as_utc
+
+logger = getLogger(__name__)
+
+# The longest time a job sleeps before checking the wall clock again, in seconds.
+# The event loop clock may stop while the system is suspended, the wall clock doesn't.
+_MAX_SLEEP = 60.0
+
+
+class Scheduler:
+    """
+    Runs coroutine jobs at a given wall clock time in the background.
+
+    Jobs are identified by their name. Scheduling a job replaces a pending job with the same name,
+    so a job can reschedule itself, e.g., to refresh a token again before it expires.
+    A failing job is retried after a delay until it succeeds or is cancelled.
+    """
+
+    _loop: asyncio.AbstractEventLoop
+    _retry_delay: float
+    _jobs: dict[str, asyncio.Task[None]]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, retry_delay: float = 60.0) -> None:
+        """
+        Initialize the scheduler.
+
+        :param loop: The event loop to run the jobs on.
+        :param retry_delay: The time in seconds after which a failed job is retried.
+        """
+        self._loop = loop
+        self._retry_delay = retry_delay
+        self._jobs = {}
+
+    @property
+    def jobs(self) -> list[str]:
+        """Get the names of the pending jobs."""
+        return list(self._jobs)
+
+    def schedule(self, name: str, job: Callable[[], Awaitable[object]], at: datetime) -> None:
+        """
+        Schedule a job.
+
+        :param name: The name of the job.
+        :param job: The coroutine function to run.
+        :param at: When to run the job. A naive time is interpreted as UTC. Jobs in the past run immediately.
+        """
+        self.cancel(name)
+
+        task = self._loop.create_task(self._run(name, job, as_utc(at)), name=f'scheduler:{name}')
+        self._jobs[name] = task
+        task.add_done_callback(partial(self._discard, name))
+        logger.debug('Scheduled job "%s" at %s', name, at)
+
+    def cancel(self, name: str) -> None:
+        """
+        Cancel a pending job.
+
+        A job that is currently running is not interrupted when it reschedules itself.
+
+        :param name: The name of the job.
+        """
+        task = self._jobs.pop(name, None)
+
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    def close(self) -> None:
+        """Cancel all jobs."""
+        for name in self.jobs:
+            self.cancel(name)
+
+    async def _run(self, name: str, job: Callable[[], Awaitable[object]], at: datetime) -> None:
+        while True:
+            while (delay := (at - datetime.now(UTC)).total_seconds()) > 0:  # noqa: ASYNC110
+                await asyncio.sleep(min(delay, _MAX_SLEEP))
+
+            try:
+                await job()
+            except Exception:
+                # The job rescheduled itself before failing, the new schedule replaces the retry
+                if self._jobs.get(name) is not asyncio.current_task():
+                    raise
+
+                logger.exception('Job "%s" failed, retrying in %.0f s', name, self._retry_delay)
+                at = datetime.now(UTC) + timedelta(seconds=self._retry_delay)
+            else:
+                return
+
+    def _discard(self, name: str, task: asyncio.Task[None]) -> None:
+        if self._jobs.get(name) is task:
+            del self._jobs[name]
@@ -0,0 +1,95 @@
+__all__ = ['ThumbnailCache']
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from music_player.core.utils.async_cache import AsyncCache
+from music_player.core.utils.cover_cache import CoverCache
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+logger = getLogger(__name__)
+
+
+def _decode(path: Path, size: int) -> 'Image':
+    from PIL import Image  # noqa: PLC0415 # Only needed to show covers, importing it is slow
+
+    with Image.open(path) as image:
+        # Let the JPEG decoder scale down while decoding, which is much faster than decoding the full image
+        image.draft('RGB', (size, size))
+        image.thumbnail((size, size))
+        image.load()
+        return image
+
+
+def _ttl(thumbnail: 'Image | None') -> float:
+    # Failed images are loaded again next time, e.g., when the network is back
+    return float('inf') if thumbnail is not None else 0
+
+
+class ThumbnailCache:
+    """
+    Decodes and downscales cover images to thumbnails on a worker pool.
+
+    The images are fetched through a :class:`CoverCache`, which limits the concurrent downloads.
+    The decoded thumbnails are kept in memory per URI and size, so rendering the same rows again does not decode them
+    again. Images that could not be loaded are not kept, so they are tried again.
+    Decoding releases the GIL, so the thumbnails of a page are decoded in parallel.
+    """
+
+    _covers: CoverCache
+    _executor: ThreadPoolExecutor
+    _thumbnails: AsyncCache[tuple[str, int], 'Image | None']
+
+    def __init__(self, covers: CoverCache, *, max_workers: int = 4, max_entries: int = 256) -> None:
+        """
+        Initialize the thumbnail cache.
+
+        :param covers: The cache the images are fetched through.
+        :param max_workers: The maximum number of thumbnails that are decoded at the same time.
+        :param max_entries: The maximum number of thumbnails that are kept in memory.
+        """
+        self._covers = covers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='thumbnails')
+        self._thumbnails = AsyncCache(_ttl, max_entries)
+
+    async def get(self, uri: str, size: int) -> 'Image | None':
+        """
+        Get the thumbnail of an image.
+
+        :param uri: The URI of the image.
+        :param size: The maximum width and height of the thumbnail in pixels.
+        :return: The thumbnail or ``None`` if the image could not be loaded.
+        """
+        return await self._thumbnails.get_or_load((uri, size), lambda: self._load(uri, size))
+
+    async def get_many(self, uris: Iterable[str], size: int) -> dict[str, 'Image | None']:
+        """
+        Get the thumbnails of multiple images concurrently.
+
+        :param uris: The URIs of the images.
+        :param size: The maximum width and height of the thumbnails in pixels.
+        :return: The thumbnails by URI.
+        """
+        unique = list(dict.fromkeys(uris))
+        return dict(zip(unique, await asyncio.gather(*(self.get(uri, size) for uri in unique)), strict=True))
+
+    def close(self) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _load(self, uri: str, size: int) -> 'Image | None':
+        path = await self._covers.fetch(uri)
+        if path is None:
+            return None
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, _decode, path, size)
+        except OSError as e:
+            logger.warning('Failed to decode cover "%s": %s', uri, e)
+            return None
@@ -0,0 +1,37 @@
+__all__ = ['construct_trusted']
+
+from typing import Any
+
+from pydantic import BaseModel
+
+_object_setattr = object.__setattr__
+
+# One set of field names per model, shared by all trusted instances instead of a set per instance
+_fields_sets: dict[type[BaseModel], set[str]] = {}
+
+
+def construct_trusted[TModel: BaseModel](model: type[TModel], values: dict[str, Any]) -> TModel:
+    """
+    Create a model from trusted values without validating them.
+
+    This is a fast path for building many models from data that is known to be valid, e.g., a long playlist.
+    It is about twice as fast as validating the values and needs about a third of the memory per instance.
+    ``BaseModel.model_construct`` is no alternative, as it is even slower than validating.
+
+    The values must contain every field of the model with a value of the right type, defaults are not applied.
+    The instance takes ownership of ``values``, so the dictionary must not be used afterward.
+
+    :param model: The model class.
+    :param values: The field values.
+    :return: The model instance.
+    """
+    fields_set = _fields_sets.get(model)
+    if fields_set is None:
+        fields_set = _fields_sets[model] = set(model.model_fields)
+
+    instance = model.__new__(model)
+    _object_setattr(instance, '__dict__', values)
+    _object_setattr(instance, '__pydantic_fields_set__', fields_set)
+    _object_setattr(instance, '__pydantic_extra__', None)
+    _object_setattr(instance, '__pydantic_private__', None)
+    return instance
@@ -0,0 +1,15 @@
+__all__ = ['as_utc']
+
+from datetime import UTC, datetime
+
+
+def as_utc(time: datetime) -> datetime:
+    """
+    Make a time timezone-aware, treating a naive time as UTC.
+
+    Libraries like ``tidalapi`` return naive UTC times, which can't be compared with timezone-aware ones.
+
+    :param time: The time.
+    :return: The time itself if it is timezone-aware, else the time in UTC.
+    """
+    return time.replace(tzinfo=UTC) if time.tzinfo is None else time
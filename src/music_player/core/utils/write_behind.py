@@ -0,0 +1,78 @@
+__all__ = ['WriteBehind']
+
+import asyncio
+from collections.abc import Callable
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+class WriteBehind:
+    """
+    Delays a write, so changes that follow shortly after each other are written at once.
+
+    The write runs on the event loop ``delay`` seconds after the first change that scheduled it.
+    Without a running event loop, e.g., in scripts, it runs right away.
+    Errors of a delayed write are logged, as there is no caller to handle them.
+    """
+
+    _write: Callable[[], None]
+    _name: str
+    _errors: tuple[type[Exception], ...]
+    _delay: float
+    _loop: asyncio.AbstractEventLoop | None
+    _timer: asyncio.TimerHandle | None
+
+    def __init__(
+        self,
+        write: Callable[[], None],
+        name: str,
+        *,
+        errors: tuple[type[Exception], ...] = (OSError,),
+        delay: float = 1.0,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """
+        Initialize the write-behind.
+
+        :param write: The function that writes the changes.
+        :param name: What is written, for the error log, e.g., ``'the catalog index "catalog.db"'``.
+        :param errors: The exceptions of a delayed write that are logged.
+        :param delay: How long writes are delayed to coalesce them, in seconds.
+        :param loop: The event loop the write runs on. If ``None``, the running event loop is used.
+        """
+        self._write = write
+        self._name = name
+        self._errors = errors
+        self._delay = delay
+        self._loop = loop
+        self._timer = None
+
+    def schedule(self) -> None:
+        """Schedule the write, unless it is already scheduled."""
+        if self._timer is not None:
+            return
+
+        loop = self._loop
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._write()
+                return
+
+        self._timer = loop.call_later(self._delay, self._write_later)
+
+    def cancel(self) -> None:
+        """Cancel the scheduled write, e.g., because the changes are written right now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write_later(self) -> None:
+        self._timer = None
+
+        try:
+            self._write()
+        except self._errors:
+            logger.exception('Failed to write %s', self._name)
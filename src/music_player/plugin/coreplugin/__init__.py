@@ -1,7 +1,21 @@
-from music_player.core.music import ProviderPlugin
-from music_player.core.plugin_manager import plugin_manager
-from music_player.plugin.coreplugin.providers.tidal import TidalProvider
+from typing import Any
 
-plugin_manager.register(
-    ProviderPlugin(id='ing.ranft.bennet.tidal', name='TIDAL', icon='', cls=TidalProvider, needs_login=True)
-)
+from music_player.core.music import PlayerPlugin, ProviderPlugin
+from music_player.core.plugin_manager import PluginDefinition
+
+# The implementations are imported on first use, so loading the plugin doesn't import e.g. ``tidalapi``
+PLUGINS: list[PluginDefinition[Any]] = [
+    ProviderPlugin(
+        id='ing.ranft.bennet.tidal',
+        name='TIDAL',
+        icon='',
+        cls='music_player.plugin.coreplugin.providers.tidal:TidalProvider',
+        needs_login=True,
+    ),
+    PlayerPlugin(
+        id='ing.ranft.bennet.memory',
+        name='Memory Player',
+        icon='',
+        cls='music_player.plugin.coreplugin.players.memory:MemoryPlayer',
+    ),
+]
@@ -0,0 +1,494 @@
+from time import monotonic
+
+from music_player.core.music import (
+    AlreadyPlayingError,
+    NotPlayingError,
+    Playable,
+    PlaybackStatus,
+    Player,
+    PositionOutOfBoundsError,
+    QueueChange,
+    QueueChangeKind,
+    QueueOutOfBoundsError,
+    RepeatMode,
+    ShuffleEngine,
+    ShuffleMode,
+    Track,
+    VolumeOutOfBoundsError,
+)
+from music_player.core.plugin_manager import PluginContext
+from music_player.core.utils import IndexedList, IndexedListHandle
+
+type _Key = tuple[str, str, str]
+type _Handle = IndexedListHandle[Playable]
+
+
+class MemoryPlayer(Player):
+    """
+    A player that manages the queue in memory without producing audio output.
+
+    It is the reference implementation of the queue semantics defined by :class:`Player`.
+    The queue is an :class:`IndexedList` and every item is also indexed by its identity,
+    so inserting, removing and moving items is O(log n) even for very long queues.
+    The current item is tracked by its handle and keeps its place when items before it are added or removed.
+    The shuffled order is generated lazily by a :class:`ShuffleEngine`, so toggling shuffle is O(1).
+    """
+
+    _queue: IndexedList[Playable]
+    _handles: dict[_Key, list[_Handle]]
+    _current: _Handle | None
+    _shuffle_engine: ShuffleEngine
+
+    _status: PlaybackStatus
+    _shuffle: bool
+    _repeat: RepeatMode
+    _position: float
+    _started: float | None
+    _volume: float
+
+    def __init__(self, context: PluginContext) -> None:
+        """Initialize the player."""
+        super().__init__(context)
+
+        self._queue = IndexedList()
+        self._handles = {}
+        self._current = None
+        self._shuffle_engine = ShuffleEngine()
+
+        self._status = PlaybackStatus.STOPPED
+        self._shuffle = False
+        self._repeat = RepeatMode.OFF
+        self._position = 0.0
+        self._started = None
+        self._volume = 100.0
+
+    # region Playback Control
+    def play(self) -> None:
+        """
+        Start or resume the playback.
+
+        :raises QueueOutOfBoundsError: If the queue is empty.
+        :raises AlreadyPlayingError: If ``status`` is ``PLAYING``.
+        """
+        if not self._queue:
+            raise QueueOutOfBoundsError
+
+        if self._status is PlaybackStatus.PLAYING:
+            raise AlreadyPlayingError
+
+        if self._current is None:
+            self._set_current(self._shuffle_engine.next(repeat=True) if self._shuffle else self._queue.handle_at(0))
+
+        self._start()
+
+    def pause(self) -> None:
+        """
+        Pause the playback.
+
+        :raises NotPlayingError: If ``status`` is not ``PLAYING``.
+        """
+        if self._status is not PlaybackStatus.PLAYING:
+            raise NotPlayingError
+
+        self._position = self.position or 0.0
+        self._started = None
+        self._set_status(PlaybackStatus.STOPPED)
+
+    @property
+    def status(self) -> PlaybackStatus:
+        """
+        Returns the current playback status.
+
+        :return: The current playback status.
+        """
+        return self._status
+
+    # endregion
+
+    # region Current Queue Item Control
+    def next(self) -> None:
+        """
+        Jump to the next item in the queue.
+
+        This will also start playback if it was paused.
+
+        :raises QueueOutOfBoundsError: If there is no next item.
+        """
+        if not self.has_next:
+            raise QueueOutOfBoundsError
+
+        if self._shuffle:
+            handle = self._shuffle_engine.next(repeat=self._repeat is RepeatMode.ALL)
+        elif self._current is None:
+            handle = self._queue.handle_at(0)
+        else:
+            handle = self._queue.handle_at((self._queue.index(self._current) + 1) % len(self._queue))
+
+        self._set_current(handle)
+        self._start()
+
+    @property
+    def has_next(self) -> bool:
+        """
+        Check if there is a next item in the queue.
+
+        :return: Whether there is a next item.
+        """
+        if not self._queue:
+            return False
+
+        if self._shuffle:
+            return self._shuffle_engine.has_next(repeat=self._repeat is RepeatMode.ALL)
+
+        if self._current is None or self._repeat is RepeatMode.ALL:
+            return True
+
+        return self._queue.index(self._current) < len(self._queue) - 1
+
+    def previous(self) -> None:
+        """
+        Jump to the previous item in the queue.
+
+        In shuffle mode, this returns to the previously played item.
+        This will also start playback if it was paused.
+
+        :raises QueueOutOfBoundsError: If there is no previous item.
+        """
+        if not self.has_previous or self._current is None:
+            raise QueueOutOfBoundsError
+
+        if self._shuffle:
+            handle = self._shuffle_engine.previous()
+        else:
+            handle = self._queue.handle_at((self._queue.index(self._current) - 1) % len(self._queue))
+
+        self._set_current(handle)
+        self._start()
+
+    @property
+    def has_previous(self) -> bool:
+        """
+        Check if there is a previous item in the queue.
+
+        :return: Whether there is a previous item.
+        """
+        if self._current is None:
+            return False
+
+        if self._shuffle:
+            return self._shuffle_engine.has_previous
+
+        return self._repeat is RepeatMode.ALL or self._queue.index(self._current) > 0
+
+    @property
+    def index(self) -> int:
+        """Get the index of the playing item or ``-1`` if there is none."""
+        return self._queue.index(self._current) if self._current is not None else -1
+
+    @index.setter
+    def index(self, value: int) -> None:
+        """
+        Set the index of the playing item.
+
+        :raises QueueOutOfBoundsError: When the given index is not in the queue.
+        """
+        if not 0 <= value < len(self._queue):
+            raise QueueOutOfBoundsError
+
+        handle = self._queue.handle_at(value)
+        if self._shuffle:
+            self._shuffle_engine.jump(handle)
+
+        self._set_current(handle)
+
+    @property
+    def current(self) -> Track | None:
+        """
+        Get the currently playing track.
+
+        :return: The currently playing track or ``None`` if no track is playing.
+        """
+        if self._current is None or not isinstance(self._current.value, Track):
+            return None
+
+        return self._current.value
+
+    # endregion
+
+    # region Queue Management
+    @property
+    def items(self) -> list[Playable]:
+        """Get all queued items."""
+        return list(self._queue)
+
+    def __len__(self) -> int:
+        """
+        Get the number of items in the queue.
+
+        :return: The number of items in the queue.
+        """
+        return len(self._queue)
+
+    def add(self, playable: Playable | list[Playable]) -> None:
+        """
+        Add an item / list of items to the end of the queue.
+
+        :param playable: The item(s) to add.
+        """
+        self._insert(len(self._queue), playable)
+
+    def add_after_current(self, playable: Playable | list[Playable]) -> None:
+        """
+        Add an item / list of items to the queue after the current item.
+
+        :param playable: The item(s) to add.
+        """
+        self._insert(self.index + 1, playable)
+
+    def upcoming(self, count: int) -> list[Playable]:
+        """
+        Get the items that will be played after the current item, in order.
+
+        In shuffle mode, the random picks are drawn ahead of time, so this is the order ``next()`` will follow.
+
+        :param count: The maximum number of items to return.
+        :return: The upcoming items.
+        """
+        if not self._queue or count <= 0:
+            return []
+
+        if self._shuffle:
+            return [
+                handle.value for handle in self._shuffle_engine.upcoming(count, repeat=self._repeat is RepeatMode.ALL)
+            ]
+
+        start = self.index + 1
+        size = len(self._queue)
+
+        if self._repeat is RepeatMode.ALL:
+            return [self._queue[(start + i) % size] for i in range(min(count, size))]
+
+        return [self._queue[i] for i in range(start, min(start + count, size))]
+
+    def remove(self, playable: Playable) -> None:
+        """
+        Remove the first occurrence of an item from the queue.
+
+        If the item is playing, the next item (in shuffle mode, the next shuffled item) becomes the current item.
+
+        :param playable: The item to remove.
+        :raises QueueOutOfBoundsError: If the given item is not in the queue.
+        """
+        handle = self._find(playable)
+        index = self._queue.index(handle)
+        replacement = None
+
+        if handle is self._current and not self._shuffle:
+            if index + 1 < len(self._queue):
+                replacement = self._queue.handle_at(index + 1)
+            elif index > 0:
+                replacement = self._queue.handle_at(index - 1)
+
+        self._queue.remove(handle)
+        self._shuffle_engine.remove(handle)
+
+        handles = self._handles[playable.identity]
+        handles.remove(handle)
+        if not handles:
+            del self._handles[playable.identity]
+
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.REMOVE, index=index))
+
+        if handle is self._current:
+            if self._shuffle:
+                replacement = self._shuffle_engine.next(repeat=self._repeat is RepeatMode.ALL)
+
+            self._set_current(replacement)
+
+            if replacement is None:
+                self._set_status(PlaybackStatus.STOPPED)
+
+    def move(self, playable: Playable, to: int) -> None:
+        """
+        Move the first occurrence of an item to a new index.
+
+        :param playable: The item to move.
+        :param to: The new index for the item.
+        :raises QueueOutOfBoundsError: If the item or the index are not in the queue.
+        """
+        if not 0 <= to < len(self._queue):
+            raise QueueOutOfBoundsError
+
+        handle = self._find(playable)
+        index = self._queue.index(handle)
+        self._queue.move(handle, to)
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.MOVE, index=index, to=to))
+
+    def clear(self) -> None:
+        """Remove all items from the queue."""
+        self._queue.clear()
+        self._handles.clear()
+        self._shuffle_engine.clear()
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.CLEAR))
+        self._set_current(None)
+        self._set_status(PlaybackStatus.STOPPED)
+
+    @property
+    def shuffle(self) -> bool:
+        """
+        Return whether the queue is shuffled.
+
+        :return: Whether the queue is shuffled.
+        """
+        return self._shuffle
+
+    @shuffle.setter
+    def shuffle(self, value: bool) -> None:
+        """
+        Set whether the queue should be shuffled.
+
+        :param value: Whether the queue should be shuffled.
+        """
+        if value and not self._shuffle:
+            self._shuffle_engine.reset(self._current)
+
+        self._shuffle = value
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.SHUFFLE, shuffle=value))
+
+    @property
+    def shuffle_mode(self) -> ShuffleMode:
+        """Return how the items are picked in shuffle mode."""
+        return self._shuffle_engine.mode
+
+    @shuffle_mode.setter
+    def shuffle_mode(self, value: ShuffleMode) -> None:
+        """
+        Set how the items are picked in shuffle mode. Items that were already picked ahead of time are not changed.
+
+        :param value: The shuffle mode.
+        """
+        self._shuffle_engine.mode = value
+
+    @property
+    def repeat(self) -> RepeatMode:
+        """
+        Return the active repeat mode.
+
+        :return: The repeat mode.
+        """
+        return self._repeat
+
+    @repeat.setter
+    def repeat(self, value: RepeatMode) -> None:
+        """
+        Set the repeat mode.
+
+        :param value: The repeat mode.
+        """
+        self._repeat = value
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.REPEAT, repeat=value))
+
+    # endregion
+
+    # region Player Control
+    @property
+    def position(self) -> float | None:
+        """
+        Get the current playback position.
+
+        :return: The current playback position in seconds or ``None``
+                 if the currently playing item is e.g., a radio.
+        """
+        track = self.current
+        if track is None:
+            return None
+
+        position = self._position
+        if self._started is not None:
+            position += monotonic() - self._started
+
+        return min(position, track.duration) if track.duration is not None else position
+
+    @position.setter
+    def position(self, value: float) -> None:
+        """
+        Set the playback position.
+
+        :param value: The new playback position in seconds.
+        :raises NotPlayingError: If no track is playing.
+        :raises PositionOutOfBoundsError: If the position is out of bounds for the current track.
+        """
+        track = self.current
+        if track is None:
+            raise NotPlayingError
+
+        if value < 0 or (track.duration is not None and value > track.duration):
+            raise PositionOutOfBoundsError(track.duration or 0, value)
+
+        self._position = value
+        if self._started is not None:
+            self._started = monotonic()
+
+        self._position_change_event.invoke(value)
+
+    @property
+    def volume(self) -> float:
+        """
+        Get the current volume.
+
+        :return: The current volume as a percentage.
+        """
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: float) -> None:
+        """
+        Set the volume.
+
+        :param value: The new volume as a percentage.
+        :raises VolumeOutOfBoundsError: If the volume is not between 0 % and 100 %.
+        """
+        if not 0 <= value <= 100:  # noqa: PLR2004
+            raise VolumeOutOfBoundsError(value)
+
+        self._volume = value
+        self._volume_change_event.invoke(value)
+
+    # endregion
+
+    def _insert(self, index: int, playable: Playable | list[Playable]) -> None:
+        playables = playable if isinstance(playable, list) else [playable]
+
+        handles = self._queue.insert_many(index, playables)
+        for handle in handles:
+            self._handles.setdefault(handle.value.identity, []).append(handle)
+        self._shuffle_engine.add(handles)
+
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.ADD, index=index, items=playables))
+
+    def _find(self, playable: Playable) -> _Handle:
+        handles = self._handles.get(playable.identity)
+
+        if not handles:
+            raise QueueOutOfBoundsError
+
+        return handles[0] if len(handles) == 1 else min(handles, key=self._queue.index)
+
+    def _start(self) -> None:
+        if self._status is not PlaybackStatus.PLAYING:
+            self._started = monotonic()
+            self._set_status(PlaybackStatus.PLAYING)
+
+    def _set_status(self, status: PlaybackStatus) -> None:
+        if status is not self._status:
+            self._status = status
+            self._playback_status_change_event.invoke(status)
+
+    def _set_current(self, handle: _Handle | None) -> None:
+        self._current = handle
+        self._position = 0.0
+        self._started = monotonic() if self._status is PlaybackStatus.PLAYING else None
+        self._queue_change_event.invoke(QueueChange(kind=QueueChangeKind.INDEX, index=self.index))
+
+        if handle is not None and isinstance(handle.value, Track):
+            self._track_change_event.invoke(handle.value)
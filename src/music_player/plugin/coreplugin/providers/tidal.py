@@ -1,8 +1,14 @@
 import asyncio
 import concurrent.futures
-from datetime import datetime, timedelta
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from logging import getLogger
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
 import tidalapi
 from pydantic import BaseModel
@@ -12,13 +18,43 @@ from music_player.core.authentication import (
     CodeAuthenticationStrategy,
     LinkAuthenticationStrategy,
 )
-from music_player.core.music import Album, Artist, Playable, PlayableContainer, Playlist, Provider, SearchResult, Track
+from music_player.core.music import (
+    Album,
+    Artist,
+    Playable,
+    PlayableContainer,
+    Playlist,
+    Provider,
+    Radio,
+    SearchResult,
+    Track,
+    cached,
+    cached_pages,
+)
 from music_player.core.plugin_manager import PluginContext
+from music_player.core.utils import AsyncCache, as_utc, construct_trusted
 
 logger = getLogger(__name__)
 
 type TidalObject = tidalapi.Artist | tidalapi.Album | tidalapi.Playlist | tidalapi.Track
 
+_MAX_SEARCH_RESULTS = 300
+_SEARCH_SECTIONS = ('artists', 'albums', 'playlists', 'tracks')
+# Access tokens are refreshed this long before they expire, so requests never run into an expired token
+_TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# Stream URLs are dropped from the cache this many seconds before they expire, so a player has time to open them
+_STREAM_URL_EXPIRY_MARGIN = 30.0
+
+# Cover URIs have the form https://resources.tidal.com/images/<id>/<width>x<height>.jpg
+_IMAGE_URI = re.compile(r'^(?P<base>https://resources\.tidal\.com/images/.+)/(?P<size>\d+)x(?P=size)\.jpg$')
+# The square sizes TIDAL serves for every item type, in ascending order
+_COVER_SIZES: dict[type, tuple[int, ...]] = {
+    Artist: (160, 320, 480, 750),
+    Album: (80, 160, 320, 640, 1280),
+    Playlist: (160, 320, 480, 640, 750, 1080),
+    Track: (80, 160, 320, 640, 1280),
+}
+
 
 class _Credentials(BaseModel):
     token_type: str
@@ -27,21 +63,55 @@ class _Credentials(BaseModel):
     expiry_time: datetime
 
 
-class _Config(BaseModel): ...
+class _Config(BaseModel):
+    max_workers: int = 8
+    request_timeout: float = 10.0
+    cache_ttl: float = 300.0
+    cache_max_entries: int = 128
+    quality: tidalapi.media.Quality = tidalapi.media.Quality.low_320k
+    stream_url_ttl: float = 600.0
+    stream_cache_max_entries: int = 256
+    list_prefetch: int = 2
+
+
+class _StreamUri(BaseModel):
+    uri: str
+    expires: float | None
 
 
 class TidalProvider(Provider):
     """Provider for the TIDAL music streaming service using the `tidalapi <https://tidalapi.netlify.app/>`_ package."""
 
     _tidal: tidalapi.Session
+    _executor: concurrent.futures.ThreadPoolExecutor
+    _request_timeout: float
+    _stream_cache: AsyncCache[str, _StreamUri]
+    _stream_url_ttl: float
+    _list_prefetch: int
 
     def __init__(self, context: PluginContext) -> None:
         """Initialize the provider."""
-        super().__init__(context)
+        config = context.get_config(_Config) or _Config()
+        super().__init__(context, cache_ttl=config.cache_ttl, cache_max_entries=config.cache_max_entries)
+
+        self._executor = context.create_executor(config.max_workers)
+        self._request_timeout = config.request_timeout
+        self._stream_url_ttl = config.stream_url_ttl
+        self._list_prefetch = config.list_prefetch
+        self._stream_cache = AsyncCache(self._stream_uri_ttl, config.stream_cache_max_entries)
 
-        tidal_config = tidalapi.Config()
+        tidal_config = tidalapi.Config(quality=config.quality)
         self._tidal = tidalapi.Session(tidal_config)
 
+        # ``tidalapi`` never sets a timeout, so a hung request would block its worker thread forever
+        # and the pool would run out of threads. All its requests (``get``, ``post``...) go through ``request``.
+        request_session = self._tidal.request_session
+        request_session.request = partial(request_session.request, timeout=config.request_timeout)
+
+    def close(self) -> None:
+        """Clean up resources."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     @property
     def id(self) -> str:
         """A unique ID of the music provider instance."""
@@ -54,21 +124,22 @@ class TidalProvider(Provider):
         if credentials is not None:
             logger.debug('Attempting to restore session')
 
-            self._tidal.load_oauth_session(**credentials.model_dump())
+            restored = await self._run(self._tidal.load_oauth_session, **credentials.model_dump())
 
-            if self._tidal.check_login():
+            # Restoring the session already makes an authenticated request,
+            # so the login only needs to be checked if the access token has expired
+            if restored and (not _has_expired(self._tidal.expiry_time) or await self._run(self._tidal.check_login)):
                 logger.debug('Successfully logged in with stored credentials')
                 self._save_credentials()
+                self._schedule_token_refresh()
                 return AuthenticationResult(result=True)
 
         logger.debug('Starting login flow')
 
-        login_details, future = self._tidal.login_oauth()
+        login_details, future = await self._run(self._tidal.login_oauth)
         expires = datetime.now().astimezone() + timedelta(seconds=login_details.expires_in)
         login_task = self._context.loop.create_task(self._handle_second_login_step(future))
 
-        # TODO: Schedule token refreshing somewhere #0
-
         return AuthenticationResult(
             result=login_task,
             strategies=[
@@ -82,14 +153,34 @@ class TidalProvider(Provider):
     async def _handle_second_login_step(self, future: concurrent.futures.Future[None]) -> bool:
         await asyncio.wrap_future(future)
 
-        if not self._tidal.check_login():
+        if not await self._run(self._tidal.check_login):
             logger.error('Failed to log in')
             return False
 
         self._save_credentials()
+        self._schedule_token_refresh()
         logger.debug('Successfully logged in')
         return True
 
+    def _schedule_token_refresh(self) -> None:
+        if self._tidal.expiry_time is None or not self._tidal.refresh_token:
+            return
+
+        self._context.scheduler.schedule(
+            'token_refresh', self._refresh_token, as_utc(self._tidal.expiry_time) - _TOKEN_REFRESH_MARGIN
+        )
+
+    async def _refresh_token(self) -> None:
+        """Refresh the access token. Failures are raised, so the scheduler retries the refresh."""
+        logger.debug('Refreshing the access token')
+
+        if not await self._run(self._tidal.token_refresh, self._tidal.refresh_token):
+            msg = 'TIDAL did not refresh the access token'
+            raise RuntimeError(msg)
+
+        self._save_credentials()
+        self._schedule_token_refresh()
+
     def _save_credentials(self) -> None:
         self._context.set_credentials(
             _Credentials(
@@ -100,93 +191,302 @@ class TidalProvider(Provider):
             )
         )
 
+    async def _run[**P, T](self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a blocking ``tidalapi`` call on the provider's worker pool."""
+        return await self._context.loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
     async def _get_tidal_object(self, arg: PlayableContainer | Playable) -> TidalObject:
         match arg:
             case Artist():
-                return self._tidal.artist(arg.id)
+                return await self._run(self._tidal.artist, arg.id)
             case Album():
-                return self._tidal.album(arg.id)
+                return await self._run(self._tidal.album, arg.id)
             case Playlist():
-                return self._tidal.playlist(arg.id)
+                return await self._run(self._tidal.playlist, arg.id)
             case Track():
-                return self._tidal.track(arg.id)
+                return await self._run(self._tidal.track, arg.id)
             case _:
                 raise TypeError(f'Invalid argument type: {type(arg)}')
 
-    async def _to_search_result(
+    async def _fetch_sections(self, **sections: Callable[[], list[Any]]) -> tuple[dict[str, list[Any]], dict[str, str]]:
+        """
+        Run independent listing requests concurrently.
+
+        A section that fails or exceeds the request timeout is returned empty and reported in the errors.
+        The HTTP requests have the same timeout, so a section that timed out also frees its worker thread.
+        """
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._run(fetch), self._request_timeout) for fetch in sections.values()),
+            return_exceptions=True,
+        )
+
+        items: dict[str, list[Any]] = {}
+        errors: dict[str, str] = {}
+
+        for name, result in zip(sections, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning('Failed to load %s: %r', name, result)
+                items[name] = []
+                errors[name] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                items[name] = result
+
+        return items, errors
+
+    async def _to_search_result(self, **kwargs: Any) -> SearchResult:  # noqa: ANN401
+        # Building the models touches lazy ``tidalapi`` attributes (e.g. artist pictures), which may hit the network.
+        return await self._run(self._build_search_result, **kwargs)
+
+    def _build_search_result(
         self,
         artists: list[tidalapi.Artist] | None = None,
         albums: list[tidalapi.Album] | None = None,
         playlists: list[tidalapi.Playlist] | None = None,
         tracks: list[tidalapi.Track] | None = None,
+        errors: dict[str, str] | None = None,
         **_: Any,  # noqa: ANN401
     ) -> SearchResult:
-        return SearchResult(
-            artists=[
-                Artist(provider_id=self.id, id=str(x.id), name=x.name, cover_uri=x.image(750)) for x in artists or []
-            ],
-            albums=[
-                Album(
-                    provider_id=self.id,
-                    id=str(x.id),
-                    name=x.name,
-                    artist=x.artist.name,
-                    artist_id=str(x.artist.id),
-                    cover_uri=x.image(1280),
-                    year=x.year,
-                    duration=x.duration,
-                    number_of_tracks=x.num_tracks,
-                )
-                for x in albums or []
-            ],
-            playlists=[
-                Playlist(
-                    provider_id=self.id,
-                    id=str(x.id),
-                    name=x.name,
-                    cover_uri=x.image(1080),
-                    duration=x.duration,
-                    number_of_tracks=x.num_tracks,
-                )
-                for x in playlists or []
-            ],
-            tracks=[
-                Track(
-                    provider_id=self.id,
-                    id=str(x.id),
-                    title=x.name,
-                    artist=x.artist.name,
-                    artist_id=str(x.artist.id),
-                    album=x.album.name,
-                    album_id=str(x.album.id),
-                    cover_uri=x.album.image(1280),
-                    duration=x.duration,
-                )
-                for x in tracks or []
-            ],
+        # The values come from TIDAL's typed models, so validating them again is skipped.
+        # This matters for long playlists, where validation dominated the time to build the result.
+        return construct_trusted(
+            SearchResult,
+            {
+                'artists': [
+                    construct_trusted(
+                        Artist, {'provider_id': self.id, 'id': str(x.id), 'name': x.name, 'cover_uri': x.image(750)}
+                    )
+                    for x in artists or []
+                ],
+                'albums': [
+                    construct_trusted(
+                        Album,
+                        {
+                            'provider_id': self.id,
+                            'id': str(x.id),
+                            'name': x.name,
+                            'artist': x.artist.name,
+                            'artist_id': str(x.artist.id),
+                            'cover_uri': x.image(1280),
+                            'year': x.year,
+                            'number_of_tracks': x.num_tracks,
+                            'duration': x.duration,
+                        },
+                    )
+                    for x in albums or []
+                ],
+                'playlists': [
+                    construct_trusted(
+                        Playlist,
+                        {
+                            'provider_id': self.id,
+                            'id': str(x.id),
+                            'name': x.name,
+                            'cover_uri': x.image(1080),
+                            'number_of_tracks': x.num_tracks,
+                            'duration': x.duration,
+                        },
+                    )
+                    for x in playlists or []
+                ],
+                'tracks': [
+                    construct_trusted(
+                        Track,
+                        {
+                            'provider_id': self.id,
+                            'id': str(x.id),
+                            'title': x.name,
+                            'artist': x.artist.name,
+                            'artist_id': str(x.artist.id),
+                            'album': x.album.name,
+                            'album_id': str(x.album.id),
+                            'cover_uri': x.album.image(1280),
+                            'duration': x.duration,
+                        },
+                    )
+                    for x in tracks or []
+                ],
+                'podcasts': [],
+                'radios': [],
+                'errors': errors or {},
+            },
         )
 
+    @cached
     async def search(self, query: str) -> SearchResult:
         """Search the provider's library."""
-        results = self._tidal.search(query)
+        results = await self._run(self._tidal.search, query)
         return await self._to_search_result(**results)
 
+    @cached_pages
+    async def search_pages(self, query: str, page_size: int = 50) -> AsyncIterator[SearchResult]:
+        """
+        Search the provider's library page by page.
+
+        The next page is requested while the current one is consumed, the pages of a complete search are cached.
+        TIDAL returns at most 300 items per section.
+        """
+        pending = asyncio.ensure_future(self._run(self._tidal.search, query, limit=page_size, offset=0))
+
+        try:
+            for offset in range(page_size, _MAX_SEARCH_RESULTS + page_size, page_size):
+                results = await pending
+                is_last = offset >= _MAX_SEARCH_RESULTS or all(
+                    len(results[section]) < page_size for section in _SEARCH_SECTIONS
+                )
+
+                if not is_last:
+                    pending = asyncio.ensure_future(
+                        self._run(self._tidal.search, query, limit=page_size, offset=offset)
+                    )
+
+                yield await self._to_search_result(**results)
+
+                if is_last:
+                    return
+        finally:
+            pending.cancel()
+
+    @cached_pages
+    async def list_iter(self, arg: PlayableContainer, batch_size: int = 100) -> AsyncIterator[list[Track]]:
+        """
+        List the tracks of a container batch by batch.
+
+        Albums and playlists are paginated, up to ``list_prefetch`` batches are requested ahead of the consumer,
+        so the first tracks are available after one request, no matter how long the playlist is.
+        The batches of a complete listing are cached like the result of :meth:`list`.
+        Artists are listed as a whole, as their sections are not paginated together.
+        """
+        if not isinstance(arg, Album | Playlist):
+            async for batch in super().list_iter(arg, batch_size):
+                yield batch
+            return
+
+        obj = await self._get_tidal_object(arg)
+        if not isinstance(obj, tidalapi.album.Album | tidalapi.playlist.Playlist):
+            msg = f'Invalid argument type: {type(arg)}'
+            raise TypeError(msg)
+
+        async for tracks in self._paginate(obj.tracks, obj.num_tracks or 0, batch_size):
+            yield (await self._to_search_result(tracks=tracks)).tracks
+
+    async def _paginate[T](self, fetch: Callable[..., list[T]], total: int, batch_size: int) -> AsyncIterator[list[T]]:
+        """Fetch the pages of a ``limit``/``offset`` paginated ``tidalapi`` method, requesting some ahead."""
+        next_offset = 0
+        pending: deque[asyncio.Future[list[T]]] = deque()
+
+        def request_more() -> None:
+            nonlocal next_offset
+
+            # Past the announced number of items, only request a page if the previous one was full
+            while len(pending) <= self._list_prefetch and (next_offset < total or not pending):
+                pending.append(asyncio.ensure_future(self._run(fetch, limit=batch_size, offset=next_offset)))
+                next_offset += batch_size
+
+        try:
+            request_more()
+
+            while pending:
+                items = await pending.popleft()
+
+                if len(items) < batch_size:
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                else:
+                    request_more()
+
+                if items:
+                    yield items
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @cached
     async def list(self, arg: PlayableContainer) -> SearchResult:
         """List the content in the provider's library."""
         obj = await self._get_tidal_object(arg)
 
         match obj:
             case tidalapi.Artist():
+                sections, errors = await self._fetch_sections(
+                    albums=obj.get_albums,
+                    ep_singles=obj.get_ep_singles,
+                    other=obj.get_other,
+                    top_tracks=obj.get_top_tracks,
+                )
                 return await self._to_search_result(
-                    albums=[*obj.get_albums(), *obj.get_ep_singles(), *obj.get_other()], tracks=obj.get_top_tracks()
+                    albums=[*sections['albums'], *sections['ep_singles'], *sections['other']],
+                    tracks=sections['top_tracks'],
+                    errors=errors,
                 )
             case tidalapi.Album():
-                return await self._to_search_result(tracks=obj.tracks())
+                return await self._to_search_result(tracks=await self._run(obj.tracks))
             case tidalapi.Playlist():
-                return await self._to_search_result(tracks=obj.tracks())
+                return await self._to_search_result(tracks=await self._run(obj.tracks))
             case _:
                 raise TypeError(f'Invalid argument type: {type(arg)}')
 
     async def resolve_uri(self, playable: Playable) -> str:
-        """Resolve a playable object to a URI."""
-        raise NotImplementedError
+        """
+        Resolve a playable object to a URI.
+
+        Stream URLs are cached until shortly before TIDAL's signature on them expires.
+        DASH streams are returned as a ``data:`` URI containing the manifest.
+        """
+        if not isinstance(playable, Track):
+            msg = f'Invalid argument type: {type(playable)}'
+            raise TypeError(msg)
+
+        stream_uri = await self._stream_cache.get_or_load(
+            playable.id, partial(self._run, self._get_stream_uri, playable.id)
+        )
+        return stream_uri.uri
+
+    def _get_stream_uri(self, track_id: str) -> _StreamUri:
+        # Only the ID is needed to request the stream, so the track's metadata is not fetched
+        track = tidalapi.media.Track(self._tidal)
+        track.id = int(track_id)
+
+        stream = track.get_stream()
+        manifest = stream.get_stream_manifest()
+        urls = manifest.get_urls()
+
+        uri = f'data:{stream.manifest_mime_type};base64,{stream.manifest}' if stream.is_mpd else urls[0]
+
+        expiries = [expiry for expiry in map(_url_expiry, urls) if expiry is not None]
+        return _StreamUri(uri=uri, expires=min(expiries, default=None))
+
+    def cover_uri_for(self, item: Artist | Album | Playlist | Track | Radio, size: int) -> str | None:
+        """
+        Get the URI of the smallest variant of an item's cover that is at least ``size`` pixels wide and high.
+
+        TIDAL serves every cover in a fixed set of sizes per item type, which only differ in the URI.
+        """
+        sizes = _COVER_SIZES.get(type(item))
+        if sizes is None or item.cover_uri is None or (match := _IMAGE_URI.match(item.cover_uri)) is None:
+            return item.cover_uri
+
+        variant = next((x for x in sizes if x >= size), sizes[-1])
+        return f'{match["base"]}/{variant}x{variant}.jpg'
+
+    def _stream_uri_ttl(self, stream_uri: _StreamUri) -> float:
+        if stream_uri.expires is None:
+            return self._stream_url_ttl
+
+        return stream_uri.expires - time.time() - _STREAM_URL_EXPIRY_MARGIN
+
+
+def _has_expired(expiry_time: datetime | None) -> bool:
+    return expiry_time is None or as_utc(expiry_time) <= datetime.now(UTC)
+
+
+def _url_expiry(url: str) -> float | None:
+    """Get the UNIX time at which a signed URL expires from its ``Expires`` parameter."""
+    values = parse_qs(urlsplit(url).query).get('Expires')
+
+    try:
+        return float(values[0]) if values else None
+    except ValueError:
+        return None
@@ -0,0 +1,15 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from music_player.core.plugin_manager import plugin_manager
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the config and caches of the tests out of the user's config directory."""
+    monkeypatch.setattr('music_player.core.plugin_manager.plugin_context.CONFIG_DIR', tmp_path)
+    # The module is shadowed by the plugin manager instance of the same name in its package
+    monkeypatch.setattr(sys.modules[type(plugin_manager).__module__], 'CONFIG_DIR', tmp_path)
+    return tmp_path
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+from music_player.core.utils import CoverCache
+
+IMAGE = b'\xff\xd8' + bytes(1000)
+# The server answers after this delay, long enough for concurrent fetches to overlap
+LATENCY = 0.1
+TIMEOUT = 0.2
+# A stalled server doesn't answer before the client gives up
+STALL = 2.0
+
+
+class _Server(ThreadingHTTPServer):
+    requests: int
+    delay: float
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(IMAGE)))
+        self.end_headers()
+        self.wfile.write(IMAGE)
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    """Serve an image on a local port."""
+    server = _Server(('127.0.0.1', 0), _Handler)
+    server.requests = 0
+    server.delay = LATENCY
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _uri(server: _Server) -> str:
+    return f'http://127.0.0.1:{server.server_address[1]}/cover.jpg'
+
+
+def test_concurrent_fetches_share_one_download(server: _Server, tmp_path: Path) -> None:
+    """Fetching the same image concurrently downloads it once and counts its size once."""
+    covers = CoverCache(tmp_path, timeout=TIMEOUT * 10)
+
+    async def scenario() -> list[Path | None]:
+        return await asyncio.gather(*(covers.fetch(_uri(server)) for _ in range(5)))
+
+    paths = asyncio.run(scenario())
+
+    assert_that(server.requests).is_equal_to(1)
+    assert_that(set(paths)).is_length(1)
+    assert_that(covers.size).is_equal_to(len(IMAGE))
+
+
+def test_stalled_download_is_a_miss(server: _Server, tmp_path: Path) -> None:
+    """A download that stalls gives up after the timeout instead of blocking the caller."""
+    server.delay = STALL
+    covers = CoverCache(tmp_path, timeout=TIMEOUT)
+
+    start = time.perf_counter()
+    path = asyncio.run(covers.fetch(_uri(server)))
+
+    assert_that(path).is_none()
+    assert_that(time.perf_counter() - start).is_less_than(STALL)
+    assert_that(covers.size).is_zero()
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from assertpy import assert_that
+
+from music_player.core.authentication import AuthenticationResult, CodeAuthenticationStrategy
+from music_player.core.music import (
+    LoginOrchestrator,
+    LoginStatus,
+    Playable,
+    PlayableContainer,
+    Provider,
+    ProviderPlugin,
+    SearchResult,
+)
+
+# The login asks for the user after this delay, so the wait starts while it is still pending
+DELAY = 0.05
+TIMEOUT = 1.0
+
+
+class _DeviceCodeProvider(Provider):
+    """A provider whose login waits for the user to enter a code, which they never do."""
+
+    @property
+    def id(self) -> str:
+        return 'device-code'
+
+    async def login(self) -> AuthenticationResult:
+        await asyncio.sleep(DELAY)
+        return AuthenticationResult(
+            result=asyncio.create_task(asyncio.Event().wait()),
+            strategies=[CodeAuthenticationStrategy(expires=datetime.now(UTC), code='ABCD', link='https://example.com')],
+        )
+
+    async def search(self, query: str) -> SearchResult:
+        raise NotImplementedError
+
+    async def list(self, arg: PlayableContainer) -> SearchResult:
+        raise NotImplementedError
+
+    async def resolve_uri(self, playable: Playable) -> str:
+        raise NotImplementedError
+
+
+def test_wait_ends_when_the_login_needs_the_user() -> None:
+    """Commands don't wait for a login that turns out to need the user."""
+
+    async def scenario() -> None:
+        plugin = ProviderPlugin(
+            id='device-code', name='Device Code', icon='', cls=_DeviceCodeProvider, needs_login=True
+        )
+        orchestrator = LoginOrchestrator([plugin])
+        orchestrator.start()
+
+        logged_in = await asyncio.wait_for(orchestrator.wait(plugin.id, for_user=False), TIMEOUT)
+        login = orchestrator.get(plugin.id)
+
+        assert_that(logged_in).is_false()
+        assert_that(login).is_not_none()
+        assert_that(login.status if login else None).is_equal_to(LoginStatus.WAITING_FOR_USER)
+
+        # The login goes on in the background, so the user can still finish it
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(orchestrator.wait(plugin.id), DELAY)
+        orchestrator.cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,33 @@
+import importlib
+import json
+from pathlib import Path
+
+from assertpy import assert_that
+
+from music_player.core.plugin_manager import PluginDefinition, plugin_manager
+
+PluginManager = type(plugin_manager)
+CORE_PLUGINS = ['ing.ranft.bennet.tidal', 'ing.ranft.bennet.memory']
+
+
+def _load() -> list[str]:
+    manager = PluginManager()
+    manager.load_plugins()
+    return [plugin.id for plugin in manager.get_all(PluginDefinition)]
+
+
+def test_loads_the_plugins_of_a_package_that_was_imported_before(config_dir: Path) -> None:
+    """Importing a plugin package before loading it registers nothing, so its plugins are read from the package."""
+    importlib.import_module('music_player.plugin.coreplugin')
+
+    assert_that(_load()).is_equal_to(CORE_PLUGINS)
+
+    manifest = json.loads((config_dir / 'cache' / 'plugin_manifest.json').read_text(encoding='utf-8'))
+    assert_that(manifest['packages']['music_player.plugin.coreplugin']['plugins']).is_length(len(CORE_PLUGINS))
+
+
+def test_loads_the_same_plugins_from_the_manifest() -> None:
+    """The second start registers the cached definitions."""
+    imported = _load()
+
+    assert_that(_load()).is_equal_to(imported).is_equal_to(CORE_PLUGINS)
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from assertpy import assert_that
+
+from music_player.core.music import Playable, SessionStore, Track
+from music_player.core.plugin_manager import PluginContext
+from music_player.plugin.coreplugin.players.memory import MemoryPlayer
+
+
+def _track(track_id: int) -> Track:
+    return Track(
+        provider_id='test',
+        id=str(track_id),
+        title=f'Track {track_id}',
+        artist='Artist',
+        artist_id='0',
+        album=None,
+        album_id=None,
+        cover_uri=None,
+        duration=180,
+    )
+
+
+def _tracks(*track_ids: int) -> list[Playable]:
+    return [_track(track_id) for track_id in track_ids]
+
+
+def _session(directory: Path, change: Callable[[MemoryPlayer], None], *, compact_after: int = 1000) -> list[str]:
+    """
+    Restore the queue, change it and exit without closing the store, like a crash right after writing the journal.
+
+    :return: The IDs of the restored items.
+    """
+
+    async def scenario() -> list[str]:
+        player = MemoryPlayer(PluginContext('test.memory'))
+        store = SessionStore(directory, compact_after=compact_after)
+        store.attach(player)
+        restored = [playable.id for playable in player.items]
+
+        change(player)
+        store.flush()
+        # Exit without compacting, only release the open journal
+        journal = store._journal  # noqa: SLF001
+        if journal is not None:
+            journal.close()
+        player.close()
+        return restored
+
+    return asyncio.run(scenario())
+
+
+def _restore(directory: Path) -> list[str]:
+    return _session(directory, lambda _: None)
+
+
+def _journal(directory: Path) -> list[str]:
+    return (directory / 'journal.jsonl').read_text(encoding='utf-8').splitlines()
+
+
+def test_restores_the_queue_from_the_journal(tmp_path: Path) -> None:
+    """Changes are restored by replaying the journal."""
+
+    def change(player: MemoryPlayer) -> None:
+        player.add(_tracks(1, 2, 3))
+        player.remove(player.items[0])
+
+    _session(tmp_path, change)
+
+    assert_that(_restore(tmp_path)).is_equal_to(['2', '3'])
+
+
+def test_recovers_from_a_partially_written_entry(tmp_path: Path) -> None:
+    """New entries are not appended to a torn last line, so they survive the next restart."""
+    _session(tmp_path, lambda player: player.add(_tracks(1)))
+
+    with (tmp_path / 'journal.jsonl').open('a', encoding='utf-8') as journal:
+        journal.write('{"kind": "add", "ind')
+
+    restored = _session(tmp_path, lambda player: player.add(_tracks(2)))
+
+    assert_that(restored).is_equal_to(['1'])
+    assert_that(_restore(tmp_path)).is_equal_to(['1', '2'])
+    assert_that(_journal(tmp_path)).does_not_contain('{"kind": "add", "ind')
+
+
+def test_recovers_from_an_entry_that_cannot_be_replayed(tmp_path: Path) -> None:
+    """A journal that fails to replay is replaced, new entries are restored after the next restart."""
+    _session(tmp_path, lambda player: player.add(_tracks(1)))
+
+    with (tmp_path / 'journal.jsonl').open('a', encoding='utf-8') as journal:
+        journal.write('not json\n')
+
+    restored = _session(tmp_path, lambda player: player.add(_tracks(2)))
+
+    assert_that(restored).is_equal_to(['1'])
+    assert_that(_restore(tmp_path)).is_equal_to(['1', '2'])
+
+
+def test_ignores_a_journal_of_another_generation(tmp_path: Path) -> None:
+    """A journal left over from an interrupted compaction is ignored, as its changes are in the snapshot."""
+    _session(tmp_path, lambda player: player.add(_tracks(1, 2)), compact_after=1)
+    snapshot = json.loads((tmp_path / 'snapshot.json').read_text(encoding='utf-8'))
+
+    stale = {'kind': 'add', 'index': 0, 'items': [{'type': 'Track', 'data': _track(3).model_dump(mode='json')}]}
+    (tmp_path / 'journal.jsonl').write_text(
+        json.dumps({'generation': snapshot['generation'] - 1}) + '\n' + json.dumps(stale) + '\n', encoding='utf-8'
+    )
+
+    restored = _session(tmp_path, lambda player: player.add(_tracks(4)))
+
+    assert_that(restored).is_equal_to(['1', '2'])
+    assert_that(_restore(tmp_path)).is_equal_to(['1', '2', '4'])
+
+
+def test_compacts_the_journal_into_a_snapshot(tmp_path: Path) -> None:
+    """After ``compact_after`` entries, the queue is written to a snapshot and the journal starts over."""
+
+    def change(player: MemoryPlayer) -> None:
+        for track_id in range(5):
+            player.add(_tracks(track_id))
+
+    _session(tmp_path, change, compact_after=3)
+    snapshot = json.loads((tmp_path / 'snapshot.json').read_text(encoding='utf-8'))
+
+    assert_that(snapshot['items']).is_length(5)
+    assert_that(_journal(tmp_path)).is_equal_to([json.dumps({'generation': snapshot['generation']})])
+    assert_that(_restore(tmp_path)).is_equal_to(['0', '1', '2', '3', '4'])
@@ -0,0 +1,38 @@
+import os
+import statistics
+from pathlib import Path
+
+from assertpy import assert_that
+
+from benchmarks.bench_startup import import_times, time_to_prompt
+
+# Modules that must only be imported when they are first used
+LAZY_MODULES = ('rich', 'textual_image', 'tidalapi', 'requests', 'urllib.request')
+TIME_TO_PROMPT_BUDGET = 0.6
+MAIN_IMPORT_BUDGET = 0.35
+ROUNDS = 3
+
+
+def test_main_imports_rendering_and_provider_libraries_lazily() -> None:
+    """Importing the entry point must not import the libraries that are only needed later."""
+    imports = import_times()
+
+    eager = [module for module in imports if module.split('.')[0] in LAZY_MODULES or module in LAZY_MODULES]
+
+    assert_that(eager).is_empty()
+
+
+def test_main_import_time_is_within_budget() -> None:
+    """Importing the entry point stays fast, the median of a few rounds is compared to smooth out noise."""
+    import_times()  # Warm up the file system cache
+
+    median = statistics.median(import_times()['music_player.core.main'] for _ in range(ROUNDS))
+    assert_that(median).is_less_than(MAIN_IMPORT_BUDGET)
+
+
+def test_time_to_prompt_is_within_budget(config_dir: Path) -> None:
+    """The first prompt appears quickly once the plugin manifest is cached."""
+    env = {**os.environ, 'XDG_CONFIG_HOME': str(config_dir)}
+    time_to_prompt(env)  # Cache the plugin manifest and warm up the file system cache
+
+    assert_that(statistics.median(time_to_prompt(env) for _ in range(ROUNDS))).is_less_than(TIME_TO_PROMPT_BUDGET)
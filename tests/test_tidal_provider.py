@@ -0,0 +1,176 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from typing import Any
+
+from assertpy import assert_that
+
+from benchmarks.fake_tidal import FakeSession
+from music_player.core.music import Album, FederatedSearch, SearchResult
+from music_player.core.plugin_manager import PluginContext
+from music_player.core.utils import Scheduler
+from music_player.plugin.coreplugin.providers.tidal import TidalProvider
+
+# Every request of the fake session takes this long, far longer than the loop may lag
+LATENCY = 0.2
+MAX_LOOP_LAG = 0.05
+CONCURRENT_CALLS = 4
+MONITOR_INTERVAL = 0.01
+RETRY_DELAY = 0.01
+TOKEN = 'token'  # noqa: S105
+
+
+class _ExpiringSession(FakeSession):
+    """A session whose access token has expired and whose first refreshes are refused."""
+
+    refusals: int
+    refreshes: int
+
+    def __init__(self, refusals: int) -> None:
+        super().__init__()
+        self.refusals = refusals
+        self.refreshes = 0
+        self.token_type = self.access_token = self.refresh_token = TOKEN
+        self.expiry_time = datetime.now(UTC)
+
+    def token_refresh(self, _: str) -> bool:
+        """Pretend to refresh the access token."""
+        self.refreshes += 1
+        if self.refreshes <= self.refusals:
+            return False
+
+        self.expiry_time = datetime.now(UTC) + timedelta(hours=1)
+        return True
+
+
+def _provider(session: FakeSession) -> TidalProvider:
+    provider = TidalProvider(PluginContext('test.tidal'))
+    provider._tidal = session  # noqa: SLF001
+
+    # Create the fake objects before measuring
+    _ = session.tracks, session.playlists
+    return provider
+
+
+def _album(album_id: int) -> Album:
+    return Album(
+        provider_id='tidal',
+        id=str(album_id),
+        name=f'Album {album_id}',
+        artist='Artist 0',
+        artist_id='0',
+        cover_uri=None,
+        year=2000,
+        duration=0,
+        number_of_tracks=10,
+    )
+
+
+async def _max_loop_lag(work: asyncio.Future[Any]) -> float:
+    """Measure how late the event loop wakes up a sleeping task while the work runs."""
+    loop = asyncio.get_running_loop()
+    lag = 0.0
+
+    while not work.done():
+        start = loop.time()
+        await asyncio.sleep(MONITOR_INTERVAL)
+        lag = max(lag, loop.time() - start - MONITOR_INTERVAL)
+
+    return lag
+
+
+def test_blocking_calls_do_not_block_the_event_loop() -> None:
+    """Concurrent searches and listings against a slow session run on the worker pool, not on the event loop."""
+
+    async def scenario() -> tuple[float, float]:
+        provider = _provider(FakeSession(latency=LATENCY, size=10))
+
+        start = perf_counter()
+        work = asyncio.gather(
+            *(provider.search(f'query {i}') for i in range(CONCURRENT_CALLS)),
+            *(provider.list(_album(i)) for i in range(CONCURRENT_CALLS)),
+        )
+        lag = await _max_loop_lag(work)
+        await work
+        elapsed = perf_counter() - start
+
+        provider.close()
+        return lag, elapsed
+
+    lag, elapsed = asyncio.run(scenario())
+
+    assert_that(lag).is_less_than(MAX_LOOP_LAG)
+    # A search is one request and a listing two, so running them one after another would take 12 round trips
+    assert_that(elapsed).is_less_than(4 * LATENCY)
+
+
+def test_repeated_search_is_served_from_the_cache() -> None:
+    """Searching again like the REPL does replays the cached pages without requests to TIDAL."""
+
+    async def search(provider: TidalProvider) -> SearchResult:
+        result = SearchResult()
+        async for page in FederatedSearch([provider]).stream('query'):
+            result.extend(page)
+        return result
+
+    async def scenario() -> None:
+        session = FakeSession(size=120)
+        provider = _provider(session)
+
+        first = await search(provider)
+        requests = session.requests
+        second = await search(provider)
+
+        assert_that(requests).is_greater_than(1)
+        assert_that(session.requests).is_equal_to(requests)
+        assert_that(second).is_equal_to(first)
+        assert_that(provider.cache_stats.hits).is_equal_to(1)
+        provider.close()
+
+    asyncio.run(scenario())
+
+
+def test_repeated_listing_is_served_from_the_cache() -> None:
+    """Listing an album again replays the cached batches without requests to TIDAL."""
+
+    async def tracks(provider: TidalProvider) -> list[str]:
+        return [track.id async for batch in provider.list_iter(_album(0), batch_size=10) for track in batch]
+
+    async def scenario() -> None:
+        session = FakeSession(size=35)
+        provider = _provider(session)
+
+        first = await tracks(provider)
+        requests = session.requests
+        second = await tracks(provider)
+
+        assert_that(first).is_length(35)
+        assert_that(second).is_equal_to(first)
+        assert_that(session.requests).is_equal_to(requests)
+        provider.close()
+
+    asyncio.run(scenario())
+
+
+def test_refused_token_refresh_is_retried() -> None:
+    """A refresh that TIDAL refuses fails the scheduled job, so the scheduler tries again."""
+
+    async def scenario() -> None:
+        session = _ExpiringSession(refusals=2)
+        provider = _provider(session)
+        context = provider._context  # noqa: SLF001
+        context.scheduler = Scheduler(asyncio.get_running_loop(), retry_delay=RETRY_DELAY)
+
+        provider._schedule_token_refresh()  # noqa: SLF001
+        while session.refreshes <= session.refusals:  # noqa: ASYNC110
+            await asyncio.sleep(RETRY_DELAY)
+        # Let the successful job finish
+        await asyncio.sleep(RETRY_DELAY)
+
+        assert_that(session.refreshes).is_equal_to(3)
+        # The finished job scheduled the refresh of the new token
+        assert_that(context.scheduler.jobs).is_equal_to(['token_refresh'])
+        context.scheduler.close()
+        provider.close()
+
+    asyncio.run(asyncio.wait_for(scenario(), 5))